@@ -1,12 +1,17 @@
 import base64
+import hashlib
 import json
 import random
 import re
 import threading
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, timedelta
-from typing import Any, List, Dict, Tuple, Optional, Union, Set
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, List, Dict, Tuple, Optional, Union, Set
 from urllib.parse import urlparse, parse_qs, unquote, parse_qsl, urlencode, urlunparse
 
 import pytz
@@ -14,7 +19,6 @@ from app.helper.sites import SitesHelper
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
-from app import schemas
 from app.chain.torrents import TorrentsChain
 from app.core.config import settings
 from app.core.context import MediaInfo
@@ -26,6 +30,28 @@ from app.log import logger
 from app.modules.qbittorrent import Qbittorrent
 from app.modules.transmission import Transmission
 from app.plugins import _PluginBase
+from app.plugins.zytbrushflow.adapters import DownloaderAdapter, get_adapter
+from app.plugins.zytbrushflow.admission import Admission, fetch_concurrently, group_by_downloader
+from app.plugins.zytbrushflow.balancer import pick_downloader
+from app.plugins.zytbrushflow.bencode import get_torrent_id
+from app.plugins.zytbrushflow.cascade import CascadeIndex
+from app.plugins.zytbrushflow.deadlines import DeadlineQueue, next_deadline
+from app.plugins.zytbrushflow.filters import BrushFilter
+from app.plugins.zytbrushflow.limiter import LocalSiteVisitLimiter, RemoteSiteVisitLimiter, SiteVisitLimiter
+from app.plugins.zytbrushflow.matcher import KeywordMatcher
+from app.plugins.zytbrushflow.planner import CapacityPlan, rank_torrents
+from app.plugins.zytbrushflow.rejections import RejectionCache
+from app.plugins.zytbrushflow.replay import BENCHMARK_CONFIG, CONFIG_DEFAULTS, ReplayRecorder, ReplaySimulator, \
+    load_records, run_benchmark
+from app.plugins.zytbrushflow.rules import evaluate_brush_conditions, evaluate_delete_conditions, \
+    evaluate_duplicate_conditions, evaluate_proxy_pre_delete_conditions, get_pubminutes, is_stable_rejection, \
+    INCLUDE_EXCLUDE_REASONS, VOLATILE_REASONS
+from app.plugins.zytbrushflow.sampler import BandwidthSampler
+from app.plugins.zytbrushflow.siteyield import SiteYieldStats, site_quotas, weighted_order
+from app.plugins.zytbrushflow.snapshot import DownloaderSnapshot
+from app.plugins.zytbrushflow.store import TASK_BUCKETS, TaskStore
+from app.plugins.zytbrushflow.tasks import TaskIndex
+from app.plugins.zytbrushflow.timing import PhaseTimer, parse_budgets
 from app.schemas import NotificationType, TorrentInfo, MediaType, ServiceInfo
 from app.schemas.types import EventType
 from app.utils.http import RequestUtils
@@ -44,7 +70,10 @@ class BrushConfig:
         self.notify = config.get("notify", True)
         self.onlyonce = config.get("onlyonce", False)
         self.brushsites = config.get("brushsites", [])
-        self.downloader = config.get("downloader")
+        # 下载器，支持多选，旧版本配置为单个下载器名称，第一个为主下载器
+        downloaders = config.get("downloader")
+        self.downloaders = [name for name in (downloaders if isinstance(downloaders, list) else [downloaders]) if name]
+        self.downloader = self.downloaders[0] if self.downloaders else None
         self.disksize = self.__parse_number(config.get("disksize"))
         self.freeleech = config.get("freeleech", "free")
         self.hr = config.get("hr", "no")
@@ -73,7 +102,9 @@ class BrushConfig:
         self.delete_except_tags = config.get("delete_except_tags")
         self.except_subscribe = config.get("except_subscribe", True)
         self.brush_sequential = config.get("brush_sequential", False)
+        self.brush_yield_weighted = config.get("brush_yield_weighted", False)
         self.proxy_delete = config.get("proxy_delete", False)
+        self.del_no_free = config.get("del_no_free", False)
         self.active_time_range = config.get("active_time_range")
         self.active_time_range_site_config = config.get("active_time_range_site_config")
         self.cron = config.get("cron")  # 刷流周期,可能是int值或者cron
@@ -82,8 +113,19 @@ class BrushConfig:
         self.site_hr_active = config.get("site_hr_active", False)
         self.site_skip_tips = config.get("site_skip_tips", False)
         self.site_visit_limit = config.get("site_visit_limit", None)
+        self.site_concurrency = self.__parse_number(config.get("site_concurrency"))
+        self.phase_time_budget = config.get("phase_time_budget")
 
         self.brush_tag = "刷流"
+        # 预编译过滤程序，站点独立配置中的错误交由 __initialize_site_config 统一处理
+        try:
+            self.filter = BrushFilter.from_config(self)
+        except Exception as e:
+            if not process_site_config:
+                raise
+            logger.error(f"解析刷流过滤条件失败，已停用插件，请检查配置项，错误详情: {e}")
+            self.filter = BrushFilter()
+            self.enabled = False
         # 站点独立配置
         self.enable_site_config = config.get("enable_site_config", False)
         self.site_config = config.get("site_config", "[]")
@@ -122,10 +164,13 @@ class BrushConfig:
             "seed_inactivetime",
             "save_path",
             "proxy_delete",
+            "del_no_free",
             "qb_category",
             "site_hr_active",
             "site_skip_tips",
-            "site_visit_limit"  # 站点请求频控请求地址 http://localhost:xxx/check_site_visit_limit?site_name=example.com&last_time=2025-08-10T23:22:28&check_time=600
+            # 站点请求频控，数字为本地频控间隔秒数，如 600；
+            # 地址为外部频控接口 http://localhost:xxx/check_site_visit_limit?site_name=example.com&last_time=2025-08-10T23:22:28&check_time=600
+            "site_visit_limit"
             # 当新增支持字段时，仅在此处添加字段名
         }
         try:
@@ -144,7 +189,7 @@ class BrushConfig:
                 site_specific_config = {key: config[key] for key in allowed_fields & set(config.keys())}
 
                 full_config = {key: getattr(self, key) for key in vars(self) if
-                               key not in ["group_site_configs", "site_config"]}
+                               key not in ["group_site_configs", "site_config", "filter"]}
                 full_config.update(site_specific_config)
 
                 self.group_site_configs[sitename] = BrushConfig(config=full_config, process_site_config=False)
@@ -191,6 +236,7 @@ class BrushConfig:
     "seed_inactivetime": "",
     "save_path": "/downloads/site1",
     "proxy_delete": false,
+    "del_no_free": false,
     "qb_category": "刷流",
     "site_hr_active": true,
     "site_skip_tips": true,
@@ -268,7 +314,7 @@ class ZYTBrushFlow(_PluginBase):
     # 插件图标
     plugin_icon = "Iyuu_A.png"
     # 插件版本
-    plugin_version = "4.3.4.1"
+    plugin_version = "4.3.4.26"
     # 插件作者
     plugin_author = "zyt"
     # 作者主页
@@ -286,25 +332,88 @@ class ZYTBrushFlow(_PluginBase):
     _task_brush_enable = False
     # 订阅缓存信息
     _subscribe_infos = None
+    # 订阅标题匹配器，订阅标题变化时重新构建
+    _subscribe_matcher: Optional[KeywordMatcher] = None
     # Brush定时
     _brush_interval = 10
     # Check定时
     _check_interval = 5
+    # 站点并发获取数
+    _site_concurrency = 5
     # 退出事件
     _event = threading.Event()
     _scheduler = None
     # tabs
     _tabs = None
-    # 上次上传下载流量,用于计算本周期内速度
-    _pre_time_upload_size = 0
-    _pre_time_download_size = 0
-    _pre_time_upload_download = 0
+    # 带宽采样器
+    _bandwidth_sampler: Optional[BandwidthSampler] = None
+    # 删种阈值队列与到期精确检查定时器
+    _deadline_queue: Optional[DeadlineQueue] = None
+    _deadline_timer: Optional[threading.Timer] = None
+    _deadline_lock = threading.Lock()
+    # 到达阈值后延迟检查的秒数，确保下载器中的做种时间等数据已越过阈值
+    _deadline_grace = 30
+    # 带宽采样间隔（秒）
+    _bandwidth_sample_interval = 3
+    # 带宽采样缓冲区大小
+    _bandwidth_sample_capacity = 200
+    # 刷流判断使用的带宽均值窗口（秒）
+    _bandwidth_window = 60
+    # 刷流任务存储
+    _task_store: Optional[TaskStore] = None
+    _task_store_lock = threading.Lock()
+    # 统计数据中已归档任务的固定计数
+    _archived_statistic_keys = ("archived_count", "archived_deleted", "archived_uploaded", "archived_downloaded")
+    # 详情页每页任务数
+    _task_page_size = 50
+    # 详情页分页与筛选状态的插件数据 key
+    _task_page_state_key = "task_page_state"
+    # 任务状态筛选 -> 是否已删除
+    _task_status_options = {"all": None, "active": False, "deleted": True}
+    # 统计数据版本，每次保存统计数据时递增
+    _statistic_version = 0
+    # 汇总元素缓存：(统计数据版本, 汇总元素)
+    _total_elements_cache: Optional[Tuple[int, List[dict]]] = None
+    # 仪表盘元素缓存：(统计数据、阶段耗时与站点收益的版本, 仪表盘元素)
+    _dashboard_elements_cache: Optional[Tuple[tuple, List[dict]]] = None
+    # 刷流输入录制器，录制完成后自动停止
+    _replay_recorder: Optional[ReplayRecorder] = None
+    # 阶段耗时统计
+    _phase_timer: Optional[PhaseTimer] = None
+    # 刷流/检查周期内缓存的下载器服务与种子数据适配器，按线程隔离
+    _cycle_local = threading.local()
+    # 本地站点访问频控，多个插件实例共享同一文件
+    _site_visit_limiter: Optional[LocalSiteVisitLimiter] = None
+    _site_visit_limiter_lock = threading.Lock()
+    # 已判断种子的不通过原因缓存，配置变化后失效
+    _rejection_cache: Optional[RejectionCache] = None
+    _rejection_signature: Optional[str] = None
+    # 各站点刷流收益统计
+    _site_yield: Optional[SiteYieldStats] = None
+    # 批量添加种子时同一站点的种子文件并发下载数与总并发数
+    _admission_site_limit = 2
+    _admission_workers = 8
+    # 批量添加后等待 qBittorrent 列出新种子的最长时间（秒）
+    _admission_confirm_timeout = 5
+    # 外部频控接口默认频控时间（秒）
+    _site_visit_check_time = 600
+    # 阶段耗时默认告警阈值（秒）
+    _phase_time_budget = "60,site_browse=180"
+    # 阶段名称
+    _phase_names = {
+        "site_browse": "站点获取种子",
+        "subscribe_titles": "订阅标题匹配",
+        "precondition": "前置条件判断",
+        "candidate_filter": "候选种子过滤",
+        "torrent_download": "种子文件下载",
+        "downloader_add": "添加下载任务",
+        "snapshot": "下载器种子列表",
+        "delete_evaluation": "删种条件判断",
+        "save_data": "保存数据",
+    }
     # endregion
 
     def init_plugin(self, config: dict = None):
-        self._pre_time_upload_size = 0
-        self._pre_time_download_size = 0
-        self._pre_time_upload_download = 0
         self._task_brush_enable = False
 
         if not config:
@@ -321,9 +430,20 @@ class ZYTBrushFlow(_PluginBase):
             return
 
         self._brush_config = BrushConfig(config=config)
+        self._rejection_signature = hashlib.md5(
+            json.dumps(config, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()
+        self._rejection_cache = None
+        self._site_yield = None
 
         brush_config = self._brush_config
 
+        # 阶段耗时统计跨配置更新保留，只更新告警阈值
+        budgets = parse_budgets(brush_config.phase_time_budget or self._phase_time_budget)
+        if self._phase_timer:
+            self._phase_timer.budgets = budgets
+        else:
+            self._phase_timer = PhaseTimer(budgets=budgets, on_exceed=self.__on_phase_time_exceeded)
+
         # 这里先过滤掉已删除的站点并保存，特别注意的是，这里保留了界面选择站点时的顺序，以便后续站点随机刷流或顺序刷流
         if brush_config.brushsites:
             site_id_to_public_status = {site.get("id"): site.get("public") for site in SitesHelper().get_indexers()}
@@ -364,6 +484,16 @@ class ZYTBrushFlow(_PluginBase):
         if not self.service_info:
             return
 
+        # 启用时在后台持续采样下载器带宽，刷流判断时直接读取
+        if brush_config.enabled:
+            self._bandwidth_sampler = BandwidthSampler(sample_func=self.__sample_bandwidth,
+                                                       interval=self._bandwidth_sample_interval,
+                                                       capacity=self._bandwidth_sample_capacity,
+                                                       name="ZYTBrushFlow-bandwidth")
+            self._bandwidth_sampler.start()
+            # 在定时检查之外，到达促销到期、下载超时、H&R做种时间等阈值时精确检查对应任务
+            self._deadline_queue = DeadlineQueue()
+
         # 检查是否启用了一次性任务
         if brush_config.onlyonce:
             self._scheduler = BackgroundScheduler(timezone=settings.TZ)
@@ -395,8 +525,11 @@ class ZYTBrushFlow(_PluginBase):
     @property
     def service_info(self) -> Optional[ServiceInfo]:
         """
-        服务信息
+        服务信息，刷流/检查周期内直接使用周期开始时获取的服务
         """
+        service = getattr(self._cycle_local, "service", None)
+        if service:
+            return service
         brush_config = self.__get_brush_config()
         service = DownloaderHelper().get_service(name=brush_config.downloader)
         if not service:
@@ -414,7 +547,85 @@ class ZYTBrushFlow(_PluginBase):
         """
         下载器实例
         """
-        return self.service_info.instance if self.service_info else None
+        service = self.service_info
+        return service.instance if service else None
+
+    def __get_services(self) -> Dict[str, ServiceInfo]:
+        """
+        获取所有已配置且已连接的下载器服务，按配置顺序排列
+        """
+        services = {}
+        for name in self.__get_brush_config().downloaders:
+            service = DownloaderHelper().get_service(name=name)
+            if not service:
+                self.__log_and_notify_error(f"站点刷流出错，获取下载器 {name} 实例失败，请检查配置")
+                continue
+            if service.instance.is_inactive():
+                self.__log_and_notify_error(f"站点刷流出错，下载器 {name} 未连接")
+                continue
+            services[name] = service
+        return services
+
+    @contextmanager
+    def __downloader_cycle(self):
+        """
+        刷流/检查周期内只获取一次各下载器服务并确定下载器类型，周期结束后清除，默认操作第一个可用的下载器
+        """
+        services = self.__get_services()
+        self._cycle_local.services = services
+        self._cycle_local.adapters = {name: get_adapter(DownloaderHelper().is_downloader("qbittorrent", service=service))
+                                      for name, service in services.items()}
+        try:
+            with self.__use_downloader(next(iter(services.values()), None)):
+                yield services
+        finally:
+            self._cycle_local.services = None
+            self._cycle_local.adapters = None
+
+    @contextmanager
+    def __use_downloader(self, service: Optional[ServiceInfo]):
+        """
+        周期内切换当前操作的下载器，退出时恢复
+        """
+        previous = getattr(self._cycle_local, "service", None), getattr(self._cycle_local, "adapter", None)
+        if service:
+            self._cycle_local.service = service
+            self._cycle_local.adapter = self.__get_service_adapter(service)
+        try:
+            yield
+        finally:
+            self._cycle_local.service, self._cycle_local.adapter = previous
+
+    def __get_service_adapter(self, service: ServiceInfo) -> DownloaderAdapter:
+        adapter = (getattr(self._cycle_local, "adapters", None) or {}).get(service.name)
+        if adapter:
+            return adapter
+        return get_adapter(DownloaderHelper().is_downloader("qbittorrent", service=service))
+
+    def __map_downloaders(self, services: Dict[str, ServiceInfo], func: Callable[[ServiceInfo], Any]) -> Dict[str, Any]:
+        """
+        对各下载器并发执行 func(service)，返回 下载器名称 -> 结果，只有一个下载器时直接执行
+        """
+        if len(services) <= 1:
+            return {name: func(service) for name, service in services.items()}
+        with ThreadPoolExecutor(max_workers=len(services), thread_name_prefix="ZYTBrushFlow-downloader") as executor:
+            futures = {name: executor.submit(func, service) for name, service in services.items()}
+            return {name: future.result() for name, future in futures.items()}
+
+    def __get_task_downloader(self, torrent_task: dict) -> Optional[str]:
+        """
+        获取任务所属的下载器，旧版本任务未记录下载器时归属主下载器
+        """
+        return torrent_task.get("downloader") or self.__get_brush_config().downloader
+
+    def __get_adapter(self) -> DownloaderAdapter:
+        """
+        获取下载器种子数据读取适配器，周期外调用时按当前下载器类型临时创建
+        """
+        adapter = getattr(self._cycle_local, "adapter", None)
+        if adapter:
+            return adapter
+        return get_adapter(DownloaderHelper().is_downloader("qbittorrent", service=self.service_info))
 
     def get_state(self) -> bool:
         brush_config = self.__get_brush_config()
@@ -425,7 +636,277 @@ class ZYTBrushFlow(_PluginBase):
         pass
 
     def get_api(self) -> List[Dict[str, Any]]:
-        pass
+        return [{
+            "path": "/bandwidth",
+            "endpoint": self.get_bandwidth_history,
+            "methods": ["GET"],
+            "auth": "bear",
+            "summary": "获取下载器带宽采样记录",
+        }, {
+            "path": "/cascade",
+            "endpoint": self.get_cascade_preview,
+            "methods": ["GET"],
+            "auth": "bear",
+            "summary": "预览删除刷流种子时将一并删除的辅种",
+        }, {
+            "path": "/tasks",
+            "endpoint": self.get_task_list,
+            "methods": ["GET"],
+            "auth": "bear",
+            "summary": "分页获取刷流任务",
+        }, {
+            "path": "/task_page",
+            "endpoint": self.set_task_page,
+            "methods": ["GET"],
+            "auth": "bear",
+            "summary": "切换详情页刷流任务分页与筛选",
+        }, {
+            "path": "/replay_record",
+            "endpoint": self.start_replay_record,
+            "methods": ["GET"],
+            "auth": "bear",
+            "summary": "录制后续刷流/检查周期的输入，用于离线回放",
+        }, {
+            "path": "/replay",
+            "endpoint": self.run_replay,
+            "methods": ["GET"],
+            "auth": "bear",
+            "summary": "离线回放录制文件或合成数据集，返回决策耗时与结果",
+        }, {
+            "path": "/timing",
+            "endpoint": self.get_phase_timing,
+            "methods": ["GET"],
+            "auth": "bear",
+            "summary": "获取刷流各阶段耗时统计",
+        }]
+
+    def get_phase_timing(self) -> Dict[str, Any]:
+        """
+        获取刷流/检查各阶段耗时统计，包含最近窗口的分位数与直方图
+        """
+        if not self._phase_timer:
+            return {"success": False, "message": "阶段耗时统计未启动"}
+        return {"success": True, "phases": self._phase_timer.summary()}
+
+    def __measure(self, phase: str):
+        """
+        统计阶段耗时，未启动统计时不做处理
+        """
+        return self._phase_timer.measure(phase) if self._phase_timer else nullcontext()
+
+    def __record_phase_time(self, phase: str, seconds: float):
+        if self._phase_timer:
+            self._phase_timer.record(phase, seconds)
+
+    def __on_phase_time_exceeded(self, phase: str, seconds: float, budget: float):
+        logger.warning(f"刷流阶段「{self._phase_names.get(phase, phase)}」耗时 {seconds:.2f} 秒，"
+                       f"超过告警阈值 {budget:g} 秒")
+
+    def start_replay_record(self, cycles: int = 2) -> Dict[str, Any]:
+        """
+        录制接下来 cycles 个刷流/检查周期的输入，文件保存在插件数据目录
+        """
+        cycles = max(1, min(100, int(cycles or 2)))
+        path = self.get_data_path() / f"replay-{datetime.now().strftime('%Y%m%d%H%M%S')}.jsonl.gz"
+        self._replay_recorder = ReplayRecorder(path=path, cycles=cycles)
+        logger.info(f"开始录制刷流输入，共 {cycles} 个周期，文件：{path}")
+        return {"success": True, "file": path.name, "cycles": cycles}
+
+    def run_replay(self, file: str = None, candidates: int = 10000, tasks: int = 50000,
+                   seed: int = 0) -> Dict[str, Any]:
+        """
+        回放插件数据目录中的录制文件，未指定文件时使用当前配置在合成数据集上执行一次刷流与检查
+        合成数据集的候选种子数与任务数最多 100000，避免接口参数过大耗尽内存
+        """
+        try:
+            if file:
+                path = self.get_data_path() / Path(file).name
+                if not path.exists():
+                    return {"success": False, "message": f"录制文件 {path.name} 不存在"}
+                report = ReplaySimulator().replay(load_records(path))
+            else:
+                candidates = max(1, min(100000, int(candidates or 10000)))
+                tasks = max(1, min(100000, int(tasks or 50000)))
+                report = run_benchmark(candidates=candidates, tasks=tasks, seed=int(seed),
+                                       config=self.__get_replay_config(self._brush_config) or BENCHMARK_CONFIG)
+        except Exception as e:
+            logger.error(f"刷流回放失败：{e}")
+            return {"success": False, "message": str(e)}
+        logger.info(f"刷流回放完成，决策数 {report['decisions']}，"
+                    f"每秒决策数 {report['decisions_per_second']:.0f}，"
+                    f"新增 {len(report['admitted'])}，删除 {len(report['deleted'])}")
+        return {"success": True, **report}
+
+    @staticmethod
+    def __get_replay_config(brush_config: Optional[BrushConfig]) -> dict:
+        """
+        提取回放所需的配置项
+        """
+        if not brush_config:
+            return {}
+        return {key: getattr(brush_config, key, None) for key in CONFIG_DEFAULTS}
+
+    @contextmanager
+    def __replay_cycle(self, kind: str):
+        """
+        录制一个刷流/检查周期的初始状态，周期结束（包括提前返回）时计数
+        """
+        recorder = self._replay_recorder
+        if not recorder or not recorder.active:
+            yield
+            return
+        try:
+            brush_config = self.__get_brush_config()
+            recorder.begin_cycle(kind=kind,
+                                 config=self.__get_replay_config(brush_config),
+                                 site_configs={site_name: self.__get_replay_config(site_config)
+                                               for site_name, site_config in brush_config.group_site_configs.items()},
+                                 torrent_tasks=self.__get_tasks("torrents"),
+                                 subscribe_titles=self._subscribe_matcher.keywords if self._subscribe_matcher else ())
+        except Exception as e:
+            logger.error(f"录制刷流输入失败：{e}")
+        try:
+            yield
+        finally:
+            recorder.end_cycle()
+            if not recorder.active:
+                logger.info(f"刷流输入录制完成，文件：{recorder.path}")
+
+    def get_task_list(self, page: int = 1, page_size: int = None, site: str = None, status: str = "all",
+                      keyword: str = None, sort: str = "time", desc: bool = True) -> Dict[str, Any]:
+        """
+        按站点、状态（all/active/deleted）、标题关键字筛选并分页获取刷流任务，默认按添加时间倒序
+        """
+        status = str(status or "all").strip().lower()
+        if status not in self._task_status_options:
+            return {"success": False, "message": "不支持的任务状态"}
+        if isinstance(desc, str):
+            desc = desc.strip().lower() not in ("0", "false", "no")
+        try:
+            page = max(1, int(page or 1))
+            page_size = max(1, min(500, int(page_size or self._task_page_size)))
+            total, rows = self.__get_task_store().query("torrents", site_name=site or None,
+                                                        deleted=self._task_status_options[status],
+                                                        keyword=keyword or None, sort=sort or "time", desc=desc,
+                                                        offset=(page - 1) * page_size, limit=page_size)
+        except ValueError as e:
+            return {"success": False, "message": str(e)}
+        return {
+            "success": True,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "items": [{"hash": torrent_hash, **self.__format_task_row(task)} for torrent_hash, task in rows]
+        }
+
+    def set_task_page(self, page: int = 1, site: str = None, status: str = "all") -> Dict[str, Any]:
+        """
+        切换详情页的任务分页与筛选，状态保存在插件数据中，供页面重新加载时读取一次
+        """
+        status = str(status or "all").strip().lower()
+        if status not in self._task_status_options:
+            return {"success": False, "message": "不支持的任务状态"}
+        state = {"page": max(1, int(page or 1)), "site": site or None, "status": status}
+        self.save_data(self._task_page_state_key, state)
+        return {"success": True, **state}
+
+    def __get_task_page_state(self) -> Dict[str, Any]:
+        """
+        读取并清除一次详情页分页状态，关闭详情页再打开时恢复为第一页、全部任务
+        """
+        state = self.get_data(self._task_page_state_key) or {}
+        if state:
+            self.del_data(self._task_page_state_key)
+        status = state.get("status")
+        return {
+            "page": max(1, int(state.get("page") or 1)),
+            "site": state.get("site") or None,
+            "status": status if status in self._task_status_options else "all"
+        }
+
+    @staticmethod
+    def __format_task_row(data: dict) -> Dict[str, Any]:
+        """
+        格式化详情页中的单行任务数据
+        """
+        return {
+            'site': data.get("site_name"),
+            'title': data.get("title"),
+            'size': StringUtils.str_filesize(data.get("size")),
+            'uploaded': StringUtils.str_filesize(data.get("uploaded") or 0),
+            'downloaded': StringUtils.str_filesize(data.get("downloaded") or 0),
+            'ratio': round(data.get('ratio') or 0, 2),
+            'status': "已删除" if data.get("deleted") else "正常"
+        }
+
+    def get_cascade_preview(self, hashes: str = None) -> Dict[str, Any]:
+        """
+        预览删除刷流种子时按 名称+大小 关联的辅种，hashes 为逗号分隔的种子 hash，留空时检查全部未删除的刷流任务
+        只返回存在辅种的任务
+        """
+        services = self.__get_services()
+        if not services:
+            return {"success": False, "message": "下载器未连接"}
+        # 辅种只会出现在同一个下载器中，按下载器分别建立辅种索引
+        torrents_of_downloader = self.__map_downloaders(services, self.__get_cascade_torrents)
+        cascade_indexes = {}
+        for name, torrents in torrents_of_downloader.items():
+            if torrents is None:
+                continue
+            adapter = self.__get_service_adapter(services[name])
+            cascade_indexes[name] = CascadeIndex({adapter.hash(torrent): torrent for torrent in torrents})
+        if not cascade_indexes:
+            return {"success": False, "message": "连接下载器出错"}
+        torrent_tasks = self.__get_tasks("torrents")
+        if hashes:
+            check_hashes = [torrent_hash.strip() for torrent_hash in hashes.split(",") if torrent_hash.strip()]
+        else:
+            check_hashes = [torrent_hash for torrent_hash, task in torrent_tasks.items() if not task.get("deleted")]
+
+        items = []
+        for torrent_hash in check_hashes:
+            task = torrent_tasks.get(torrent_hash)
+            # 刷流任务在其所属下载器中查找，非刷流任务在第一个包含该种子的下载器中查找
+            if task:
+                cascade_index = cascade_indexes.get(self.__get_task_downloader(task))
+            else:
+                cascade_index = next((index for index in cascade_indexes.values() if torrent_hash in index), None)
+            if not cascade_index:
+                continue
+            siblings = cascade_index.siblings(torrent_hash)
+            if not siblings:
+                continue
+            name, size = cascade_index.key_of(torrent_hash)
+            task = task or {}
+            items.append({
+                "hash": torrent_hash,
+                "site_name": task.get("site_name"),
+                "title": task.get("title"),
+                "downloader": self.__get_task_downloader(task) if task else None,
+                "name": name,
+                "size": size,
+                "siblings": [{"hash": sibling, "is_brush_task": sibling in torrent_tasks} for sibling in siblings]
+            })
+        return {"success": True, "count": len(items), "items": items}
+
+    def get_bandwidth_history(self, window: float = None) -> Dict[str, Any]:
+        """
+        获取后台采样器最近的带宽记录，window 为最近秒数，留空返回全部缓冲区
+        """
+        sampler = self._bandwidth_sampler
+        if not sampler:
+            return {"success": False, "message": "带宽采样未启动"}
+        window = float(window) if window else None
+        ewma_upload_speed, ewma_download_speed = sampler.ewma()
+        avg_upload_speed, avg_download_speed = sampler.mean(window=self._bandwidth_window)
+        return {
+            "success": True,
+            "interval": sampler.interval,
+            "ewma": {"upload_speed": ewma_upload_speed, "download_speed": ewma_download_speed},
+            "mean": {"window": self._bandwidth_window, "upload_speed": avg_upload_speed,
+                     "download_speed": avg_download_speed},
+            "samples": sampler.history(window=window)
+        }
 
     def get_service(self) -> List[Dict[str, Any]]:
         """
@@ -525,6 +1006,20 @@ class ZYTBrushFlow(_PluginBase):
         return services
 
     def __get_total_elements(self) -> List[dict]:
+        """
+        获取汇总元素，统计数据未变化时直接返回缓存，仪表盘轮询不再重复读取插件数据和组装页面
+        """
+        cache = self._total_elements_cache
+        if cache and cache[0] == self._statistic_version:
+            return list(cache[1])
+        version = self._statistic_version
+        elements = self.__build_total_elements()
+        # 组装期间统计数据已被更新时不写入缓存，避免缓存旧数据
+        if version == self._statistic_version:
+            self._total_elements_cache = (version, elements)
+        return list(elements)
+
+    def __build_total_elements(self) -> List[dict]:
         """
         组装汇总元素
         """
@@ -849,6 +1344,11 @@ class ZYTBrushFlow(_PluginBase):
         }
         # 全局配置
         attrs = {}
+        # 统计数据、阶段耗时与站点收益均未变化时直接返回缓存的页面元素
+        version = self.__get_dashboard_version()
+        cache = self._dashboard_elements_cache
+        if cache and cache[0] == version:
+            return cols, attrs, list(cache[1])
         # 拼装页面元素
         elements = [
             {
@@ -856,7 +1356,132 @@ class ZYTBrushFlow(_PluginBase):
                 'content': self.__get_total_elements()
             }
         ]
-        return cols, attrs, elements
+        site_yield_element = self.__get_site_yield_element()
+        if site_yield_element:
+            elements.append(site_yield_element)
+        phase_timing_element = self.__get_phase_timing_element()
+        if phase_timing_element:
+            elements.append(phase_timing_element)
+        # 组装期间数据已被更新时不写入缓存，避免缓存旧数据
+        if version == self.__get_dashboard_version():
+            self._dashboard_elements_cache = (version, elements)
+        return cols, attrs, list(elements)
+
+    def __get_dashboard_version(self) -> tuple:
+        """
+        仪表盘数据版本，统计器重建后对象不同，版本也随之不同
+        """
+        phase_timer = self._phase_timer
+        site_yield = self.__get_site_yield()
+        return (self._statistic_version,
+                id(phase_timer), phase_timer.version if phase_timer else None,
+                id(site_yield), site_yield.version)
+
+    def __get_site_yield_element(self) -> Optional[dict]:
+        """
+        仪表盘站点收益卡片，尚无统计数据时不展示
+        """
+        summary = self.__get_site_yield().summary()
+        if not summary:
+            return None
+        headers = [
+            {'title': '站点', 'key': 'site_name'},
+            {'title': '任务数', 'key': 'tasks'},
+            {'title': '下载量', 'key': 'downloaded'},
+            {'title': '上传量', 'key': 'uploaded'},
+            {'title': '每GB上传', 'key': 'upload_per_gb'},
+            {'title': '分享率1耗时', 'key': 'ratio_one_hours'},
+            {'title': '删除原因', 'key': 'reasons'},
+        ]
+        items = []
+        for stat in summary:
+            items.append({
+                'site_name': stat["site_name"],
+                'tasks': stat["tasks"],
+                'downloaded': StringUtils.str_filesize(stat["downloaded"]),
+                'uploaded': StringUtils.str_filesize(stat["uploaded"]),
+                'upload_per_gb': f'{stat["upload_per_gb"]:.2f} GB' if stat["upload_per_gb"] is not None else '-',
+                'ratio_one_hours': f'{stat["ratio_one_hours"]:.1f} 小时' if stat["ratio_one_hours"] is not None else '-',
+                'reasons': '，'.join(f'{reason} {count}' for reason, count in stat["reasons"].items()) or '-',
+            })
+        return self.__get_table_card_element(title='站点收益', headers=headers, items=items)
+
+    def __get_phase_timing_element(self) -> Optional[dict]:
+        """
+        仪表盘阶段耗时卡片，尚无统计数据时不展示
+        """
+        summary = self._phase_timer.summary() if self._phase_timer else None
+        if not summary:
+            return None
+        headers = [
+            {'title': '阶段', 'key': 'phase'},
+            {'title': '次数', 'key': 'count'},
+            {'title': '平均', 'key': 'mean'},
+            {'title': 'P95', 'key': 'p95'},
+            {'title': '最大', 'key': 'max'},
+            {'title': '阈值', 'key': 'budget'},
+        ]
+        items = []
+        for phase, name in self._phase_names.items():
+            stat = summary.get(phase)
+            if not stat:
+                continue
+            items.append({
+                'phase': name,
+                'count': stat["count"],
+                'mean': f'{stat["mean"]:.2f}s',
+                'p95': f'{stat["p95"]:.2f}s',
+                'max': f'{stat["max"]:.2f}s',
+                'budget': f'{stat["budget"]:g}s' if stat["budget"] else '-',
+            })
+        return self.__get_table_card_element(title=f'阶段耗时（最近 {self._phase_timer.capacity} 次）',
+                                             headers=headers, items=items)
+
+    @staticmethod
+    def __get_table_card_element(title: str, headers: List[dict], items: List[dict]) -> dict:
+        """
+        仪表盘表格卡片
+        """
+        return {
+            'component': 'VRow',
+            'content': [
+                {
+                    'component': 'VCol',
+                    'props': {
+                        'cols': 12
+                    },
+                    'content': [
+                        {
+                            'component': 'VCard',
+                            'props': {
+                                'variant': 'tonal',
+                            },
+                            'content': [
+                                {
+                                    'component': 'VCardTitle',
+                                    'props': {
+                                        'class': 'text-subtitle-1'
+                                    },
+                                    'text': title
+                                },
+                                {
+                                    'component': 'VDataTable',
+                                    'props': {
+                                        'class': 'text-sm',
+                                        'headers': headers,
+                                        'items': items,
+                                        'items-per-page': len(items),
+                                        'hide-default-footer': True,
+                                        'density': 'compact',
+                                        'hover': True
+                                    }
+                                }
+                            ]
+                        }
+                    ]
+                }
+            ]
+        }
 
     def get_form(self) -> Tuple[List[dict], Dict[str, Any]]:
         """
@@ -965,7 +1590,10 @@ class ZYTBrushFlow(_PluginBase):
                                         'props': {
                                             'model': 'downloader',
                                             'label': '下载器',
-                                            'items': downloader_options
+                                            'items': downloader_options,
+                                            'multiple': True,
+                                            'chips': True,
+                                            'hint': '多个下载器时按上传余量、活动种子数与剩余空间分配新任务'
                                         }
                                     }
                                 ]
@@ -1285,6 +1913,42 @@ class ZYTBrushFlow(_PluginBase):
                                                         }
                                                     }
                                                 ]
+                                            },
+                                            {
+                                                'component': 'VCol',
+                                                'props': {
+                                                    "cols": 12,
+                                                    "md": 4
+                                                },
+                                                'content': [
+                                                    {
+                                                        'component': 'VTextField',
+                                                        'props': {
+                                                            'model': 'site_concurrency',
+                                                            'label': '站点并发获取数',
+                                                            'placeholder': f'同时获取种子的站点数，默认 {self._site_concurrency}，1 为逐个获取',
+                                                            'type': 'number',
+                                                            "min": "1"
+                                                        }
+                                                    }
+                                                ]
+                                            },
+                                            {
+                                                'component': 'VCol',
+                                                'props': {
+                                                    "cols": 12,
+                                                    "md": 4
+                                                },
+                                                'content': [
+                                                    {
+                                                        'component': 'VTextField',
+                                                        'props': {
+                                                            'model': 'phase_time_budget',
+                                                            'label': '阶段耗时告警阈值（秒）',
+                                                            'placeholder': f'默认 {self._phase_time_budget}'
+                                                        }
+                                                    }
+                                                ]
                                             }
                                         ]
                                     }
@@ -1731,6 +2395,45 @@ class ZYTBrushFlow(_PluginBase):
                                                 ]
                                             }
                                         ]
+                                    },
+                                    {
+                                        'component': 'VRow',
+                                        'content': [
+                                            {
+                                                'component': 'VCol',
+                                                'props': {
+                                                    'cols': 12,
+                                                    'md': 3
+                                                },
+                                                'content': [
+                                                    {
+                                                        'component': 'VSwitch',
+                                                        'props': {
+                                                            'model': 'del_no_free',
+                                                            'label': '删除促销过期的未完成下载',
+                                                        }
+                                                    }
+                                                ]
+                                            },
+                                            {
+                                                'component': 'VCol',
+                                                'props': {
+                                                    'cols': 12,
+                                                    'md': 3
+                                                },
+                                                'content': [
+                                                    {
+                                                        'component': 'VSwitch',
+                                                        'props': {
+                                                            'model': 'brush_yield_weighted',
+                                                            'label': '按站点收益分配刷流',
+                                                            'hint': '按各站点每GB下载带来的上传量排序站点并分配每轮新增任务数',
+                                                            'persistent-hint': True
+                                                        }
+                                                    }
+                                                ]
+                                            }
+                                        ]
                                     }
                                 ]
                             }
@@ -1903,7 +2606,9 @@ class ZYTBrushFlow(_PluginBase):
             "delete_except_tags": f"{settings.TORRENT_TAG},H&R" if settings.TORRENT_TAG else "H&R",
             "except_subscribe": True,
             "brush_sequential": False,
+            "brush_yield_weighted": False,
             "proxy_delete": False,
+            "del_no_free": False,
             "freeleech": "free",
             "hr": "yes",
             "enable_site_config": False,
@@ -1911,10 +2616,9 @@ class ZYTBrushFlow(_PluginBase):
         }
 
     def get_page(self) -> List[dict]:
-        # 种子明细
-        torrents = self.get_data("torrents") or {}
-
-        if not torrents:
+        # 种子明细，只查询当前页
+        task_store = self.__get_task_store()
+        if not task_store.count("torrents"):
             return [
                 {
                     'component': 'div',
@@ -1924,10 +2628,18 @@ class ZYTBrushFlow(_PluginBase):
                     }
                 }
             ]
-        else:
-            data_list = torrents.values()
-            # 按time倒序排序
-            data_list = sorted(data_list, key=lambda x: x.get("time") or 0, reverse=True)
+
+        state = self.__get_task_page_state()
+        page_size = self._task_page_size
+        total, rows = task_store.query("torrents", site_name=state["site"],
+                                       deleted=self._task_status_options[state["status"]],
+                                       offset=(state["page"] - 1) * page_size, limit=page_size)
+        page_count = max(1, (total + page_size - 1) // page_size)
+        if state["page"] > page_count:
+            state["page"] = page_count
+            total, rows = task_store.query("torrents", site_name=state["site"],
+                                           deleted=self._task_status_options[state["status"]],
+                                           offset=(page_count - 1) * page_size, limit=page_size)
 
         # 表格标题
         headers = [
@@ -1940,17 +2652,7 @@ class ZYTBrushFlow(_PluginBase):
             {'title': '状态', 'key': 'status', 'sortable': True},
         ]
         # 种子数据明细
-        items = [
-            {
-                'site': data.get("site_name"),
-                'title': data.get("title"),
-                'size': StringUtils.str_filesize(data.get("size")),
-                'uploaded': StringUtils.str_filesize(data.get("uploaded") or 0),
-                'downloaded': StringUtils.str_filesize(data.get("downloaded") or 0),
-                'ratio': round(data.get('ratio') or 0, 2),
-                'status': "已删除" if data.get("deleted") else "正常"
-            } for data in data_list
-        ]
+        items = [self.__format_task_row(data) for _, data in rows]
 
         # 拼装页面
         return [
@@ -1975,19 +2677,25 @@ class ZYTBrushFlow(_PluginBase):
                                     'cols': 12,
                                 },
                                 'content': [
+                                    self.__get_task_filter_element(state=state,
+                                                                   site_names=task_store.site_names("torrents")),
                                     {
-                                        'component': 'VDataTableVirtual',
+                                        'component': 'VDataTable',
                                         'props': {
                                             'class': 'text-sm',
                                             'headers': headers,
                                             'items': items,
+                                            'items-per-page': page_size,
+                                            'hide-default-footer': True,
                                             'height': '30rem',
                                             'density': 'compact',
                                             'fixed-header': True,
                                             'hide-no-data': True,
                                             'hover': True
                                         }
-                                    }
+                                    },
+                                    self.__get_task_pagination_element(state=state, total=total,
+                                                                       page_count=page_count)
                                 ]
                             }
                         ]
@@ -1996,11 +2704,111 @@ class ZYTBrushFlow(_PluginBase):
             }
         ]
 
+    def __task_page_event(self, page: int, site: Optional[str], status: str) -> Dict[str, Any]:
+        """
+        详情页分页/筛选点击事件
+        """
+        params = {"page": page, "status": status}
+        if site:
+            params["site"] = site
+        return {
+            "click": {
+                "api": f"plugin/{self.__class__.__name__}/task_page",
+                "method": "get",
+                "params": params
+            }
+        }
+
+    def __get_task_filter_element(self, state: Dict[str, Any], site_names: List[str]) -> dict:
+        """
+        详情页任务状态与站点筛选
+        """
+        chips = []
+        for status, text in (("all", "全部"), ("active", "正常"), ("deleted", "已删除")):
+            chips.append({
+                'component': 'VChip',
+                'props': {
+                    'class': 'ma-1',
+                    'size': 'small',
+                    'color': 'primary' if state["status"] == status else None,
+                    'variant': 'flat' if state["status"] == status else 'tonal'
+                },
+                'events': self.__task_page_event(page=1, site=state["site"], status=status),
+                'text': text
+            })
+        for site_name in [None] + site_names:
+            selected = state["site"] == site_name
+            chips.append({
+                'component': 'VChip',
+                'props': {
+                    'class': 'ma-1',
+                    'size': 'small',
+                    'color': 'secondary' if selected else None,
+                    'variant': 'flat' if selected else 'outlined'
+                },
+                'events': self.__task_page_event(page=1, site=site_name, status=state["status"]),
+                'text': site_name or '全部站点'
+            })
+        return {
+            'component': 'div',
+            'props': {
+                'class': 'd-flex flex-wrap align-center mb-2'
+            },
+            'content': chips
+        }
+
+    def __get_task_pagination_element(self, state: Dict[str, Any], total: int, page_count: int) -> dict:
+        """
+        详情页任务分页
+        """
+        page = state["page"]
+        buttons = []
+        for text, target, disabled in (("首页", 1, page <= 1),
+                                       ("上一页", page - 1, page <= 1),
+                                       ("下一页", page + 1, page >= page_count),
+                                       ("末页", page_count, page >= page_count)):
+            button = {
+                'component': 'VBtn',
+                'props': {
+                    'class': 'ma-1',
+                    'size': 'small',
+                    'variant': 'tonal',
+                    'disabled': disabled
+                },
+                'text': text
+            }
+            if not disabled:
+                button['events'] = self.__task_page_event(page=target, site=state["site"], status=state["status"])
+            buttons.append(button)
+        buttons.insert(2, {
+            'component': 'span',
+            'props': {
+                'class': 'text-sm mx-2'
+            },
+            'text': f'第 {page} / {page_count} 页，共 {total} 条'
+        })
+        return {
+            'component': 'div',
+            'props': {
+                'class': 'd-flex flex-wrap align-center justify-center mt-2'
+            },
+            'content': buttons
+        }
+
     def stop_service(self):
         """
         退出插件
         """
         try:
+            if self._bandwidth_sampler:
+                self._bandwidth_sampler.stop()
+                self._bandwidth_sampler = None
+            with self._deadline_lock:
+                if self._deadline_timer:
+                    self._deadline_timer.cancel()
+                    self._deadline_timer = None
+                self._deadline_queue = None
+            self._task_store = None
             if self._scheduler:
                 self._scheduler.remove_all_jobs()
                 if self._scheduler.running:
@@ -2021,12 +2829,16 @@ class ZYTBrushFlow(_PluginBase):
             logger.info(f"当前不在开启时间段区间内，刷流任务暂时暂停")
             return
         brush_config = self.__get_brush_config()
-        if not brush_config.brushsites or not brush_config.downloader or not self.downloader:
+        if not brush_config.brushsites or not brush_config.downloaders:
             return
-        with lock:
+        with lock, self.__downloader_cycle() as services, \
+                self.__get_task_store().transaction(on_commit=partial(self.__record_phase_time, "save_data")), \
+                self.__replay_cycle("brush"):
+            if not services:
+                return
             logger.info(f"开始执行刷流任务 ...")
 
-            torrent_tasks: Dict[str, dict] = self.get_data("torrents") or {}
+            torrent_tasks: Dict[str, dict] = self.__get_tasks("torrents")
             torrents_size = self.__calculate_seeding_torrents_size(torrent_tasks=torrent_tasks)
 
             # 判断能否通过保种体积前置条件
@@ -2036,8 +2848,15 @@ class ZYTBrushFlow(_PluginBase):
                 logger.info(f"刷流任务执行完成")
                 return
 
-            # 判断能否通过刷流前置条件
-            pre_condition_passed, reason = self.__evaluate_pre_conditions_for_brush()
+            # 并发获取各下载器状态快照，本周期内的前置条件判断与下载器选择均基于这些快照
+            downloader_snapshots = self.__map_downloaders(
+                services, partial(self.__get_downloader_snapshot, with_load=len(services) > 1))
+
+            # 一次性计算本周期的剩余任务数、保种体积与带宽余量，后续各站点的种子选择均基于该容量规划
+            with self.__measure("precondition"):
+                capacity_plan = self.__build_capacity_plan(downloader_snapshots=downloader_snapshots,
+                                                           torrents_size=torrents_size)
+                pre_condition_passed, reason = self.__evaluate_pre_conditions_for_brush(capacity_plan=capacity_plan)
             self.__log_brush_conditions(passed=pre_condition_passed, reason=reason)
             if not pre_condition_passed:
                 logger.info(f"刷流任务执行完成")
@@ -2045,6 +2864,9 @@ class ZYTBrushFlow(_PluginBase):
 
             statistic_info = self.__get_statistic_info()
 
+            # 建立重复种子索引，本周期内新增的任务会同步写入索引
+            task_index = TaskIndex(torrent_tasks=torrent_tasks)
+
             # 获取所有站点的信息，并过滤掉不存在的站点
             site_infos = []
             for siteid in brush_config.brushsites:
@@ -2052,14 +2874,24 @@ class ZYTBrushFlow(_PluginBase):
                 if siteinfo:
                     site_infos.append(siteinfo)
 
+            # 按站点收益分配时，收益越高的站点越可能先刷流，并按收益分配本周期的新增任务数
+            quotas = {}
+            if brush_config.brush_yield_weighted:
+                site_weights = self.__get_site_yield().weights(site.name for site in site_infos)
+                if not brush_config.brush_sequential:
+                    site_infos = weighted_order(site_infos, {site: site_weights[site.name] for site in site_infos})
+                quotas = site_quotas([site.name for site in site_infos], site_weights, capacity_plan.total_slots)
+                if quotas:
+                    logger.info(f"各站点本周期新增任务配额：{quotas}")
             # 根据是否开启顺序刷流来决定是否需要打乱顺序
-            if not brush_config.brush_sequential:
+            elif not brush_config.brush_sequential:
                 random.shuffle(site_infos)
 
             logger.info(f"即将针对站点 {', '.join(site.name for site in site_infos)} 开始刷流, 开始第一轮循环")
 
-            # 获取订阅标题
-            subscribe_titles = self.__get_subscribe_titles()
+            # 获取订阅标题匹配器
+            with self.__measure("subscribe_titles"):
+                subscribe_matcher = self.__get_subscribe_matcher()
 
             # 处理所有站点
             # 先尝试以独立配置(刷官种)获取种子,如果不够就取消独立配置(非官种)继续获取
@@ -2067,20 +2899,29 @@ class ZYTBrushFlow(_PluginBase):
             torrents_of_site = {}
             siteinfos_of_site = {}
             is_current_time_in_range_site_config = self.__is_current_time_in_range_site_config()
-            for site in site_infos:
-                site_visit_limit = self.__get_brush_config(site.name).site_visit_limit
-                logger.debug(f"站点 {site.name} 频控url: {site_visit_limit}")
-                if site_visit_limit:
-                    check_pass = self.__check_site_visit(site_visit_limit, site.name, 600)
-                    if not check_pass:
+            # 各站点的频控检查与种子获取并发执行，结果仍按站点顺序依次进入刷流
+            site_concurrency = max(1, int(brush_config.site_concurrency or self._site_concurrency))
+            executor = ThreadPoolExecutor(max_workers=min(site_concurrency, len(site_infos) or 1),
+                                          thread_name_prefix="ZYTBrushFlow-browse")
+            try:
+                # 周期内的下载器服务保存在当前线程，频控使用的下载器名称在提交前获取
+                service = self.service_info
+                downloader_name = service.name if service else None
+                site_futures = [(site, executor.submit(self.__fetch_site_torrents, site, downloader_name))
+                                for site in site_infos]
+                for site, future in site_futures:
+                    torrents, siteinfo = future.result()
+                    self.__record_replay("record_site", site_name=siteinfo.name, torrents=torrents)
+                    if not torrents:
                         continue
-                torrents, siteinfo = self.__get_torrents_by_site(siteid=site.id)
-                if torrents:
                     # 如果站点刷流没有正确响应，说明没有通过前置条件，其他站点也不需要继续刷流了
                     passed, refuse_by_include_exclude_torrents = self.__brush_site_torrents(torrents=torrents, siteinfo=siteinfo,
                                                       torrent_tasks=torrent_tasks,
+                                                      task_index=task_index,
                                                       statistic_info=statistic_info,
-                                                      subscribe_titles=subscribe_titles,
+                                                      capacity_plan=capacity_plan,
+                                                      quotas=quotas,
+                                                      subscribe_matcher=subscribe_matcher,
                                                       ignore_include_exclude=False,
                                                       is_current_time_in_range_site_config=is_current_time_in_range_site_config)
                     if not passed:
@@ -2091,6 +2932,9 @@ class ZYTBrushFlow(_PluginBase):
                         torrents_of_site[siteinfo.name] = refuse_by_include_exclude_torrents
                         siteinfos_of_site[siteinfo.name] = siteinfo
                         logger.info(f"站点 {site.name} 刷流完成")
+            finally:
+                # 中途结束时取消尚未开始的站点请求，避免无谓的站点访问
+                executor.shutdown(wait=True, cancel_futures=True)
             # 如果站点独立配置打开, 且前面没有bread, 并且在二轮筛种生效时间段(忽略include/exclude)内
             if not foreach1_break and self._brush_config.enable_site_config and is_current_time_in_range_site_config:
                 logger.info(f"开始第二轮循环, 忽略站点独立配置中include/exclude字段")
@@ -2102,8 +2946,11 @@ class ZYTBrushFlow(_PluginBase):
                         # 如果站点刷流没有正确响应，说明没有通过前置条件，其他站点也不需要继续刷流了
                         passed, second = self.__brush_site_torrents(torrents=torrents, siteinfo=siteinfo,
                                                           torrent_tasks=torrent_tasks,
+                                                          task_index=task_index,
                                                           statistic_info=statistic_info,
-                                                          subscribe_titles=subscribe_titles,
+                                                          capacity_plan=capacity_plan,
+                                                          quotas=quotas,
+                                                          subscribe_matcher=subscribe_matcher,
                                                           ignore_include_exclude=True,
                                                           is_current_time_in_range_site_config=is_current_time_in_range_site_config)
                         if not passed:
@@ -2114,42 +2961,128 @@ class ZYTBrushFlow(_PluginBase):
             torrents_of_site.clear()
             siteinfos_of_site.clear()
             # 保存数据
-            self.save_data("torrents", torrent_tasks)
+            self.__save_tasks("torrents", torrent_tasks)
             # 保存统计数据
-            self.save_data("statistic", statistic_info)
+            self.__save_statistic_info(statistic_info)
+            self.__save_rejection_cache()
+            self.__save_site_yield()
             logger.info(f"刷流任务执行完成")
 
-    def __check_site_visit(self, url, site_name, check_time_sec=600):
-        params = {
-            "site_name": site_name,
-            "last_time": datetime.now().replace(microsecond=0).isoformat(),
-            "check_time": check_time_sec,  # 频控时间默认10min
-            "downloader": self.service_info.name,
-            "request_id":  str(time.time())
-        }
+    def __get_rejection_cache(self) -> RejectionCache:
+        """
+        获取已判断种子缓存，首次使用时从插件数据恢复，配置签名不一致时丢弃
+        """
+        if not self._rejection_cache:
+            self._rejection_cache = RejectionCache.from_dict(self.get_data("rejections"),
+                                                             signature=self._rejection_signature)
+        return self._rejection_cache
+
+    def __save_rejection_cache(self):
+        """
+        保存已判断种子缓存
+        """
+        if not self._rejection_cache:
+            return
         try:
-            response = requests.get(url, params=params, timeout=(5, 10))# 连接超时5秒，读取超时10秒
-            check_pass = response.json()["check_pass"]
-            logger.info(f"站点 {site_name} 触发频控检查，check_pass={check_pass}")
-            if response.status_code == 200:
-                return check_pass
+            self.save_data("rejections", self._rejection_cache.to_dict())
+        except Exception as e:
+            logger.error(f"保存已判断种子缓存失败：{e}")
+
+    def __get_site_yield(self) -> SiteYieldStats:
+        """
+        获取站点收益统计，首次使用时从插件数据恢复，没有数据时由已有的刷流任务与归档任务建立
+        """
+        if self._site_yield is None:
+            data = self.get_data("site_yield")
+            if data is not None:
+                self._site_yield = SiteYieldStats.from_dict(data)
             else:
-                logger.info(f"频控接口请求失败: {response.status_code} - {response.text}")
-                return False
+                self._site_yield = SiteYieldStats.from_tasks(
+                    list(self.__get_tasks("torrents").values()) + list(self.__get_tasks("archived").values()))
+        return self._site_yield
+
+    def __save_site_yield(self):
+        """
+        保存站点收益统计
+        """
+        if self._site_yield is None:
+            return
+        try:
+            self.save_data("site_yield", self._site_yield.to_dict())
         except Exception as e:
-            logger.info(f"频控接口请求异常: {str(e)}")
-            return False
+            logger.error(f"保存站点收益统计失败：{e}")
 
-    def __get_torrents_by_site(self, siteid):
+    def __note_delete_reason(self, torrent_hash: str, reason: Optional[str]):
         """
-        获取站点种子
+        记录本次检查中种子的删除原因，删除成功后计入站点收益统计
         """
-        siteinfo = SiteOper().get(siteid)
-        if not siteinfo:
-            logger.warning(f"站点不存在：{siteid}")
-            return None, siteinfo
+        delete_reasons = getattr(self._cycle_local, "delete_reasons", None)
+        if delete_reasons is not None:
+            delete_reasons[torrent_hash] = reason
 
-        logger.info(f"开始获取站点 {siteinfo.name} 的新种子 ...")
+    def __get_local_site_visit_limiter(self) -> LocalSiteVisitLimiter:
+        """
+        获取本地站点访问频控，保存在各插件实例共用的数据目录中
+        """
+        with self._site_visit_limiter_lock:
+            if not self._site_visit_limiter:
+                path = Path(settings.PLUGIN_DATA_PATH) / "zytbrushflow"
+                path.mkdir(parents=True, exist_ok=True)
+                self._site_visit_limiter = LocalSiteVisitLimiter(path / "site_visit.db")
+            return self._site_visit_limiter
+
+    def __get_site_visit_limiter(self, site_visit_limit) -> Tuple[Optional[SiteVisitLimiter], int]:
+        """
+        根据站点频控配置获取频控实现与频控时间，数字为本地频控间隔秒数，地址为外部频控接口（异常时回退本地频控）
+        """
+        if not site_visit_limit:
+            return None, 0
+        if str(site_visit_limit).strip().startswith(("http://", "https://")):
+            return RemoteSiteVisitLimiter(url=str(site_visit_limit).strip(), request_func=requests.get,
+                                          fallback=self.__get_local_site_visit_limiter(),
+                                          log_func=logger.info), \
+                self._site_visit_check_time
+        try:
+            check_time = int(float(site_visit_limit))
+        except (TypeError, ValueError):
+            logger.error(f"站点频控配置错误，已忽略：{site_visit_limit}")
+            return None, 0
+        if check_time <= 0:
+            return None, 0
+        return self.__get_local_site_visit_limiter(), check_time
+
+    def __check_site_visit(self, site_visit_limit, site_name, downloader_name: Optional[str]) -> bool:
+        limiter, check_time = self.__get_site_visit_limiter(site_visit_limit)
+        if not limiter:
+            return True
+        try:
+            check_pass = limiter.acquire(site_name, check_time, downloader=downloader_name)
+        except Exception as e:
+            logger.error(f"站点 {site_name} 频控检查异常: {str(e)}")
+            return False
+        logger.info(f"站点 {site_name} 触发频控检查，check_pass={check_pass}")
+        return check_pass
+
+    def __fetch_site_torrents(self, siteinfo, downloader_name: Optional[str]):
+        """
+        执行站点频控检查并获取站点种子，在线程池中并发执行，downloader_name 为频控接口使用的下载器名称
+        """
+        try:
+            site_visit_limit = self.__get_brush_config(siteinfo.name).site_visit_limit
+            logger.debug(f"站点 {siteinfo.name} 频控配置: {site_visit_limit}")
+            if not self.__check_site_visit(site_visit_limit, siteinfo.name, downloader_name):
+                return None, siteinfo
+            with self.__measure("site_browse"):
+                return self.__get_torrents_by_site(siteinfo=siteinfo)
+        except Exception as e:
+            logger.error(f"站点 {siteinfo.name} 获取种子发生异常: {e}")
+            return None, siteinfo
+
+    def __get_torrents_by_site(self, siteinfo):
+        """
+        获取站点种子
+        """
+        logger.info(f"开始获取站点 {siteinfo.name} 的新种子 ...")
         torrents = TorrentsChain().browse(domain=siteinfo.domain)
         if not torrents:
             logger.info(f"站点 {siteinfo.name} 没有获取到种子")
@@ -2160,58 +3093,100 @@ class ZYTBrushFlow(_PluginBase):
         logger.info(f"正在准备种子刷流，数量 {len(torrents)}")
         return torrents, siteinfo
 
-    def __brush_site_torrents(self, torrents, siteinfo, torrent_tasks: Dict[str, dict], statistic_info: Dict[str, int],
-                              subscribe_titles: Set[str], ignore_include_exclude, is_current_time_in_range_site_config) -> Tuple[bool, list]:
+    def __brush_site_torrents(self, torrents, siteinfo, torrent_tasks: Dict[str, dict], task_index: TaskIndex,
+                              statistic_info: Dict[str, int],
+                              capacity_plan: CapacityPlan, quotas: Dict[str, int], subscribe_matcher: KeywordMatcher, ignore_include_exclude, is_current_time_in_range_site_config) -> Tuple[bool, list]:
         """
         针对站点进行刷流,第一二轮标识=ignore_include_exclude
+        先过滤出所有符合条件的种子，再按排名在容量规划的余量内一次性选出本次新增的种子
+        quotas 为各站点本周期剩余的新增任务配额，没有配额的站点不限制
+        第二轮的种子均为第一轮仅因包含/排除规则不通过的种子，其余条件已在第一轮通过，只需重新判断重复种子与容量
         """
         brush_config = self.__get_brush_config(sitename=siteinfo.name)
 
         if brush_config.site_hr_active:
             logger.info(f"站点 {siteinfo.name} 已开启全站H&R选项，所有种子设置为H&R种子")
 
-        # 排除包含订阅的种子
-        if brush_config.except_subscribe:
-            torrents = self.__filter_torrents_contains_subscribe(torrents=torrents, subscribe_titles=subscribe_titles)
+        # 判断能否通过刷流前置条件
+        pre_condition_passed, reason = self.__evaluate_pre_conditions_for_brush(capacity_plan=capacity_plan)
+        self.__log_brush_conditions(passed=pre_condition_passed, reason=reason)
+        if not pre_condition_passed:
+            return False, []
+
+        # 排除包含订阅的种子，第二轮的种子已在第一轮排除
+        if brush_config.except_subscribe and not ignore_include_exclude:
+            torrents = self.__filter_torrents_contains_subscribe(torrents=torrents, subscribe_matcher=subscribe_matcher)
 
-        torrents_size = self.__calculate_seeding_torrents_size(torrent_tasks=torrent_tasks)
         refuse_by_include_exclude_torrents = []
+        # 第一轮沿用已判断过且可变字段未变化的种子的不通过原因，第二轮忽略包含/排除规则，需完整判断
+        rejection_cache = self.__get_rejection_cache() if not ignore_include_exclude else None
+        cached_count = 0
+        # 符合刷流条件的种子，同一站点内标题或详情地址相同的只保留第一个
+        candidates = []
+        candidate_keys = set()
         # 过滤种子
         for torrent in torrents:
-            # 判断能否通过刷流前置条件
-            pre_condition_passed, reason = self.__evaluate_pre_conditions_for_brush(include_network_conditions=False)
-            self.__log_brush_conditions(passed=pre_condition_passed, reason=reason)
-            if not pre_condition_passed:
-                return False, refuse_by_include_exclude_torrents
-
             logger.debug(f"种子详情：{torrent}")
 
-            # 判断能否通过保种体积刷流条件
-            size_condition_passed, reason = self.__evaluate_size_condition_for_brush(torrents_size=torrents_size,
-                                                                                     add_torrent_size=torrent.size)
-            self.__log_brush_conditions(passed=size_condition_passed, reason=reason, torrent=torrent)
-            if not size_condition_passed:
-                continue
+            with self.__measure("candidate_filter"):
+                # 判断能否通过刷流条件
+                condition_passed = False
+                reason = rejection_cache.get(siteinfo.name, torrent) if rejection_cache else None
+                # 旧版本缓存的包含/排除原因需要重新完整判断，避免未判断发布时间的种子进入第二轮
+                if reason in VOLATILE_REASONS:
+                    rejection_cache.discard(siteinfo.name, torrent)
+                    reason = None
+                if reason:
+                    cached_count += 1
+                elif ignore_include_exclude:
+                    # 第一轮之后新增的任务可能与种子重复
+                    condition_passed, reason = evaluate_duplicate_conditions(torrent=torrent, task_index=task_index)
+                else:
+                    condition_passed, reason = self.__evaluate_conditions_for_brush(
+                        torrent=torrent, task_index=task_index, ignore_include_exclude=ignore_include_exclude)
+                    if rejection_cache:
+                        if not condition_passed and is_stable_rejection(brush_config, torrent, reason,
+                                                                        pubminutes_func=self.__get_pubminutes):
+                            rejection_cache.put(siteinfo.name, torrent, reason)
+                        rejection_cache.advance(siteinfo.name, torrent)
 
-            # 判断能否通过刷流条件
-            condition_passed, reason = self.__evaluate_conditions_for_brush(torrent=torrent,
-                                                                            torrent_tasks=torrent_tasks,
-                                                                            ignore_include_exclude=ignore_include_exclude)
             self.__log_brush_conditions(passed=condition_passed, reason=reason, torrent=torrent)
             if not condition_passed:
                 # 第一轮收集不符合include/exclude条件的种子,第二轮刷流使用,只在第一轮收集,且斩断能独立配置打开,且在忽略include/exclude二轮筛种生效时间段
                 if (not ignore_include_exclude and self._brush_config.enable_site_config and is_current_time_in_range_site_config
-                        and reason is not None and ("符合排除规则" == reason or "不符合包含规则" == reason)):
+                        and reason in INCLUDE_EXCLUDE_REASONS):
                     refuse_by_include_exclude_torrents.append(torrent)
                 continue
 
-            # 添加下载任务
-            hash_string = self.__download(torrent=torrent)
-            if not hash_string:
-                logger.warning(f"{torrent.title} 添加刷流任务失败！")
+            keys = {("title", torrent.title), ("page_url", torrent.page_url or torrent.title)}
+            if keys & candidate_keys:
+                self.__log_brush_conditions(passed=False, reason="重复种子", torrent=torrent)
                 continue
-
-            # 触发刷流下载时间并保存任务信息
+            candidate_keys.update(keys)
+            candidates.append(torrent)
+
+        if cached_count:
+            logger.info(f"站点 {siteinfo.name} 沿用已判断结果跳过 {cached_count} 个种子")
+
+        # 按排名贪心选择，体积超出剩余保种体积的种子跳过，下载器全部达到上限时停止
+        quota = quotas.get(siteinfo.name)
+        selected, skipped = capacity_plan.select(
+            rank_torrents(candidates),
+            pick_func=lambda available, torrent: self.__pick_downloader(capacity_plan=capacity_plan,
+                                                                        available=available, torrent=torrent),
+            limit=quota)
+        if quota is not None:
+            quotas[siteinfo.name] = quota - len(selected)
+        for torrent, skip_reason in skipped:
+            self.__log_brush_conditions(passed=False, reason=skip_reason, torrent=torrent)
+        if candidates:
+            logger.info(f"站点 {siteinfo.name} 符合条件的种子 {len(candidates)} 个，选中 {len(selected)} 个，"
+                        f"剩余容量 {capacity_plan}")
+
+        # 选中的种子已预占容量，批量添加到下载器
+        admissions: List[Admission] = []
+        for torrent, downloader_name in selected:
+            # 刷流任务信息，添加到下载器成功后保存
             torrent_task = {
                 "site": siteinfo.id,
                 "site_name": siteinfo.name,
@@ -2244,25 +3219,62 @@ class ZYTBrushFlow(_PluginBase):
                 "uploaded": 0,
                 "seeding_time": 0,
                 "deleted": False,
-                "time": time.time()
+                "time": time.time(),
+                "downloader": downloader_name
             }
+            admission = Admission(torrent=torrent, task=torrent_task, downloader=downloader_name)
+            admissions.append(admission)
+            task_index.add(admission.key, torrent_task)
+
+        self.__admit_torrents(siteinfo=siteinfo, admissions=admissions, torrent_tasks=torrent_tasks,
+                              task_index=task_index, statistic_info=statistic_info, capacity_plan=capacity_plan)
+        # 容量已用尽时其他站点也不需要继续刷流了
+        return not capacity_plan.exhausted, refuse_by_include_exclude_torrents
+
+    def __admit_torrents(self, siteinfo, admissions: List[Admission], torrent_tasks: Dict[str, dict],
+                         task_index: TaskIndex, statistic_info: Dict[str, int], capacity_plan: CapacityPlan):
+        """
+        批量添加刷流种子：并发获取种子文件（同一站点限制并发数），再按下载器分组添加，
+        成功的种子保存为刷流任务，失败的种子撤销预占的下载器与重复种子索引
+        """
+        if not admissions:
+            return
+        fetch_concurrently(admissions, self.__fetch_admission, site_limit=self._admission_site_limit,
+                           max_workers=self._admission_workers)
+        brush_config = self.__get_brush_config(sitename=siteinfo.name)
+        for downloader_name, items in group_by_downloader(admissions).items():
+            with self.__use_downloader(self._cycle_local.services.get(downloader_name)):
+                self.__add_admissions(items=items, brush_config=brush_config)
+
+        added_tasks = {}
+        for admission in admissions:
+            torrent, torrent_task, downloader_name = admission.torrent, admission.task, admission.downloader
+            task_index.remove(admission.key)
+            hash_string = admission.torrent_hash
+            if not hash_string:
+                logger.warning(f"{torrent.title} 添加刷流任务失败！{admission.error or ''}")
+                capacity_plan.release(downloader_name, torrent.size or 0)
+                continue
 
             self.eventmanager.send_event(etype=EventType.PluginTriggered, data={
                 "plugin_id": self.__class__.__name__,
                 "event_name": "brushflow_download_added",
                 "hash": hash_string,
                 "data": torrent_task,
-                "downloader": self.service_info.name
+                "downloader": downloader_name
             })
             torrent_tasks[hash_string] = torrent_task
+            task_index.add(hash_string, torrent_task)
+            added_tasks[hash_string] = torrent_task
 
             # 统计数据
-            torrents_size += torrent.size
             statistic_info["count"] += 1
+            self.__get_site_yield().record_added(siteinfo.name)
             logger.info(f"站点 {siteinfo.name}，新增刷流种子下载：{torrent.title}|{torrent.description}")
             self.__send_add_message(torrent)
 
-        return True, refuse_by_include_exclude_torrents
+        # 新任务的促销到期与下载超时阈值无需等待下次检查即可加入队列
+        self.__schedule_deadlines(torrent_tasks=added_tasks)
 
     def __evaluate_size_condition_for_brush(self, torrents_size: float,
                                             add_torrent_size: float = 0.0) -> Tuple[bool, Optional[str]]:
@@ -2273,9 +3285,8 @@ class ZYTBrushFlow(_PluginBase):
 
         # 如果没有明确指定增加的种子大小，则检查配置中是否有种子大小下限，如果有，使用这个大小作为增加的种子大小
         preset_condition = False
-        if not add_torrent_size and brush_config.size:
-            size_limits = [float(size) * 1024 ** 3 for size in brush_config.size.split("-")]
-            add_torrent_size = size_limits[0]  # 使用配置的种子大小下限
+        if not add_torrent_size and brush_config.filter.size:
+            add_torrent_size = brush_config.filter.size.lower  # 使用配置的种子大小下限
             preset_condition = True
 
         total_size = self.__bytes_to_gb(torrents_size + add_torrent_size)  # 预计总做种体积
@@ -2309,137 +3320,85 @@ class ZYTBrushFlow(_PluginBase):
 
         return True, None
 
-    def __evaluate_pre_conditions_for_brush(self, include_network_conditions: bool = True) \
-            -> Tuple[bool, Optional[str]]:
-        """
-        前置过滤不符合条件的种子
-        """
-        time.sleep(1)
-        reasons = []
-        reasons.extend([
-            ("maxdlcount", lambda config: self.__get_downloading_count() >= int(config),
-             lambda config: f"当前同时下载任务数已达到最大值 {config}，暂时停止新增任务")
-        ])
-
-        if include_network_conditions:
-            # 获取平均带宽
-            avg_upload_speed, avg_download_speed = self.__get_average_bandwidth()
-            # 获取qb上传限速的 80%
-            qb_up_limit_80_percent = self.__get_qb_up_limit_80_percent()
-            if avg_upload_speed is not None:
-                reasons.extend([
-                    ("maxupspeed", lambda config: avg_upload_speed >= min(float(config) * 1024, qb_up_limit_80_percent),
-                     lambda config: f"当前总上传带宽 {StringUtils.str_filesize(avg_upload_speed)}，"
-                                    f"已达到最大值 {config if float(config) * 1024 < qb_up_limit_80_percent else f'(上传限速80%){int(qb_up_limit_80_percent/1024)}'} KB/s，暂时停止新增任务"),
-                ])
-            if avg_download_speed is not None:
-                reasons.extend([
-                    ("maxdlspeed", lambda config: avg_download_speed >= float(config) * 1024,
-                     lambda config: f"当前总下载带宽 {StringUtils.str_filesize(avg_download_speed)}，"
-                                    f"已达到最大值 {config} KB/s，暂时停止新增任务"),
-                ])
-
-        # 判断是否超过最大活跃种子数
-        reasons.extend([
-            ("maxactivetorrents", lambda config: self.__get_downloading_uploading_count() >= int(config),
-             lambda config: f"当前活动种子数已达到最大值 {config}，暂时停止新增任务")
-        ])
-
+    def __build_capacity_plan(self, downloader_snapshots: Dict[str, DownloaderSnapshot],
+                              torrents_size: float) -> CapacityPlan:
+        """
+        根据各下载器快照、当前做种体积与平均带宽计算本周期的剩余容量，带宽为所有下载器合计
+        """
         brush_config = self.__get_brush_config()
-        for condition, check, message in reasons:
-            config_value = getattr(brush_config, condition, None)
-            if config_value and check(config_value):
-                reason = message(config_value)
-                return False, reason
+        # 获取平均带宽
+        avg_upload_speed, avg_download_speed = self.__get_average_bandwidth()
+        self.__record_replay("record_bandwidth", upload_speed=avg_upload_speed, download_speed=avg_download_speed)
+        upload_limit = None
+        if brush_config.maxupspeed:
+            # 不超过qb上传限速的 80%
+            upload_limit = min(float(brush_config.maxupspeed) * 1024, self.__get_qb_up_limit_80_percent())
+        return CapacityPlan(
+            snapshots=downloader_snapshots,
+            max_downloading=int(brush_config.maxdlcount) if brush_config.maxdlcount else None,
+            max_active=int(brush_config.maxactivetorrents) if brush_config.maxactivetorrents else None,
+            byte_budget=float(brush_config.disksize) * 1024 ** 3 - torrents_size if brush_config.disksize else None,
+            upload_limit=upload_limit,
+            upload_speed=avg_upload_speed,
+            download_limit=float(brush_config.maxdlspeed) * 1024 if brush_config.maxdlspeed else None,
+            download_speed=avg_download_speed)
+
+    def __evaluate_pre_conditions_for_brush(self, capacity_plan: CapacityPlan) -> Tuple[bool, Optional[str]]:
+        """
+        前置过滤不符合条件的种子，带宽为所有下载器合计，下载数与活动种子数取自本周期的容量规划，
+        任一下载器仍有余量即可继续刷流，获取种子列表失败的下载器不参与本周期刷流
+        """
+        brush_config = self.__get_brush_config()
+        if not any(snapshot.valid for snapshot in capacity_plan.snapshots.values()):
+            return False, "连接下载器出错，将在下个时间周期重试"
+        upload_headroom = capacity_plan.upload_headroom
+        if upload_headroom is not None and upload_headroom <= 0:
+            upload_limit = capacity_plan.upload_limit
+            limit_text = brush_config.maxupspeed if float(brush_config.maxupspeed) * 1024 <= upload_limit \
+                else f"(上传限速80%){int(upload_limit / 1024)}"
+            return False, (f"当前总上传带宽 {StringUtils.str_filesize(capacity_plan.upload_speed)}，"
+                           f"已达到最大值 {limit_text} KB/s，暂时停止新增任务")
+        download_headroom = capacity_plan.download_headroom
+        if download_headroom is not None and download_headroom <= 0:
+            return False, (f"当前总下载带宽 {StringUtils.str_filesize(capacity_plan.download_speed)}，"
+                           f"已达到最大值 {brush_config.maxdlspeed} KB/s，暂时停止新增任务")
+        if capacity_plan.byte_budget is not None and capacity_plan.byte_budget <= 0:
+            return False, f"已达到设定的保种体积 {brush_config.disksize} GB，暂时停止新增任务"
+
+        if capacity_plan.available():
+            return True, None
+        # 全部下载器达到上限时返回最后一个不满足的原因
+        reason = None
+        messages = {
+            "maxdlcount": f"当前同时下载任务数已达到最大值 {brush_config.maxdlcount}，暂时停止新增任务",
+            "maxactivetorrents": f"当前活动种子数已达到最大值 {brush_config.maxactivetorrents}，暂时停止新增任务",
+            "connection": "获取种子列表失败，暂时停止新增任务"
+        }
+        for name in capacity_plan.snapshots:
+            message = messages[capacity_plan.limit_of(name)]
+            reason = message if len(capacity_plan.snapshots) <= 1 else f"下载器 {name} {message}"
+        return False, reason
 
-        return True, None
+    @staticmethod
+    def __pick_downloader(capacity_plan: CapacityPlan, available: List[str], torrent: Any) -> Optional[str]:
+        """
+        从仍有余量的下载器中为新增种子选择下载器，只有一个下载器时直接使用
+        """
+        if len(capacity_plan.snapshots) <= 1:
+            return next(iter(available), None)
+        return pick_downloader({name: capacity_plan.snapshots[name] for name in available},
+                               required_space=torrent.size or 0)
 
-    def __evaluate_conditions_for_brush(self, torrent, torrent_tasks, ignore_include_exclude) -> Tuple[bool, Optional[str]]:
+    def __evaluate_conditions_for_brush(self, torrent, task_index: TaskIndex,
+                                        ignore_include_exclude) -> Tuple[bool, Optional[str]]:
         """
         过滤不符合条件的种子
         """
-        brush_config = self.__get_brush_config(torrent.site_name)
-
-        # 排除重复种子
-        # 默认根据标题和站点名称进行排除
-        task_key = f"{torrent.site_name}{torrent.title}"
-        if any(task_key == f"{task.get('site_name')}{task.get('title')}" for task in torrent_tasks.values()):
-            return False, "重复种子"
-
-        # 部分站点标题会上新时携带后缀，这里进一步根据种子详情地址进行排除
-        if torrent.page_url:
-            task_page_url = f"{torrent.site_name}{torrent.page_url}"
-            if any(task_page_url == f"{task.get('site_name')}{task.get('page_url')}" for task in
-                   torrent_tasks.values()):
-                return False, "重复种子"
-
-        # 不同站点如果遇到相同种子，判断前一个种子是否已经在做种，否则排除处理
-        if torrent.title:
-            if any(torrent.site_name != f"{task.get('site_name')}" and torrent.title == f"{task.get('title')}"
-                   and not task.get("seed_time") for task in torrent_tasks.values()):
-                return False, "其他站点存在尚未下载完成的相同种子"
-
-        # 促销条件
-        if brush_config.freeleech and torrent.downloadvolumefactor != 0:
-            return False, "非免费种子"
-        if brush_config.freeleech == "2xfree" and torrent.uploadvolumefactor != 2:
-            return False, "非双倍上传种子"
-
-        # H&R
-        if brush_config.hr == "yes" and torrent.hit_and_run:
-            return False, "存在H&R"
-
-        # 种子大小（GB）
-        if brush_config.size:
-            sizes = [float(size) * 1024 ** 3 for size in brush_config.size.split("-")]
-            if len(sizes) == 1 and torrent.size < sizes[0]:
-                return False, f"种子大小 {self.__bytes_to_gb(torrent.size):.1f} GB，不符合条件"
-            elif len(sizes) > 1 and not sizes[0] <= torrent.size <= sizes[1]:
-                return False, f"种子大小 {self.__bytes_to_gb(torrent.size):.1f} GB，不在指定范围内"
-
-        # 做种人数
-        if brush_config.seeder:
-            seeders_range = [float(n) for n in brush_config.seeder.split("-")]
-            # 检查是否仅指定了一个数字，即做种人数需要小于等于该数字
-            if len(seeders_range) == 1:
-                # 当做种人数大于该数字时，不符合条件
-                if torrent.seeders > seeders_range[0]:
-                    return False, f"做种人数 {torrent.seeders}，超过单个指定值"
-            # 如果指定了一个范围
-            elif len(seeders_range) > 1:
-                # 检查做种人数是否在指定的范围内（包括边界）
-                if not (seeders_range[0] <= torrent.seeders <= seeders_range[1]):
-                    return False, f"做种人数 {torrent.seeders}，不在指定范围内"
-
-        # 发布时间
-        pubdate_minutes = self.__get_pubminutes(torrent.pubdate)
-        # 已支持独立站点配置，取消单独适配站点时区逻辑，可通过配置项「pubtime」自行适配
-        # pubdate_minutes = self.__adjust_site_pubminutes(pubdate_minutes, torrent)
-        if brush_config.pubtime:
-            pubtimes = [float(n) for n in brush_config.pubtime.split("-")]
-            if len(pubtimes) == 1:
-                # 单个值：选择发布时间小于等于该值的种子
-                if pubdate_minutes > pubtimes[0]:
-                    return False, f"发布时间 {torrent.pubdate}，{pubdate_minutes:.0f} 分钟前，不符合条件"
-            else:
-                # 范围值：选择发布时间在范围内的种子
-                if not (pubtimes[0] <= pubdate_minutes <= pubtimes[1]):
-                    return False, f"发布时间 {torrent.pubdate}，{pubdate_minutes:.0f} 分钟前，不在指定范围内"
-
-        # 这个条件要放在最后,结果用在第二轮循环上,第一轮获取官种后下载数量不够就第二轮再筛选一次
-        if not ignore_include_exclude:
-            # 包含规则
-            if brush_config.include and not (
-                    re.search(brush_config.include, torrent.title, re.I) or re.search(brush_config.include,
-                                                                                      torrent.description, re.I)):
-                return False, "不符合包含规则"
-
-            # 排除规则
-            if brush_config.exclude and (
-                    re.search(brush_config.exclude, torrent.title, re.I) or re.search(brush_config.exclude,
-                                                                                      torrent.description, re.I)):
-                return False, "符合排除规则"
-        return True, None
+        return evaluate_brush_conditions(brush_config=self.__get_brush_config(torrent.site_name),
+                                         torrent=torrent,
+                                         task_index=task_index,
+                                         ignore_include_exclude=ignore_include_exclude,
+                                         pubminutes_func=self.__get_pubminutes)
 
     @staticmethod
     def __log_brush_conditions(passed: bool, reason: str, torrent: Any = None):
@@ -2456,9 +3415,10 @@ class ZYTBrushFlow(_PluginBase):
 
     # region Check
 
-    def check(self):
+    def check(self, torrent_hashes: Optional[List[str]] = None):
         """
         定时检查，删除下载任务
+        torrent_hashes 不为空时为到达删种阈值的精确检查，只获取并检查这些任务，不同步标签、不归档
         """
         if not self.__is_current_time_in_range():
             logger.info(f"当前不在开启时间段区间内，检查任务暂时暂停")
@@ -2466,72 +3426,159 @@ class ZYTBrushFlow(_PluginBase):
 
         brush_config = self.__get_brush_config()
 
-        if not brush_config.downloader or not self.downloader:
+        if not brush_config.downloaders:
             return
 
-        with lock:
-            logger.info("开始检查刷流下载任务 ...")
-            torrent_tasks: Dict[str, dict] = self.get_data("torrents") or {}
-            unmanaged_tasks: Dict[str, dict] = self.get_data("unmanaged") or {}
+        with lock, self.__downloader_cycle() as services, \
+                self.__get_task_store().transaction(on_commit=partial(self.__record_phase_time, "save_data")), \
+                self.__replay_cycle("check"):
+            if not services:
+                return
+            torrent_tasks: Dict[str, dict] = self.__get_tasks("torrents")
+            unmanaged_tasks: Dict[str, dict] = self.__get_tasks("unmanaged")
+            targeted = torrent_hashes is not None
+            if targeted:
+                torrent_hashes = [torrent_hash for torrent_hash in torrent_hashes if torrent_hash in torrent_tasks]
+                if not torrent_hashes:
+                    return
+                logger.info(f"{len(torrent_hashes)} 个刷流任务到达删种阈值，开始检查 ...")
+                target_downloaders = {self.__get_task_downloader(torrent_tasks[torrent_hash])
+                                      for torrent_hash in torrent_hashes}
+                services = {name: service for name, service in services.items() if name in target_downloaders}
+            else:
+                logger.info("开始检查刷流下载任务 ...")
 
-            downloader = self.downloader
-            seeding_torrents, error = downloader.get_torrents()
-            if error:
+            # 并发获取各下载器的种子列表，再逐个下载器检查归属于它的任务
+            seeding_torrents_of_downloader = self.__map_downloaders(
+                services, partial(self.__get_check_torrents, ids=torrent_hashes))
+            if all(seeding_torrents is None for seeding_torrents in seeding_torrents_of_downloader.values()):
                 logger.warning("连接下载器出错，将在下个时间周期重试")
                 return
+            for name, service in services.items():
+                seeding_torrents = seeding_torrents_of_downloader.get(name)
+                if seeding_torrents is None:
+                    logger.warning(f"连接下载器 {name} 出错，该下载器的任务将在下个时间周期重试")
+                    continue
+                owned_tasks = {torrent_hash: torrent_tasks[torrent_hash]
+                               for torrent_hash in (torrent_hashes if targeted else torrent_tasks)
+                               if self.__get_task_downloader(torrent_tasks[torrent_hash]) == name}
+                owned_hashes = set(owned_tasks)
+                with self.__use_downloader(service):
+                    self.__check_downloader_tasks(seeding_torrents=seeding_torrents, torrent_tasks=owned_tasks,
+                                                  unmanaged_tasks=unmanaged_tasks, targeted=targeted)
+                # 合并标签同步新增与移出管理的任务
+                for torrent_hash in owned_hashes - owned_tasks.keys():
+                    torrent_tasks.pop(torrent_hash, None)
+                torrent_tasks.update(owned_tasks)
+
+            # 所属下载器已从配置中移除的任务不会再被检查，按种子已在下载器中删除处理，不再占用保种体积与去重
+            # 已配置但暂时未连接的下载器的任务保持不变，等待下个时间周期重试
+            if not targeted:
+                orphaned_tasks = {torrent_hash: torrent_task for torrent_hash, torrent_task in torrent_tasks.items()
+                                  if not torrent_task.get("deleted")
+                                  and self.__get_task_downloader(torrent_task) not in brush_config.downloaders}
+                if orphaned_tasks:
+                    logger.info(f"{len(orphaned_tasks)} 个刷流任务所属的下载器已不在配置中，更新为已删除状态")
+                    self.__update_undeleted_torrents_missing_in_downloader(orphaned_tasks, list(orphaned_tasks), [])
+
+            # 归档数据
+            statistic_info = self.__get_statistic_info()
+            if not targeted:
+                self.__auto_archive_tasks(torrent_tasks=torrent_tasks, statistic_info=statistic_info)
+
+            self.__update_and_save_statistic_info(torrent_tasks=torrent_tasks, statistic_info=statistic_info)
+
+            self.__save_tasks("torrents", torrent_tasks)
+            self.__save_site_yield()
 
-            # zyt key = hash,value=torrent
-            seeding_torrents_dict = {self.__get_hash(torrent): torrent for torrent in seeding_torrents}
+            # 全量检查后重建删种阈值队列，精确检查只更新检查过的任务
+            self.__schedule_deadlines(
+                torrent_tasks={torrent_hash: torrent_tasks[torrent_hash] for torrent_hash in torrent_hashes
+                               if torrent_hash in torrent_tasks} if targeted else torrent_tasks,
+                rebuild=not targeted)
+
+            logger.info("刷流下载任务检查完成")
 
-            # 检查种子刷流标签变更情况
+    def __check_downloader_tasks(self, seeding_torrents: List[Any], torrent_tasks: Dict[str, dict],
+                                 unmanaged_tasks: Dict[str, dict], targeted: bool = False):
+        """
+        检查当前下载器中的刷流任务：同步标签、更新状态并删除满足条件的种子，torrent_tasks 只包含归属于该下载器的任务
+        seeding_torrents 为检查用的种子列表，qBittorrent 只包含带刷流标签的种子
+        targeted 时 seeding_torrents 只包含待检查的种子，不同步标签，动态删种只判断前置条件
+        """
+        brush_config = self.__get_brush_config()
+        downloader = self.downloader
+
+        # zyt key = hash,value=torrent
+        seeding_torrents_dict = {self.__get_hash(torrent): torrent for torrent in seeding_torrents}
+
+        # 种子列表只包含带刷流标签的种子时，单独获取不在列表中的未删除任务，区分刷流标签被移除与种子已被删除
+        if not targeted and self.__get_adapter().check_filtered:
+            untagged_hashes = [torrent_hash for torrent_hash, torrent_task in torrent_tasks.items()
+                               if torrent_hash not in seeding_torrents_dict and not torrent_task.get("deleted")]
+            if untagged_hashes:
+                untagged_torrents = self.__get_check_torrents(self.service_info, ids=untagged_hashes)
+                if untagged_torrents is None:
+                    logger.warning("获取刷流标签外的刷流任务种子失败，将在下个时间周期重试")
+                    return
+                seeding_torrents_dict.update((self.__get_hash(torrent), torrent) for torrent in untagged_torrents)
+
+        # 检查种子刷流标签变更情况
+        if not targeted:
             self.__update_seeding_tasks_based_on_tags(torrent_tasks=torrent_tasks, unmanaged_tasks=unmanaged_tasks,
                                                       seeding_torrents_dict=seeding_torrents_dict)
 
-            torrent_check_hashes = list(torrent_tasks.keys())
-            if not torrent_tasks or not torrent_check_hashes:
-                logger.info("没有需要检查的刷流下载任务")
-                return
-
-            logger.info(f"共有 {len(torrent_check_hashes)} 个任务正在刷流，开始检查任务状态")
-
-            # zyt 获取到当前所有做种数据中需要被检查的种子数据
-            check_torrents = [seeding_torrents_dict[th] for th in torrent_check_hashes if th in seeding_torrents_dict]
-
-            # 先更新刷流任务的最新状态，上下传，分享率
-            self.__update_torrent_tasks_state(torrents=check_torrents, torrent_tasks=torrent_tasks)
-
-            # 更新刷流任务列表中在下载器中删除的种子为删除状态
-            self.__update_undeleted_torrents_missing_in_downloader(torrent_tasks, torrent_check_hashes, check_torrents)
-
-            # 根据配置的标签进行种子排除
-            if check_torrents:
-                logger.info(f"当前刷流任务共 {len(check_torrents)} 个有效种子，正在准备按设定的种子标签进行排除")
-                # 初始化一个空的列表来存储需要排除的标签
-                tags_to_exclude = set()
-                # 如果 delete_except_tags 非空且不是纯空白，则添加到排除列表中
-                if brush_config.delete_except_tags and brush_config.delete_except_tags.strip():
-                    tags_to_exclude.update(tag.strip() for tag in brush_config.delete_except_tags.split(','))
-                # 将所有需要排除的标签组合成一个字符串，每个标签之间用逗号分隔
-                combined_tags = ",".join(tags_to_exclude)
-                if combined_tags:  # 确保有标签需要排除
-                    pre_filter_count = len(check_torrents)  # 获取过滤前的任务数量
-                    check_torrents = self.__filter_torrents_by_tag(torrents=check_torrents, exclude_tag=combined_tags)
-                    post_filter_count = len(check_torrents)  # 获取过滤后的任务数量
-                    excluded_count = pre_filter_count - post_filter_count  # 计算被排除的任务数量
-                    logger.info(
-                        f"有效种子数 {pre_filter_count}，排除标签 '{combined_tags}' 后，"
-                        f"剩余种子数 {post_filter_count}，排除种子数 {excluded_count}")
-                else:
-                    logger.info("没有配置有效的排除标签，所有种子均参与后续处理")
+        torrent_check_hashes = list(torrent_tasks.keys())
+        if not torrent_tasks or not torrent_check_hashes:
+            logger.info("没有需要检查的刷流下载任务")
+            return
 
-            # 种子删除检查
-            if not check_torrents:
-                logger.info("没有需要检查的任务，跳过")
+        logger.info(f"共有 {len(torrent_check_hashes)} 个任务正在刷流，开始检查任务状态")
+
+        # zyt 获取到当前所有做种数据中需要被检查的种子数据
+        check_torrents = [seeding_torrents_dict[th] for th in torrent_check_hashes if th in seeding_torrents_dict]
+
+        # 先更新刷流任务的最新状态，上下传，分享率
+        self.__update_torrent_tasks_state(torrents=check_torrents, torrent_tasks=torrent_tasks)
+
+        # 更新刷流任务列表中在下载器中删除的种子为删除状态
+        self.__update_undeleted_torrents_missing_in_downloader(torrent_tasks, torrent_check_hashes, check_torrents)
+
+        # 根据配置的标签进行种子排除
+        if check_torrents:
+            logger.info(f"当前刷流任务共 {len(check_torrents)} 个有效种子，正在准备按设定的种子标签进行排除")
+            # 初始化一个空的列表来存储需要排除的标签
+            tags_to_exclude = set()
+            # 如果 delete_except_tags 非空且不是纯空白，则添加到排除列表中
+            if brush_config.delete_except_tags and brush_config.delete_except_tags.strip():
+                tags_to_exclude.update(tag.strip() for tag in brush_config.delete_except_tags.split(','))
+            # 将所有需要排除的标签组合成一个字符串，每个标签之间用逗号分隔
+            combined_tags = ",".join(tags_to_exclude)
+            if combined_tags:  # 确保有标签需要排除
+                pre_filter_count = len(check_torrents)  # 获取过滤前的任务数量
+                check_torrents = self.__filter_torrents_by_tag(torrents=check_torrents, exclude_tag=combined_tags)
+                post_filter_count = len(check_torrents)  # 获取过滤后的任务数量
+                excluded_count = pre_filter_count - post_filter_count  # 计算被排除的任务数量
+                logger.info(
+                    f"有效种子数 {pre_filter_count}，排除标签 '{combined_tags}' 后，"
+                    f"剩余种子数 {post_filter_count}，排除种子数 {excluded_count}")
             else:
-                need_delete_hashes = []
+                logger.info("没有配置有效的排除标签，所有种子均参与后续处理")
 
+        # 种子删除检查，记录各种子的删除原因，删除成功后计入站点收益统计
+        self._cycle_local.delete_reasons = {}
+        if not check_torrents:
+            logger.info("没有需要检查的任务，跳过")
+        else:
+            need_delete_hashes = []
+
+            with self.__measure("delete_evaluation"):
+                # 精确检查的种子只是全部种子的一部分，无法计算动态删种的体积阈值，只判断前置条件
+                if targeted and brush_config.proxy_delete and brush_config.delete_size_range:
+                    need_delete_hashes.extend(self.__delete_torrent_for_evaluate_proxy_pre_conditions(
+                        torrents=check_torrents, torrent_tasks=torrent_tasks) or [])
                 # 如果配置了动态删除以及删种阈值，则根据动态删种进行分组处理
-                if brush_config.proxy_delete and brush_config.delete_size_range:
+                elif brush_config.proxy_delete and brush_config.delete_size_range:
                     logger.info("已开启动态删种，按系统默认动态删种条件开始检查任务")
                     proxy_delete_hashes = self.__delete_torrent_for_proxy(torrents=check_torrents,
                                                                           torrent_tasks=torrent_tasks) or []
@@ -2539,45 +3586,99 @@ class ZYTBrushFlow(_PluginBase):
                 # 否则均认为是没有开启动态删种
                 else:
                     logger.info("没有开启动态删种，按用户设置删种条件开始检查任务")
-                    not_proxy_delete_hashes = self.__delete_torrent_for_evaluate_conditions(torrents=check_torrents,
-                                                                                            torrent_tasks=torrent_tasks) or []
+                    not_proxy_delete_hashes = self.__delete_torrent_for_evaluate_conditions(
+                        torrents=check_torrents, torrent_tasks=torrent_tasks) or []
                     need_delete_hashes.extend(not_proxy_delete_hashes)
 
-                if need_delete_hashes:
-                    # 删辅种,把关联的辅种也计算出来,让他一起删除
-                    # 先根据 hash 反查出 name, 再根据 name 凑齐 hash
-                    need_delete_name_size_list = []
-                    for hash, torrent in seeding_torrents_dict.items():
-                        if hash in need_delete_hashes:
-                            need_delete_name_size_list.append(f'{torrent.name}|{torrent.total_size}')
-                    need_delete_hashes_contain_subsidiary = []
-                    for hash, torrent in seeding_torrents_dict.items():
-                        if f'{torrent.name}|{torrent.total_size}' in need_delete_name_size_list:
-                            need_delete_hashes_contain_subsidiary.append(hash)
-                    logger.info(f"关联辅种删除,共{len(need_delete_hashes_contain_subsidiary)}个, {need_delete_name_size_list}")
-                    need_delete_hashes_contain_subsidiary.extend(need_delete_hashes)
-                    # zyt 如果是QB，则重新汇报Tracker
-                    if DownloaderHelper().is_downloader("qbittorrent", service=self.service_info):
-                        self.__qb_torrents_reannounce(torrent_hashes=need_delete_hashes_contain_subsidiary)
-                    # 删除种子
-                    if downloader.delete_torrents(ids=need_delete_hashes_contain_subsidiary, delete_file=True):
-                        for torrent_hash in need_delete_hashes:
-                            torrent_tasks[torrent_hash]["deleted"] = True
-                            torrent_tasks[torrent_hash]["deleted_time"] = time.time()
-
-            # 归档数据
-            self.__auto_archive_tasks(torrent_tasks=torrent_tasks)
-
-            self.__update_and_save_statistic_info(torrent_tasks)
-
-            self.save_data("torrents", torrent_tasks)
+            if need_delete_hashes:
+                # 删辅种,把关联的辅种也计算出来,让他一起删除
+                # 按 名称+大小 建立索引, 直接查出同组的全部 hash
+                # 检查用的种子列表不是全部种子时，另外获取全部种子的名称与大小，获取失败时只删除刷流种子本身
+                cascade_torrents_dict = seeding_torrents_dict
+                if targeted or self.__get_adapter().check_filtered:
+                    cascade_torrents = self.__get_cascade_torrents(self.service_info)
+                    if cascade_torrents is not None:
+                        cascade_torrents_dict = {self.__get_hash(torrent): torrent for torrent in cascade_torrents}
+                cascade_index = CascadeIndex(cascade_torrents_dict)
+                need_delete_hashes_contain_subsidiary = cascade_index.expand(need_delete_hashes)
+                need_delete_name_size_list = [f'{name}|{size}' for name, size in
+                                              dict.fromkeys(cascade_index.key_of(torrent_hash)
+                                                            for torrent_hash in need_delete_hashes
+                                                            if torrent_hash in cascade_index)]
+                logger.info(f"关联辅种删除,共{len(need_delete_hashes_contain_subsidiary)}个, {need_delete_name_size_list}")
+                # zyt 如果是QB，则重新汇报Tracker
+                if self.__get_adapter().is_qbittorrent:
+                    self.__qb_torrents_reannounce(torrent_hashes=need_delete_hashes_contain_subsidiary)
+                # 删除种子
+                if downloader.delete_torrents(ids=need_delete_hashes_contain_subsidiary, delete_file=True):
+                    delete_reasons = self._cycle_local.delete_reasons
+                    for torrent_hash in need_delete_hashes:
+                        torrent_tasks[torrent_hash]["deleted"] = True
+                        torrent_tasks[torrent_hash]["deleted_time"] = time.time()
+                        self.__get_site_yield().record_deleted(torrent_tasks[torrent_hash].get("site_name") or "",
+                                                               delete_reasons.get(torrent_hash))
+
+    def __schedule_deadlines(self, torrent_tasks: Dict[str, dict], rebuild: bool = False):
+        """
+        计算任务的下一个删种阈值时间并放入队列，rebuild 时以这些任务重建队列
+        """
+        queue = self._deadline_queue
+        if not queue:
+            return
+        now = time.time()
+        deadlines = {}
+        for torrent_hash, torrent_task in torrent_tasks.items():
+            deadline = next_deadline(torrent_task=torrent_task,
+                                     brush_config=self.__get_brush_config(torrent_task.get("site_name")),
+                                     now=now)
+            if deadline:
+                deadlines[torrent_hash] = deadline
+        if rebuild:
+            queue.rebuild(deadlines)
+        else:
+            for torrent_hash in torrent_tasks:
+                queue.push(torrent_hash, deadlines.get(torrent_hash))
+        self.__arm_deadline_timer()
 
-            logger.info("刷流下载任务检查完成")
+    def __arm_deadline_timer(self):
+        """
+        按队列中最早的阈值时间重新设置定时器
+        """
+        with self._deadline_lock:
+            if self._deadline_timer:
+                self._deadline_timer.cancel()
+                self._deadline_timer = None
+            queue = self._deadline_queue
+            due = queue.next_due() if queue else None
+            if due is None:
+                return
+            delay = max(1.0, due - time.time() + self._deadline_grace)
+            self._deadline_timer = threading.Timer(delay, self.__run_due_deadlines)
+            self._deadline_timer.name = "ZYTBrushFlow-deadline"
+            self._deadline_timer.daemon = True
+            self._deadline_timer.start()
+            logger.debug(f"下一个删种阈值将在 {delay:.0f} 秒后到达，共 {len(queue)} 个任务等待检查")
+
+    def __run_due_deadlines(self):
+        """
+        检查已到达删种阈值的任务
+        """
+        try:
+            queue = self._deadline_queue
+            torrent_hashes = queue.pop_due(time.time()) if queue else []
+            if torrent_hashes:
+                self.check(torrent_hashes=torrent_hashes)
+        except Exception as e:
+            logger.error(f"删种阈值检查发生异常：{e}")
+        finally:
+            self.__arm_deadline_timer()
 
     def __update_torrent_tasks_state(self, torrents: List[Any], torrent_tasks: Dict[str, dict]):
         """
-        更新刷流任务的最新状态，上下传，分享率
+        更新刷流任务的最新状态，上下传，分享率，并将上下传增量累计到站点收益统计
         """
+        site_yield = self.__get_site_yield()
+        now = time.time()
         for torrent in torrents:
             torrent_hash = self.__get_hash(torrent)
             torrent_task = torrent_tasks.get(torrent_hash, None)
@@ -2586,6 +3687,8 @@ class ZYTBrushFlow(_PluginBase):
                 continue
 
             torrent_info = self.__get_torrent_info(torrent)
+            site_yield.record_progress(site_name=torrent_task.get("site_name") or "", torrent_task=torrent_task,
+                                       torrent_info=torrent_info, now=now)
 
             # 更新上传量、下载量
             torrent_task.update({
@@ -2599,7 +3702,7 @@ class ZYTBrushFlow(_PluginBase):
                                              seeding_torrents_dict: Dict[str, Any]):
         brush_config = self.__get_brush_config()
 
-        if not DownloaderHelper().is_downloader("qbittorrent", service=self.service_info):
+        if not self.__get_adapter().is_qbittorrent:
             logger.info("同步种子刷流标签记录目前仅支持qbittorrent")
             return
 
@@ -2648,8 +3751,8 @@ class ZYTBrushFlow(_PluginBase):
                     logger.info(f"站点 {torrent_task.get('site_name')}，"
                                 f"刷流任务种子移除：{torrent_task.get('title')}|{torrent_task.get('description')}")
 
-        self.save_data("torrents", torrent_tasks)
-        self.save_data("unmanaged", unmanaged_tasks)
+        self.__save_tasks("torrents", torrent_tasks)
+        self.__save_tasks("unmanaged", unmanaged_tasks)
 
         # 发送汇总消息
         if added_tasks:
@@ -2693,60 +3796,18 @@ class ZYTBrushFlow(_PluginBase):
         """
         评估删除条件并返回是否应删除种子及其原因
         """
-        brush_config = self.__get_brush_config(sitename=site_name)
-
-        reason = "未能满足设置的删除条件"
-
-        # 当配置了H&R做种时间/分享率时，则H&R种子只有达到预期行为时，才会进行删除，如果没有配置H&R做种时间/分享率，则普通种子的删除规则也适用于H&R种子
-        # 判断是否为H&R种子并且是否配置了特定的H&R条件
-        hit_and_run = torrent_task.get("hit_and_run", False)
-        hr_specific_conditions_configured = hit_and_run and (brush_config.hr_seed_time or brush_config.seed_ratio)
-        if hr_specific_conditions_configured:
-            if (brush_config.hr_seed_time and torrent_info.get("seeding_time")
-                    >= float(brush_config.hr_seed_time) * 3600):
-                return True, (f"H&R种子，做种时间 {torrent_info.get('seeding_time') / 3600:.1f} 小时，"
-                              f"大于 {brush_config.hr_seed_time} 小时")
-            if brush_config.seed_ratio and torrent_info.get("ratio") >= float(brush_config.seed_ratio):
-                return True, f"H&R种子，分享率 {torrent_info.get('ratio'):.2f}，大于 {brush_config.seed_ratio}"
-            return False, "H&R种子，未能满足设置的H&R删除条件"
-
-        # 处理其他场景，1. 不是H&R种子；2. 是H&R种子但没有特定条件配置
-        reason = reason if not hit_and_run else "H&R种子（未设置H&R条件），未能满足设置的删除条件"
-        if brush_config.seed_time and torrent_info.get("seeding_time") >= float(brush_config.seed_time) * 3600:
-            reason = f"做种时间 {torrent_info.get('seeding_time') / 3600:.1f} 小时，大于 {brush_config.seed_time} 小时"
-        elif brush_config.seed_ratio and torrent_info.get("ratio") >= float(brush_config.seed_ratio):
-            reason = f"分享率 {torrent_info.get('ratio'):.2f}，大于 {brush_config.seed_ratio}"
-        elif brush_config.seed_size and torrent_info.get("uploaded") >= float(brush_config.seed_size) * 1024 ** 3:
-            reason = f"上传量 {torrent_info.get('uploaded') / 1024 ** 3:.1f} GB，大于 {brush_config.seed_size} GB"
-        elif brush_config.download_time and torrent_info.get("downloaded") < torrent_info.get(
-                "total_size") and torrent_info.get("dltime") >= float(brush_config.download_time) * 3600:
-            reason = f"下载耗时 {torrent_info.get('dltime') / 3600:.1f} 小时，大于 {brush_config.download_time} 小时"
-        elif brush_config.seed_avgspeed and torrent_info.get("avg_upspeed") <= float(
-                brush_config.seed_avgspeed) * 1024 and torrent_info.get("seeding_time") >= 30 * 60:
-            reason = f"平均上传速度 {torrent_info.get('avg_upspeed') / 1024:.1f} KB/s，低于 {brush_config.seed_avgspeed} KB/s"
-        elif brush_config.seed_inactivetime and torrent_info.get("iatime") >= float(
-                brush_config.seed_inactivetime) * 60:
-            reason = f"未活动时间 {torrent_info.get('iatime') / 60:.0f} 分钟，大于 {brush_config.seed_inactivetime} 分钟"
-        else:
-            return False, reason
-
-        return True, reason if not hit_and_run else "H&R种子（未设置H&R条件），" + reason
+        return evaluate_delete_conditions(brush_config=self.__get_brush_config(sitename=site_name),
+                                          torrent_info=torrent_info,
+                                          torrent_task=torrent_task)
 
-    def __evaluate_proxy_pre_conditions_for_delete(self, site_name: str, torrent_info: dict) -> Tuple[bool, str]:
+    def __evaluate_proxy_pre_conditions_for_delete(self, site_name: str, torrent_info: dict,
+                                                   torrent_task: dict) -> Tuple[bool, str]:
         """
         评估动态删除前置条件并返回是否应删除种子及其原因
         """
-        brush_config = self.__get_brush_config(sitename=site_name)
-
-        reason = "未能满足动态删除设置的前置删除条件"
-
-        if brush_config.download_time and torrent_info.get("downloaded") < torrent_info.get(
-                "total_size") and torrent_info.get("dltime") >= float(brush_config.download_time) * 3600:
-            reason = f"下载耗时 {torrent_info.get('dltime') / 3600:.1f} 小时，大于 {brush_config.download_time} 小时"
-        else:
-            return False, reason
-
-        return True, reason
+        return evaluate_proxy_pre_delete_conditions(brush_config=self.__get_brush_config(sitename=site_name),
+                                                    torrent_info=torrent_info,
+                                                    torrent_task=torrent_task)
 
     def __delete_torrent_for_evaluate_conditions(self, torrents: List[Any], torrent_tasks: Dict[str, dict],
                                                  proxy_delete: bool = False) -> List:
@@ -2776,6 +3837,7 @@ class ZYTBrushFlow(_PluginBase):
                 reason = "触发动态删除阈值，" + reason if proxy_delete else reason
                 self.__send_delete_message(site_name=site_name, torrent_title=torrent_title, torrent_desc=torrent_desc,
                                            reason=reason)
+                self.__note_delete_reason(torrent_hash, reason)
                 logger.info(f"站点：{site_name}，{reason}，删除种子：{torrent_title}|{torrent_desc}")
             else:
                 logger.debug(f"站点：{site_name}，{reason}，不删除种子：{torrent_title}|{torrent_desc}")
@@ -2808,11 +3870,13 @@ class ZYTBrushFlow(_PluginBase):
 
             # 删除种子的具体实现可能会根据实际情况略有不同
             should_delete, reason = self.__evaluate_proxy_pre_conditions_for_delete(site_name=site_name,
-                                                                                    torrent_info=torrent_info)
+                                                                                    torrent_info=torrent_info,
+                                                                                    torrent_task=torrent_task)
             if should_delete:
                 delete_hashes.append(torrent_hash)
                 self.__send_delete_message(site_name=site_name, torrent_title=torrent_title, torrent_desc=torrent_desc,
                                            reason=reason)
+                self.__note_delete_reason(torrent_hash, reason)
                 logger.info(f"站点：{site_name}，{reason}，删除种子：{torrent_title}|{torrent_desc}")
             else:
                 logger.debug(f"站点：{site_name}，{reason}，不删除种子：{torrent_title}|{torrent_desc}")
@@ -2860,13 +3924,13 @@ class ZYTBrushFlow(_PluginBase):
         else:
             logger.info(f"没有找到任何满足动态删除前置条件的种子")
 
-        # 解析删除阈值范围
-        sizes = [float(size) * 1024 ** 3 for size in brush_config.delete_size_range.split("-")]
-        min_size = sizes[0]  # 至少需要达到的做种体积
-        max_size = sizes[1] if len(sizes) > 1 else sizes[0]  # 触发删除操作的做种体积上限
+        # 删除阈值范围已在加载配置时解析
+        delete_size = brush_config.filter.delete_size
+        min_size = delete_size.lower  # 至少需要达到的做种体积
+        max_size = delete_size.upper  # 触发删除操作的做种体积上限
 
         # 判断是否为区间删除
-        proxy_size_range = len(sizes) > 1
+        proxy_size_range = not delete_size.single
 
         # 当总体积未超过最大阈值时，不需要执行删除操作
         if total_torrent_size < max_size:
@@ -2936,6 +4000,7 @@ class ZYTBrushFlow(_PluginBase):
                 torrent_title = torrent_task.get("title", "")
                 torrent_desc = torrent_task.get("description", "")
                 seeding_time = torrent_task.get("seeding_time", 0)
+                self.__note_delete_reason(torrent_hash, "触发动态删除阈值，系统自动删除")
                 if seeding_time:
                     reason = (f"触发动态删除阈值，系统自动删除，做种时间 {seeding_time / 3600:.1f} 小时，"
                               f"当前做种体积 {self.__bytes_to_gb(total_torrent_size):.1f} GB")
@@ -2979,6 +4044,8 @@ class ZYTBrushFlow(_PluginBase):
             # 标记为已删除
             torrent_task["deleted"] = True
             torrent_task["deleted_time"] = time.time()
+            self.__get_site_yield().record_deleted(torrent_task.get("site_name") or "",
+                                                   "无法在下载器中找到对应的种子信息")
             # 处理日志相关内容
             delete_tasks.append(torrent_task)
             site_name = torrent_task.get("site_name", "")
@@ -3019,40 +4086,46 @@ class ZYTBrushFlow(_PluginBase):
             "downloaded": torrent_info.get("downloaded", 0),
             "uploaded": torrent_info.get("uploaded", 0),
             "deleted": False,
-            "time": torrent_info.get("add_on", time.time())
+            "time": torrent_info.get("add_on", time.time()),
+            "downloader": self.service_info.name
         }
         return torrent_task
 
     # endregion
 
-    def __update_and_save_statistic_info(self, torrent_tasks):
+    def __update_and_save_statistic_info(self, torrent_tasks: Dict[str, dict], statistic_info: Dict[str, int]):
         """
         更新并保存统计信息
+        已归档任务的贡献在归档时累加为固定计数，每个周期只需重新计算刷流任务部分
         """
-        total_count, total_uploaded, total_downloaded, total_deleted = 0, 0, 0, 0
-        active_uploaded, active_downloaded, active_count, total_unarchived = 0, 0, 0, 0
+        self.__ensure_archived_statistic(statistic_info=statistic_info)
 
-        statistic_info = self.__get_statistic_info()
-        archived_tasks = self.get_data("archived") or {}
-        combined_tasks = {**torrent_tasks, **archived_tasks}
+        active_uploaded, active_downloaded, active_count, total_unarchived = 0, 0, 0, 0
+        total_count = statistic_info["archived_count"]
+        total_uploaded = statistic_info["archived_uploaded"]
+        total_downloaded = statistic_info["archived_downloaded"]
+        total_deleted = statistic_info["archived_deleted"]
 
-        for task in combined_tasks.values():
-            if task.get("deleted", False):
-                total_deleted += 1
-            total_downloaded += task.get("downloaded", 0)
-            total_uploaded += task.get("uploaded", 0)
+        # 与已归档任务 hash 相同的刷流任务只计入归档部分，与原先合并字典的统计口径保持一致
+        archived_hashes = self.__get_task_store().get("archived", torrent_tasks.keys()).keys()
 
-        # 计算torrent_tasks中未标记为删除的活跃任务的统计信息，及待归档的任务数
-        for task in torrent_tasks.values():
+        for torrent_hash, task in torrent_tasks.items():
+            # 计算未标记为删除的活跃任务的统计信息，及待归档的任务数
             if not task.get("deleted", False):
                 active_uploaded += task.get("uploaded", 0)
                 active_downloaded += task.get("downloaded", 0)
                 active_count += 1
             else:
                 total_unarchived += 1
+            if torrent_hash in archived_hashes:
+                continue
+            total_count += 1
+            if task.get("deleted", False):
+                total_deleted += 1
+            total_downloaded += task.get("downloaded", 0)
+            total_uploaded += task.get("uploaded", 0)
 
         # 更新统计信息
-        total_count = len(combined_tasks)
         statistic_info.update({
             "uploaded": total_uploaded,
             "downloaded": total_downloaded,
@@ -3071,8 +4144,8 @@ class ZYTBrushFlow(_PluginBase):
                     f"总上传量：{StringUtils.str_filesize(total_uploaded)}，"
                     f"总下载量：{StringUtils.str_filesize(total_downloaded)}")
 
-        self.save_data("statistic", statistic_info)
-        self.save_data("torrents", torrent_tasks)
+        self.__save_statistic_info(statistic_info)
+        self.__save_tasks("torrents", torrent_tasks)
 
     def __get_brush_config(self, sitename: str = None) -> BrushConfig:
         """
@@ -3106,7 +4179,8 @@ class ZYTBrushFlow(_PluginBase):
             "seed_inactivetime": "未活动时间",
             "up_speed": "单任务上传限速",
             "dl_speed": "单任务下载限速",
-            "auto_archive_days": "自动清理记录天数"
+            "auto_archive_days": "自动清理记录天数",
+            "site_concurrency": "站点并发获取数"
         }
 
         config_range_number_attr_to_desc = {
@@ -3131,6 +4205,27 @@ class ZYTBrushFlow(_PluginBase):
                 config[attr] = None
                 found_error = True  # 更新错误标志
 
+        config_regex_attr_to_desc = {
+            "include": "包含规则",
+            "exclude": "排除规则"
+        }
+
+        for attr, desc in config_regex_attr_to_desc.items():
+            value = config.get(attr)
+            if value and not self.__is_valid_regex(value):
+                self.__log_and_notify_error(f"站点刷流任务出错，{desc}设置错误：{value}")
+                config[attr] = None
+                found_error = True  # 更新错误标志
+
+        phase_time_budget = config.get("phase_time_budget")
+        if phase_time_budget:
+            try:
+                parse_budgets(phase_time_budget)
+            except ValueError:
+                self.__log_and_notify_error(f"站点刷流任务出错，阶段耗时告警阈值设置错误：{phase_time_budget}")
+                config["phase_time_budget"] = None
+                found_error = True  # 更新错误标志
+
         active_time_range = config.get("active_time_range")
         if active_time_range and not self.__is_valid_time_range_list(time_range=active_time_range):
             self.__log_and_notify_error(f"站点刷流任务出错，开启时间段设置错误：{active_time_range}")
@@ -3161,7 +4256,7 @@ class ZYTBrushFlow(_PluginBase):
             "enabled": brush_config.enabled,
             "notify": brush_config.notify,
             "brushsites": brush_config.brushsites,
-            "downloader": brush_config.downloader,
+            "downloader": brush_config.downloaders,
             "disksize": brush_config.disksize,
             "freeleech": brush_config.freeleech,
             "hr": brush_config.hr,
@@ -3190,12 +4285,16 @@ class ZYTBrushFlow(_PluginBase):
             "delete_except_tags": brush_config.delete_except_tags,
             "except_subscribe": brush_config.except_subscribe,
             "brush_sequential": brush_config.brush_sequential,
+            "brush_yield_weighted": brush_config.brush_yield_weighted,
             "proxy_delete": brush_config.proxy_delete,
+            "del_no_free": brush_config.del_no_free,
             "active_time_range": brush_config.active_time_range,
             "active_time_range_site_config": brush_config.active_time_range_site_config,
             "cron": brush_config.cron,
             "cron_check": brush_config.cron_check,
             "qb_category": brush_config.qb_category,
+            "site_concurrency": brush_config.site_concurrency,
+            "phase_time_budget": brush_config.phase_time_budget,
             "enable_site_config": brush_config.enable_site_config,
             "site_config": brush_config.site_config,
             "_tabs": self._tabs
@@ -3292,22 +4391,17 @@ class ZYTBrushFlow(_PluginBase):
             logger.error(f"Error while resetting downloader URL for torrent: {torrent_url}. Error: {str(e)}")
             return torrent_url
 
-    def __download(self, torrent: TorrentInfo) -> Optional[str]:
+    def __fetch_admission(self, admission: Admission):
         """
-        添加下载任务
+        获取种子下载地址并下载种子文件到内存，下载失败时保留种子地址交由下载器自行下载，在线程池中并发执行
         """
+        torrent = admission.torrent
         if not torrent.enclosure:
-            logger.error(f"获取下载链接失败：{torrent.title}")
-            return None
+            admission.error = "获取下载链接失败"
+            return
 
         brush_config = self.__get_brush_config(torrent.site_name)
 
-        # 上传限速
-        up_speed = int(brush_config.up_speed) if brush_config.up_speed else None
-        # 下载限速
-        down_speed = int(brush_config.dl_speed) if brush_config.dl_speed else None
-        # 保存地址
-        download_dir = brush_config.save_path or None
         # 获取下载链接
         torrent_content = torrent.enclosure
         # proxies
@@ -3322,76 +4416,164 @@ class ZYTBrushFlow(_PluginBase):
             # 目前馒头请求实际种子时，不能传入Cookie
             cookies = None
         if not torrent_content:
-            logger.error(f"获取下载链接失败：{torrent.title}")
-            return None
+            admission.error = "获取下载链接失败"
+            return
 
         if brush_config.site_skip_tips:
             torrent_content = self.__reset_download_url(torrent_url=torrent_content, site_id=torrent.site)
             logger.debug(f"站点 {torrent.site_name} 已启用自动跳过提示，种子下载地址更新为 {torrent_content}")
 
+        admission.url = torrent_content
+        admission.cookies = cookies
+        admission.content = torrent_content
+        # 如果开启代理下载以及种子地址不是磁力地址，则请求种子到内存再传入下载器
+        if not torrent_content.startswith("magnet"):
+            with self.__measure("torrent_download"):
+                response = RequestUtils(cookies=cookies,
+                                        proxies=proxies,
+                                        ua=torrent.site_ua).get_res(url=torrent_content)
+            if response and response.ok and response.content:
+                admission.content = response.content
+                # 种子文件已在内存中时直接本地计算Hash，只有磁力链接或种子地址才需要通过随机Tag反查
+                admission.torrent_hash = get_torrent_id(response.content)
+            else:
+                logger.error(f"尝试通过MP下载种子失败，继续尝试传递种子地址到下载器进行下载：{torrent.title}")
+
+    def __add_admissions(self, items: List[Admission], brush_config: BrushConfig):
+        """
+        将同一站点的种子添加到当前下载器
+        qBittorrent 中已获取种子文件的种子通过一次 torrents_add 批量添加，再按 Hash 核对各种子是否添加成功，
+        其余种子逐个添加，添加成功时设置 torrent_hash，失败时清空
+        """
+        fetched = [item for item in items if item.content]
+        batch = [item for item in fetched if item.has_file and item.torrent_hash] \
+            if self.__get_adapter().is_qbittorrent else []
+        if len(batch) > 1:
+            self.__add_qb_torrents_batch(items=batch, brush_config=brush_config)
+        else:
+            batch = []
+        for item in fetched:
+            if item in batch:
+                continue
+            try:
+                item.torrent_hash = self.__add_torrent(content=item.content, cookies=item.cookies,
+                                                       torrent_hash=item.torrent_hash, brush_config=brush_config)
+            except Exception as e:
+                item.torrent_hash, item.error = None, str(e)
+
+    def __add_qb_torrents_batch(self, items: List[Admission], brush_config: BrushConfig):
+        """
+        通过一次 torrents_add 请求批量添加种子文件，添加前已存在于下载器中的种子视为添加失败
+        """
+        downloader = self.downloader
+        hashes = [item.torrent_hash for item in items]
+        try:
+            qbc = downloader.qbc
+            existing = {torrent.get("hash") for torrent in qbc.torrents_info(torrent_hashes=hashes)}
+        except Exception as e:
+            logger.error(f"{self.service_info.name} 批量添加种子失败：{str(e)}")
+            for item in items:
+                item.torrent_hash, item.error = None, str(e)
+            return
+        pending = []
+        for item in items:
+            if item.torrent_hash in existing:
+                item.torrent_hash, item.error = None, "下载器中已存在相同种子"
+            else:
+                pending.append(item)
+        if not pending:
+            return
+        error = "下载器未添加该种子"
+        try:
+            with self.__measure("downloader_add"):
+                qbc.torrents_add(torrent_files=[item.content for item in pending],
+                                 save_path=brush_config.save_path or None,
+                                 category=brush_config.qb_category,
+                                 tags=["已整理", brush_config.brush_tag],
+                                 upload_limit=int(brush_config.up_speed) * 1024 if brush_config.up_speed else None,
+                                 download_limit=int(brush_config.dl_speed) * 1024 if brush_config.dl_speed else None)
+        except Exception as e:
+            # 请求异常时下载器可能已经添加了部分种子，仍以下载器中的实际结果为准
+            logger.error(f"{self.service_info.name} 批量添加种子请求异常：{str(e)}")
+            error = str(e)
+        added = self.__wait_qb_torrents(qbc, [item.torrent_hash for item in pending])
+        for item in pending:
+            if item.torrent_hash not in added:
+                item.torrent_hash, item.error = None, error
+        logger.info(f"{self.service_info.name} 批量添加种子 {len(pending)} 个，成功 {len(added)} 个")
+
+    def __wait_qb_torrents(self, qbc: Any, hashes: List[str]) -> set:
+        """
+        轮询确认种子已出现在 qBittorrent 中，qBittorrent 添加种子是异步的，添加请求返回时种子可能尚未列出
+        最多等待 _admission_confirm_timeout 秒，返回已确认的种子 hash
+        """
+        found = set()
+        deadline = time.time() + self._admission_confirm_timeout
+        while True:
+            try:
+                found.update(torrent.get("hash") for torrent in
+                             qbc.torrents_info(torrent_hashes=[h for h in hashes if h not in found]))
+            except Exception as e:
+                logger.warning(f"{self.service_info.name} 确认种子添加结果失败：{str(e)}")
+            if len(found) >= len(hashes) or time.time() >= deadline:
+                return found
+            time.sleep(0.5)
+
+    def __add_torrent(self, content: Union[bytes, str], cookies: Optional[str], torrent_hash: Optional[str],
+                      brush_config: BrushConfig) -> Optional[str]:
+        """
+        添加单个下载任务，返回种子Hash
+        """
+        # 上传限速
+        up_speed = int(brush_config.up_speed) if brush_config.up_speed else None
+        # 下载限速
+        down_speed = int(brush_config.dl_speed) if brush_config.dl_speed else None
+        # 保存地址
+        download_dir = brush_config.save_path or None
+
         downloader = self.downloader
         if not downloader:
             return None
 
-        downloader_helper = DownloaderHelper()
-        if downloader_helper.is_downloader("qbittorrent", service=self.service_info):
+        if self.__get_adapter().is_qbittorrent:
             # 限速值转为bytes
             up_speed = up_speed * 1024 if up_speed else None
             down_speed = down_speed * 1024 if down_speed else None
-            # 生成随机Tag
-            tag = StringUtils.generate_random_str(10)
-            # 如果开启代理下载以及种子地址不是磁力地址，则请求种子到内存再传入下载器
-            if not torrent_content.startswith("magnet"):
-                response = RequestUtils(cookies=cookies,
-                                        proxies=proxies,
-                                        ua=torrent.site_ua).get_res(url=torrent_content)
-                if response and response.ok:
-                    torrent_content = response.content
-                else:
-                    logger.error("尝试通过MP下载种子失败，继续尝试传递种子地址到下载器进行下载")
-            if torrent_content:
-                state = downloader.add_torrent(content=torrent_content,
+            tags = ["已整理", brush_config.brush_tag]
+            tag = None
+            if not torrent_hash:
+                tag = StringUtils.generate_random_str(10)
+                tags.append(tag)
+            with self.__measure("downloader_add"):
+                state = downloader.add_torrent(content=content,
                                                download_dir=download_dir,
                                                cookie=cookies,
                                                category=brush_config.qb_category,
-                                               tag=["已整理", brush_config.brush_tag, tag],
+                                               tag=tags,
                                                upload_limit=up_speed,
                                                download_limit=down_speed)
-                if not state:
+            if not state:
+                return None
+            if not torrent_hash:
+                # 获取种子Hash
+                torrent_hash = downloader.get_torrent_id_by_tag(tags=tag)
+                if not torrent_hash:
+                    logger.error(f"{self.service_info.name} 获取种子Hash失败，详细信息请查看 README")
                     return None
-                else:
-                    # 获取种子Hash
-                    torrent_hash = downloader.get_torrent_id_by_tag(tags=tag)
-                    if not torrent_hash:
-                        logger.error(f"{brush_config.downloader} 获取种子Hash失败，详细信息请查看 README")
-                        return None
-                    return torrent_hash
+            return torrent_hash
+
+        with self.__measure("downloader_add"):
+            torrent = downloader.add_torrent(content=content,
+                                             download_dir=download_dir,
+                                             cookie=cookies,
+                                             labels=["已整理", brush_config.brush_tag])
+        if not torrent:
             return None
-
-        elif downloader_helper.is_downloader("transmission", service=self.service_info):
-            # 如果开启代理下载以及种子地址不是磁力地址，则请求种子到内存再传入下载器
-            if not torrent_content.startswith("magnet"):
-                response = RequestUtils(cookies=cookies,
-                                        proxies=proxies,
-                                        ua=torrent.site_ua).get_res(url=torrent_content)
-                if response and response.ok:
-                    torrent_content = response.content
-                else:
-                    logger.error("尝试通过MP下载种子失败，继续尝试传递种子地址到下载器进行下载")
-            if torrent_content:
-                torrent = downloader.add_torrent(content=torrent_content,
-                                                 download_dir=download_dir,
-                                                 cookie=cookies,
-                                                 labels=["已整理", brush_config.brush_tag])
-                if not torrent:
-                    return None
-                else:
-                    if brush_config.up_speed or brush_config.dl_speed:
-                        downloader.change_torrent(hash_string=torrent.hashString,
-                                                  upload_limit=up_speed,
-                                                  download_limit=down_speed)
-                    return torrent.hashString
-        return None
+        if brush_config.up_speed or brush_config.dl_speed:
+            downloader.change_torrent(hash_string=torrent.hashString,
+                                      upload_limit=up_speed,
+                                      download_limit=down_speed)
+        return torrent.hashString
 
     def __qb_torrents_reannounce(self, torrent_hashes: List[str]):
         """强制重新汇报"""
@@ -3416,8 +4598,7 @@ class ZYTBrushFlow(_PluginBase):
         获取种子hash
         """
         try:
-            return torrent.get("hash") if DownloaderHelper().is_downloader("qbittorrent", service=self.service_info) \
-                else torrent.hashString
+            return self.__get_adapter().hash(torrent)
         except Exception as e:
             print(str(e))
             return ""
@@ -3430,15 +4611,8 @@ class ZYTBrushFlow(_PluginBase):
         :return: 包含所有Hash值的列表
         """
         try:
-            all_hashes = []
-            for torrent in torrents:
-                # 根据下载器类型获取Hash值
-                hash_value = torrent.get("hash") if DownloaderHelper().is_downloader("qbittorrent",
-                                                                                         service=self.service_info) \
-                    else torrent.hashString
-                if hash_value:
-                    all_hashes.append(hash_value)
-            return all_hashes
+            adapter = self.__get_adapter()
+            return [hash_value for hash_value in map(adapter.hash, torrents) if hash_value]
         except Exception as e:
             print(str(e))
             return []
@@ -3448,9 +4622,7 @@ class ZYTBrushFlow(_PluginBase):
         获取种子标签
         """
         try:
-            return [str(tag).strip() for tag in torrent.get("tags").split(',')] \
-                if DownloaderHelper().is_downloader("qbittorrent",
-                                                        service=self.service_info) else torrent.labels or []
+            return self.__get_adapter().tags(torrent)
         except Exception as e:
             print(str(e))
             return []
@@ -3459,168 +4631,7 @@ class ZYTBrushFlow(_PluginBase):
         """
         获取种子信息
         """
-        date_now = int(time.time())
-        # QB
-        if DownloaderHelper().is_downloader("qbittorrent", service=self.service_info):
-            """
-            {
-              "added_on": 1693359031,
-              "amount_left": 0,
-              "auto_tmm": false,
-              "availability": -1,
-              "category": "tJU",
-              "completed": 67759229411,
-              "completion_on": 1693609350,
-              "content_path": "/mnt/sdb/qb/downloads/Steel.Division.2.Men.of.Steel-RUNE",
-              "dl_limit": -1,
-              "dlspeed": 0,
-              "download_path": "",
-              "downloaded": 67767365851,
-              "downloaded_session": 0,
-              "eta": 8640000,
-              "f_l_piece_prio": false,
-              "force_start": false,
-              "hash": "116bc6f3efa6f3b21a06ce8f1cc71875",
-              "infohash_v1": "116bc6f306c40e072bde8f1cc71875",
-              "infohash_v2": "",
-              "last_activity": 1693609350,
-              "magnet_uri": "magnet:?xt=",
-              "max_ratio": -1,
-              "max_seeding_time": -1,
-              "name": "Steel.Division.2.Men.of.Steel-RUNE",
-              "num_complete": 1,
-              "num_incomplete": 0,
-              "num_leechs": 0,
-              "num_seeds": 0,
-              "priority": 0,
-              "progress": 1,
-              "ratio": 0,
-              "ratio_limit": -2,
-              "save_path": "/mnt/sdb/qb/downloads",
-              "seeding_time": 615035,
-              "seeding_time_limit": -2,
-              "seen_complete": 1693609350,
-              "seq_dl": false,
-              "size": 67759229411,
-              "state": "stalledUP",
-              "super_seeding": false,
-              "tags": "",
-              "time_active": 865354,
-              "total_size": 67759229411,
-              "tracker": "https://tracker",
-              "trackers_count": 2,
-              "up_limit": -1,
-              "uploaded": 0,
-              "uploaded_session": 0,
-              "upspeed": 0
-            }
-            """
-            # ID
-            torrent_id = torrent.get("hash")
-            # 标题
-            torrent_title = torrent.get("name")
-            # 下载时间
-            if (not torrent.get("added_on")
-                    or torrent.get("added_on") < 0):
-                dltime = 0
-            else:
-                dltime = date_now - torrent.get("added_on")
-            # 做种时间
-            if (not torrent.get("completion_on")
-                    or torrent.get("completion_on") < 0):
-                seeding_time = 0
-            else:
-                seeding_time = date_now - torrent.get("completion_on")
-            # 分享率
-            ratio = torrent.get("ratio") or 0
-            # 上传量
-            uploaded = torrent.get("uploaded") or 0
-            # 平均上传速度 Byte/s
-            if dltime:
-                avg_upspeed = int(uploaded / dltime)
-            else:
-                avg_upspeed = uploaded
-            # 已未活动 秒
-            if (not torrent.get("last_activity")
-                    or torrent.get("last_activity") < 0):
-                iatime = 0
-            else:
-                iatime = date_now - torrent.get("last_activity")
-            # 下载量
-            downloaded = torrent.get("downloaded")
-            # 种子大小
-            total_size = torrent.get("total_size")
-            # 添加时间
-            add_on = (torrent.get("added_on") or 0)
-            add_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(add_on))
-            # 种子标签
-            tags = torrent.get("tags")
-            # tracker
-            tracker = torrent.get("tracker")
-            state = torrent.get("state")
-            if state in ['pausedUP', 'stoppedUP']:
-                dltime = 0
-        # TR
-        else:
-            # ID
-            torrent_id = torrent.hashString
-            # 标题
-            torrent_title = torrent.name
-            # 做种时间
-            if (not torrent.date_done
-                    or torrent.date_done.timestamp() < 1):
-                seeding_time = 0
-            else:
-                seeding_time = date_now - int(torrent.date_done.timestamp())
-            # 下载耗时
-            if (not torrent.date_added
-                    or torrent.date_added.timestamp() < 1):
-                dltime = 0
-            else:
-                dltime = date_now - int(torrent.date_added.timestamp())
-            # 下载量
-            downloaded = int(torrent.total_size * torrent.progress / 100)
-            # 分享率
-            ratio = torrent.ratio or 0
-            # 上传量
-            uploaded = int(downloaded * torrent.ratio)
-            # 平均上传速度
-            if dltime:
-                avg_upspeed = int(uploaded / dltime)
-            else:
-                avg_upspeed = uploaded
-            # 未活动时间
-            if (not torrent.date_active
-                    or torrent.date_active.timestamp() < 1):
-                iatime = 0
-            else:
-                iatime = date_now - int(torrent.date_active.timestamp())
-            # 种子大小
-            total_size = torrent.total_size
-            # 添加时间
-            add_on = (torrent.date_added.timestamp() if torrent.date_added else 0)
-            add_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(add_on))
-            # 种子标签
-            tags = torrent.get("tags")
-            # tracker
-            tracker = torrent.get("tracker")
-
-        return {
-            "hash": torrent_id,
-            "title": torrent_title,
-            "seeding_time": seeding_time,
-            "ratio": ratio,
-            "uploaded": uploaded,
-            "downloaded": downloaded,
-            "avg_upspeed": avg_upspeed,
-            "iatime": iatime,
-            "dltime": dltime,
-            "total_size": total_size,
-            "add_time": add_time,
-            "add_on": add_on,
-            "tags": tags,
-            "tracker": tracker
-        }
+        return self.__get_adapter().torrent_info(torrent=torrent, date_now=int(time.time()))
 
     def __log_and_notify_error(self, message):
         """
@@ -3718,93 +4729,61 @@ class ZYTBrushFlow(_PluginBase):
             logger.info(f"{title}，{msg}")
             self.__send_message(title=title, text=msg)
 
+    def __record_replay(self, method: str, **kwargs):
+        """
+        录制器开启时写入一条刷流输入，录制失败不影响刷流
+        """
+        recorder = self._replay_recorder
+        if not recorder or not recorder.active:
+            return
+        try:
+            getattr(recorder, method)(**kwargs)
+        except Exception as e:
+            logger.error(f"录制刷流输入失败：{e}")
+
     def __get_torrents_size(self) -> int:
         """
         获取任务中的种子总大小
         """
         # 读取种子记录
-        task_info = self.get_data("torrents") or {}
+        task_info = self.__get_tasks("torrents")
         if not task_info:
             return 0
         total_size = sum([task.get("size") or 0 for task in task_info.values()])
         return total_size
 
-    def __get_average_bandwidth(self, sample_count: int = 5, interval: float = 3.0) \
-            -> Tuple[Optional[float], Optional[float]]:
-        if self._pre_time_upload_size == 0 \
-                or self._pre_time_download_size == 0 \
-                or self._pre_time_upload_download == 0:
-            """
-            多次采样上传和下载带宽，取平均值
-            """
-            upload_speeds = []
-            download_speeds = []
-            start_time = time.time()
-            for _ in range(sample_count):
-                downloader_info = self.__get_downloader_info()
-                if downloader_info:
-                    upload_speeds.append(downloader_info.upload_speed or 0)
-                    download_speeds.append(downloader_info.download_speed or 0)
-                # 采样间隔
-                time.sleep(interval)
-            end_time = time.time()
-            total_duration = end_time - start_time
-            if not upload_speeds or not download_speeds:
-                return None, None
-            avg_upload_speed = sum(upload_speeds) / len(upload_speeds) if upload_speeds else 0
-            avg_download_speed = sum(download_speeds) / len(download_speeds) if download_speeds else 0
-            logger.info(f"平均上传带宽 {StringUtils.str_filesize(avg_upload_speed)}, "
-                         f"平均下载带宽 {StringUtils.str_filesize(avg_download_speed)}, "
-                         f"采样次数={sample_count}, 时长={total_duration:.2f} 秒")
-            # 保存数据供下次循环使用
-            downloader_info = self.__get_downloader_info()
-            if downloader_info:
-                self._pre_time_upload_size = downloader_info.upload_size or 0
-                self._pre_time_download_size = downloader_info.download_size or 0
-                self._pre_time_upload_download = end_time
-            return avg_upload_speed, avg_download_speed
-        else:  # 通过两次数据量差值 时间区间计算平均速度
-            cur_downloader_info = self.__get_downloader_info()
-            if not cur_downloader_info:
-                return 0, 0
-            cur_upload_size = cur_downloader_info.upload_size or 0
-            cur_download_size = cur_downloader_info.download_size or 0
-            cur_time = time.time()
-            diff_upload_size = cur_upload_size - self._pre_time_upload_size
-            diff_download_size = cur_download_size - self._pre_time_download_size
-            diff_time = cur_time - self._pre_time_upload_download
-            avg_upload_speed = diff_upload_size/diff_time
-            avg_download_speed = diff_download_size/diff_time
-            logger.info(f"平均上传带宽 {StringUtils.str_filesize(avg_upload_speed)}, "
-                        f"平均下载带宽 {StringUtils.str_filesize(avg_download_speed)}, "
-                        f"上传增量 {StringUtils.str_filesize(diff_upload_size)}, "
-                        f"下载增量 {StringUtils.str_filesize(diff_download_size)}, "
-                        f"时间间隔 ={diff_time: .2f} 秒")
-            # 保存数据供下次循环使用
-            self._pre_time_upload_size = cur_upload_size
-            self._pre_time_download_size = cur_download_size
-            self._pre_time_upload_download = cur_time
-            return avg_upload_speed, avg_download_speed
-
-    def __get_downloader_info(self) -> schemas.DownloaderInfo:
-        """
-        获取下载器实时信息（所有下载器）
-        """
-        ret_info = schemas.DownloaderInfo()
-
-        downloader = self.downloader
-        if not downloader:
-            return ret_info
-
+    def __get_average_bandwidth(self) -> Tuple[Optional[float], Optional[float]]:
+        """
+        获取平均上传下载带宽，读取后台采样器最近窗口内的均值，采样器尚无数据时立即采样一次
+        """
+        sampler = self._bandwidth_sampler
+        if not sampler:
+            speeds = self.__sample_bandwidth()
+            return speeds if speeds else (None, None)
+        if not len(sampler):
+            sampler.sample()
+        avg_upload_speed, avg_download_speed = sampler.mean(window=self._bandwidth_window)
+        if avg_upload_speed is None:
+            return None, None
+        ewma_upload_speed, ewma_download_speed = sampler.ewma()
+        logger.info(f"平均上传带宽 {StringUtils.str_filesize(avg_upload_speed)}, "
+                    f"平均下载带宽 {StringUtils.str_filesize(avg_download_speed)}, "
+                    f"EWMA上传带宽 {StringUtils.str_filesize(ewma_upload_speed)}, "
+                    f"EWMA下载带宽 {StringUtils.str_filesize(ewma_download_speed)}, "
+                    f"采样窗口 {self._bandwidth_window} 秒")
+        return avg_upload_speed, avg_download_speed
+
+    def __sample_bandwidth(self) -> Optional[Tuple[float, float]]:
+        """
+        采样下载器实时速度（所有下载器），返回上传速度、下载速度
+        后台线程周期调用，这里不检查下载器连接状态，避免下载器断开时反复发送通知
+        """
         transfer_infos = self.chain.run_module("downloader_info")
-        if transfer_infos:
-            for transfer_info in transfer_infos:
-                ret_info.download_speed += transfer_info.download_speed
-                ret_info.upload_speed += transfer_info.upload_speed
-                ret_info.download_size += transfer_info.download_size
-                ret_info.upload_size += transfer_info.upload_size
-
-        return ret_info
+        if not transfer_infos:
+            return None
+        upload_speed = sum(transfer_info.upload_speed or 0 for transfer_info in transfer_infos)
+        download_speed = sum(transfer_info.download_speed or 0 for transfer_info in transfer_infos)
+        return upload_speed, download_speed
 
     def __get_qb_up_limit_80_percent(self) -> float:
         """
@@ -3823,49 +4802,111 @@ class ZYTBrushFlow(_PluginBase):
             logger.error(f"获取qb全局上传限速: {e}")
         return 999999999
 
-    def __get_downloading_uploading_count(self) -> int:
+    def __get_downloader_torrents(self, service: ServiceInfo) -> Optional[List[Any]]:
         """
-        获取活动种子数量
+        获取下载器的全量种子列表，失败时返回 None
         """
         try:
-            # brush_config = self.__get_brush_config()
-            downloader = self.downloader
-            if not downloader:
-                return 0
-            # torrents, error = downloader.get_torrents(tags=brush_config.brush_tag)
-            torrents, error = downloader.get_torrents()
-            if error or torrents is None:
-                logger.warning("获取活跃中数量失败，可能是下载器连接发生异常")
-                return 0
-            count = 0
-            for torrent in torrents:
-                if torrent.state in ['downloading', 'uploading'] and torrent.upspeed > 10240:
-                    count = count + 1
-            return count
+            with self.__measure("snapshot"):
+                torrents, error = service.instance.get_torrents()
         except Exception as e:
-            logger.error(f"获取活跃中数量发生异常: {e}")
-            return 0
+            logger.error(f"获取下载器 {service.name} 种子列表发生异常: {e}")
+            return None
+        if error or torrents is None:
+            return None
+        self.__record_replay("record_downloader", torrents=torrents,
+                             is_qbittorrent=self.__get_service_adapter(service).is_qbittorrent, downloader=service.name)
+        return torrents
 
-    def __get_downloading_count(self) -> int:
+    def __get_check_torrents(self, service: ServiceInfo, ids: Optional[List[str]] = None) -> Optional[List[Any]]:
         """
-        获取正在下载的任务数量
+        获取检查刷流任务所需的种子列表，指定 ids 时只获取这些种子，失败时返回 None
+        qBittorrent 只获取带刷流标签的种子，Transmission 获取全部种子但只请求删种判断所需的字段
         """
+        adapter = self.__get_service_adapter(service)
         try:
-            # brush_config = self.__get_brush_config()
-            downloader = self.downloader
-            if not downloader:
-                return 0
+            with self.__measure("snapshot"):
+                torrents = adapter.get_check_torrents(self.__get_client(service, adapter),
+                                                      tag=self.__get_brush_config().brush_tag, ids=ids)
+        except Exception as e:
+            logger.error(f"获取下载器 {service.name} 种子列表发生异常: {e}")
+            return None
+        if not ids:
+            self.__record_replay("record_downloader", torrents=torrents, is_qbittorrent=adapter.is_qbittorrent,
+                                 downloader=service.name)
+        return torrents
+
+    def __get_cascade_torrents(self, service: ServiceInfo) -> Optional[List[Any]]:
+        """
+        获取建立辅种索引所需的全部种子，失败时返回 None
+        """
+        adapter = self.__get_service_adapter(service)
+        try:
+            with self.__measure("snapshot"):
+                return adapter.get_cascade_torrents(self.__get_client(service, adapter))
+        except Exception as e:
+            logger.error(f"获取下载器 {service.name} 辅种列表发生异常: {e}")
+            return None
+
+    @staticmethod
+    def __get_client(service: ServiceInfo, adapter: DownloaderAdapter) -> Any:
+        """
+        下载器底层客户端：qbittorrentapi.Client 或 transmission_rpc.Client
+        """
+        return service.instance.qbc if adapter.is_qbittorrent else service.instance.trc
 
-            # torrents = downloader.get_downloading_torrents(tags=brush_config.brush_tag)
-            torrents = downloader.get_downloading_torrents()
+    def __get_downloader_snapshot(self, service: ServiceInfo, with_load: bool = False) -> DownloaderSnapshot:
+        """
+        获取下载器状态快照，每个刷流周期只拉取一次全量种子列表
+        with_load 时同时获取上传限速与保存路径剩余空间，用于多下载器间分配新任务
+        """
+        is_qbittorrent = self.__get_service_adapter(service).is_qbittorrent
+        try:
+            torrents = self.__get_downloader_torrents(service)
             if torrents is None:
-                logger.warning("获取下载数量失败，可能是下载器连接发生异常")
-                return 0
+                logger.warning(f"获取下载器 {service.name} 种子列表失败，可能是下载器连接发生异常")
+                return DownloaderSnapshot(torrents=None, is_qbittorrent=is_qbittorrent)
+            snapshot = DownloaderSnapshot(
+                torrents=torrents, is_qbittorrent=is_qbittorrent,
+                upload_limit=self.__get_upload_limit(service, is_qbittorrent) if with_load else None,
+                free_space=self.__get_free_space(service, is_qbittorrent) if with_load else None)
+            logger.info(f"已获取下载器 {service.name} 状态快照，种子总数 {len(torrents)}，"
+                        f"下载中 {snapshot.downloading_count}，活动种子 {snapshot.active_count}"
+                        + (f"，剩余空间 {StringUtils.str_filesize(snapshot.free_space)}"
+                           if snapshot.free_space is not None else ""))
+            return snapshot
+        except Exception as e:
+            logger.error(f"获取下载器 {service.name} 状态快照发生异常: {e}")
+            return DownloaderSnapshot(torrents=None, is_qbittorrent=is_qbittorrent)
 
-            return len(torrents)
+    @staticmethod
+    def __get_upload_limit(service: ServiceInfo, is_qbittorrent: bool) -> Optional[float]:
+        """
+        获取下载器全局上传限速 Byte/s，未限速或获取失败时返回 None
+        """
+        try:
+            if is_qbittorrent:
+                upload_limit = service.instance.qbc.app_preferences().up_limit
+                return upload_limit if upload_limit and upload_limit > 0 else None
+            session = service.instance.trc.get_session()
+            if session.speed_limit_up_enabled:
+                return session.speed_limit_up * 1024
         except Exception as e:
-            logger.error(f"获取下载数量发生异常: {e}")
-            return 0
+            logger.debug(f"获取下载器 {service.name} 上传限速失败: {e}")
+        return None
+
+    def __get_free_space(self, service: ServiceInfo, is_qbittorrent: bool) -> Optional[int]:
+        """
+        获取下载器保存路径的剩余空间 Byte，获取失败时返回 None
+        """
+        try:
+            if is_qbittorrent:
+                return service.instance.qbc.sync_maindata().server_state.free_space_on_disk
+            trc = service.instance.trc
+            return trc.free_space(self.__get_brush_config().save_path or trc.get_session().download_dir)
+        except Exception as e:
+            logger.debug(f"获取下载器 {service.name} 剩余空间失败: {e}")
+        return None
 
     @staticmethod
     def __get_pubminutes(pubdate: str) -> float:
@@ -3873,12 +4914,7 @@ class ZYTBrushFlow(_PluginBase):
         将字符串转换为时间，并计算与当前时间差）（分钟）
         """
         try:
-            if not pubdate:
-                return 0
-            pubdate = pubdate.replace("T", " ").replace("Z", "")
-            pubdate = datetime.strptime(pubdate, "%Y-%m-%d %H:%M:%S")
-            now = datetime.now()
-            return (now - pubdate).total_seconds() // 60
+            return get_pubminutes(pubdate)
         except Exception as e:
             logger.error(f"发布时间 {pubdate} 获取分钟失败，错误详情: {e}")
             return 0
@@ -3929,6 +4965,16 @@ class ZYTBrushFlow(_PluginBase):
                 filter_torrents.append(torrent)
         return filter_torrents
 
+    def __get_subscribe_matcher(self) -> KeywordMatcher:
+        """
+        获取订阅标题匹配器，订阅标题集合发生变化时重新构建
+        """
+        subscribe_titles = self.__get_subscribe_titles()
+        if self._subscribe_matcher is None or self._subscribe_matcher.keywords != subscribe_titles:
+            self._subscribe_matcher = KeywordMatcher(subscribe_titles)
+            logger.info(f"订阅标题匹配器已更新，共 {len(self._subscribe_matcher)} 个标题")
+        return self._subscribe_matcher
+
     def __get_subscribe_titles(self) -> Set[str]:
         """
         获取当前订阅的所有标题，返回一个不包含None和空白字符的集合
@@ -3986,7 +5032,7 @@ class ZYTBrushFlow(_PluginBase):
         return unique_titles
 
     @staticmethod
-    def __filter_torrents_contains_subscribe(torrents: Any, subscribe_titles: Set[str]):
+    def __filter_torrents_contains_subscribe(torrents: Any, subscribe_matcher: KeywordMatcher):
         # 初始化两个列表，一个用于收集未被排除的种子，一个用于记录被排除的种子
         included_torrents = []
         excluded_torrents = []
@@ -3997,10 +5043,11 @@ class ZYTBrushFlow(_PluginBase):
             title = torrent.title or ''
             description = torrent.description or ''
 
-            if any(subscribe_title in title or subscribe_title in description for subscribe_title in subscribe_titles):
+            matched_titles = subscribe_matcher.find_all(title, description)
+            if matched_titles:
                 # 如果种子的标题或描述包含订阅标题中的任一项，则记录为被排除
                 excluded_torrents.append(torrent)
-                logger.info(f"命中订阅内容，排除种子：{title}|{description}")
+                logger.info(f"命中订阅内容 {'、'.join(matched_titles)}，排除种子：{title}|{description}")
             else:
                 # 否则，收集为未被排除的种子
                 included_torrents.append(torrent)
@@ -4041,6 +5088,17 @@ class ZYTBrushFlow(_PluginBase):
         except ValueError:
             return False
 
+    @staticmethod
+    def __is_valid_regex(value):
+        """
+        检查字符串是否为有效的正则表达式
+        """
+        try:
+            BrushFilter.compile_pattern(value)
+            return True
+        except re.error:
+            return False
+
     @staticmethod
     def __calculate_seeding_torrents_size(torrent_tasks: Dict[str, dict]) -> float:
         """
@@ -4048,7 +5106,7 @@ class ZYTBrushFlow(_PluginBase):
         """
         return sum(task.get("size", 0) for task in torrent_tasks.values() if not task.get("deleted", False))
 
-    def __auto_archive_tasks(self, torrent_tasks: Dict[str, dict]) -> None:
+    def __auto_archive_tasks(self, torrent_tasks: Dict[str, dict], statistic_info: Dict[str, int]) -> None:
         """
        自动归档已经删除的种子数据
        """
@@ -4056,8 +5114,8 @@ class ZYTBrushFlow(_PluginBase):
             logger.info("自动归档记录天数小于等于0，取消自动归档")
             return
 
-        # 用于存储已删除的数据
-        archived_tasks: Dict[str, dict] = self.get_data("archived") or {}
+        # 本次需要归档的数据
+        archived_tasks: Dict[str, dict] = {}
 
         current_time = time.time()
         archive_threshold_seconds = self._brush_config.auto_archive_days * 86400  # 将天数转换为秒数
@@ -4085,17 +5143,94 @@ class ZYTBrushFlow(_PluginBase):
         for key in keys_to_delete:
             del torrent_tasks[key]
 
-        self.save_data("archived", archived_tasks)
+        if not archived_tasks:
+            return
+
+        # 将归档任务的贡献累加到固定计数中，覆盖同 hash 的旧归档记录时先扣除旧记录的贡献
+        self.__ensure_archived_statistic(statistic_info=statistic_info)
+        replaced_tasks = self.__get_task_store().get("archived", archived_tasks.keys())
+        for task in replaced_tasks.values():
+            self.__accumulate_archived_statistic(statistic_info=statistic_info, task=task, sign=-1)
+        for task in archived_tasks.values():
+            self.__accumulate_archived_statistic(statistic_info=statistic_info, task=task)
+
+        self.__get_task_store().update("archived", archived_tasks)
+
+    def __ensure_archived_statistic(self, statistic_info: Dict[str, int]):
+        """
+        确保统计数据中包含已归档任务的固定计数，旧版本数据缺失时根据归档任务重新计算一次
+        """
+        if all(key in statistic_info for key in self._archived_statistic_keys):
+            return
+        statistic_info.update({key: 0 for key in self._archived_statistic_keys})
+        for task in self.__get_tasks("archived").values():
+            self.__accumulate_archived_statistic(statistic_info=statistic_info, task=task)
+
+    @staticmethod
+    def __accumulate_archived_statistic(statistic_info: Dict[str, int], task: dict, sign: int = 1):
+        """
+        累加（sign=-1 时扣除）单个归档任务对统计数据的贡献
+        """
+        statistic_info["archived_count"] += sign
+        statistic_info["archived_deleted"] += sign if task.get("deleted", False) else 0
+        statistic_info["archived_uploaded"] += sign * (task.get("uploaded") or 0)
+        statistic_info["archived_downloaded"] += sign * (task.get("downloaded") or 0)
 
     def __clear_tasks(self):
         """
         清除统计数据
         彻底重置所有刷流数据，如当前还存在正在做种的刷流任务，待定时检查任务执行后，会自动纳入刷流管理
         """
-        self.save_data("torrents", {})
-        self.save_data("archived", {})
-        self.save_data("unmanaged", {})
-        self.save_data("statistic", {})
+        self.__get_task_store().clear()
+        self.__save_statistic_info({})
+        self._rejection_cache = None
+        self.del_data("rejections")
+        self._site_yield = SiteYieldStats()
+        self.del_data("site_yield")
+
+    def __get_task_store(self) -> TaskStore:
+        """
+        获取刷流任务存储，首次使用时将旧版插件数据中的任务一次性迁移至 SQLite
+        """
+        with self._task_store_lock:
+            if self._task_store:
+                return self._task_store
+            task_store = TaskStore(self.get_data_path() / "tasks.db")
+            legacy_tasks = {bucket: self.get_data(bucket) for bucket in TASK_BUCKETS}
+            if task_store.migrate(legacy_tasks):
+                for bucket, tasks in legacy_tasks.items():
+                    if tasks is not None:
+                        self.del_data(bucket)
+                logger.info(f"刷流任务已迁移至 SQLite 存储，"
+                            f"刷流任务 {len(legacy_tasks.get('torrents') or {})} 条，"
+                            f"归档任务 {len(legacy_tasks.get('archived') or {})} 条，"
+                            f"移出管理任务 {len(legacy_tasks.get('unmanaged') or {})} 条")
+            self._task_store = task_store
+            return task_store
+
+    def __get_tasks(self, bucket: str) -> Dict[str, dict]:
+        """
+        读取指定分组的全部任务
+        """
+        return self.__get_task_store().load(bucket)
+
+    def __save_tasks(self, bucket: str, tasks: Dict[str, dict]):
+        """
+        保存指定分组的任务，只写入发生变化的行，刷流/检查周期内的保存在周期结束时统一提交
+        """
+        self.__get_task_store().save(bucket, tasks)
+
+    def __save_statistic_info(self, statistic_info: Dict[str, int]):
+        """
+        保存统计数据，并使汇总元素缓存失效
+        刷流/检查周期内在任务存储事务提交成功后才保存，避免归档任务回滚后已归档计数仍被累加
+        """
+        self.__get_task_store().after_commit(partial(self.__write_statistic_info, dict(statistic_info)))
+
+    def __write_statistic_info(self, statistic_info: Dict[str, int]):
+        with self.__measure("save_data"):
+            self.save_data("statistic", statistic_info)
+        self._statistic_version += 1
 
     def __get_statistic_info(self) -> Dict[str, int]:
         """
@@ -4109,7 +5244,11 @@ class ZYTBrushFlow(_PluginBase):
             "unarchived": 0,
             "active": 0,
             "active_uploaded": 0,
-            "active_downloaded": 0
+            "active_downloaded": 0,
+            "archived_count": 0,
+            "archived_deleted": 0,
+            "archived_uploaded": 0,
+            "archived_downloaded": 0
         }
         return statistic_info
 
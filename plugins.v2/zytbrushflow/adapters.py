@@ -0,0 +1,108 @@
+from typing import Any, List, Optional, Union
+
+from .rules import get_qb_torrent_info, get_tr_torrent_info
+
+
+class QbittorrentAdapter:
+    """
+    qBittorrent 种子数据读取，种子为 torrents_info 返回的字典
+    """
+    is_qbittorrent = True
+    # 检查时获取的种子列表只包含刷流标签的种子，同步标签与关联辅种需要另外获取
+    check_filtered = True
+
+    @staticmethod
+    def hash(torrent: Any) -> str:
+        return torrent.get("hash")
+
+    @staticmethod
+    def tags(torrent: Any) -> List[str]:
+        tags = torrent.get("tags")
+        return [str(tag).strip() for tag in tags.split(',')] if tags is not None else []
+
+    @staticmethod
+    def size(torrent: Any) -> int:
+        return torrent.get("total_size") or 0
+
+    @staticmethod
+    def state(torrent: Any) -> Optional[str]:
+        return torrent.get("state")
+
+    @staticmethod
+    def torrent_info(torrent: Any, date_now: Optional[int] = None) -> dict:
+        return get_qb_torrent_info(torrent=torrent, date_now=date_now)
+
+    @staticmethod
+    def get_check_torrents(client: Any, tag: str, ids: Optional[List[str]] = None) -> List[Any]:
+        """
+        获取检查刷流任务所需的种子，client 为 qbittorrentapi.Client
+        指定 ids 时获取这些种子（不论是否有刷流标签），否则由 qBittorrent 按刷流标签过滤
+        """
+        if ids:
+            return list(client.torrents_info(torrent_hashes=ids))
+        return list(client.torrents_info(tag=tag))
+
+    @staticmethod
+    def get_cascade_torrents(client: Any) -> List[Any]:
+        """
+        获取建立辅种索引所需的全部种子，qBittorrent 接口不支持指定字段，只在需要删种时获取
+        """
+        return list(client.torrents_info())
+
+
+class TransmissionAdapter:
+    """
+    Transmission 种子数据读取，种子为 transmission_rpc.Torrent
+    """
+    is_qbittorrent = False
+    # Transmission 不支持按标签过滤，检查时获取全部种子，只请求所需字段
+    check_filtered = False
+    # 种子信息（torrent_info）、标签、辅种索引（名称与总大小）以及回放录制（状态与速度）所需字段
+    check_fields = ("id", "hashString", "name", "labels", "status", "totalSize", "percentDone", "sizeWhenDone",
+                    "leftUntilDone", "uploadRatio", "addedDate", "doneDate", "activityDate", "rateUpload",
+                    "rateDownload")
+    cascade_fields = ("id", "hashString", "name", "totalSize")
+
+    @staticmethod
+    def hash(torrent: Any) -> str:
+        return torrent.hashString
+
+    @staticmethod
+    def tags(torrent: Any) -> List[str]:
+        return torrent.labels or []
+
+    @staticmethod
+    def size(torrent: Any) -> int:
+        return torrent.total_size or 0
+
+    @staticmethod
+    def state(torrent: Any) -> Optional[str]:
+        return str(getattr(torrent.status, "value", torrent.status))
+
+    @staticmethod
+    def torrent_info(torrent: Any, date_now: Optional[int] = None) -> dict:
+        return get_tr_torrent_info(torrent=torrent, date_now=date_now)
+
+    @classmethod
+    def get_check_torrents(cls, client: Any, tag: str, ids: Optional[List[str]] = None) -> List[Any]:
+        """
+        获取检查刷流任务所需的种子，client 为 transmission_rpc.Client，只请求 check_fields 字段
+        """
+        return list(client.get_torrents(ids=ids or None, arguments=list(cls.check_fields)))
+
+    @classmethod
+    def get_cascade_torrents(cls, client: Any) -> List[Any]:
+        """
+        获取建立辅种索引所需的全部种子，只请求 hash、名称与总大小
+        """
+        return list(client.get_torrents(arguments=list(cls.cascade_fields)))
+
+
+DownloaderAdapter = Union[QbittorrentAdapter, TransmissionAdapter]
+
+
+def get_adapter(is_qbittorrent: bool) -> DownloaderAdapter:
+    """
+    根据下载器类型获取种子数据读取适配器，每个周期只需判断一次下载器类型
+    """
+    return QbittorrentAdapter() if is_qbittorrent else TransmissionAdapter()
@@ -0,0 +1,66 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+
+class Admission:
+    """
+    待添加到下载器的刷流种子
+    content 为种子文件内容，获取失败时为种子地址（交由下载器自行下载），torrent_hash 为空表示添加失败
+    """
+    __slots__ = ("torrent", "task", "downloader", "url", "cookies", "content", "torrent_hash", "error")
+
+    def __init__(self, torrent: Any, task: dict, downloader: str):
+        self.torrent = torrent
+        self.task = task
+        self.downloader = downloader
+        self.url: Optional[str] = None
+        self.cookies: Optional[str] = None
+        self.content: Optional[Union[bytes, str]] = None
+        self.torrent_hash: Optional[str] = None
+        self.error: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        """
+        添加完成前在重复种子索引中占位使用的键
+        """
+        return f"admission:{id(self)}"
+
+    @property
+    def has_file(self) -> bool:
+        return isinstance(self.content, bytes)
+
+    def __repr__(self):
+        return f"Admission({self.torrent.title!r}, downloader={self.downloader!r}, hash={self.torrent_hash!r})"
+
+
+def fetch_concurrently(items: List[Admission], fetch_func: Callable[[Admission], None],
+                       site_limit: int = 2, max_workers: int = 8):
+    """
+    并发执行 fetch_func 获取种子文件，同一站点同时进行的请求不超过 site_limit 个
+    单个种子获取异常时记录到 error，不影响其他种子
+    """
+    if not items:
+        return
+    semaphores = {item.torrent.site_name: threading.Semaphore(max(1, site_limit)) for item in items}
+
+    def fetch(item: Admission):
+        with semaphores[item.torrent.site_name]:
+            try:
+                fetch_func(item)
+            except Exception as e:
+                item.error = str(e)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+        list(executor.map(fetch, items))
+
+
+def group_by_downloader(items: Iterable[Admission]) -> Dict[str, List[Admission]]:
+    """
+    按下载器分组，保持种子原有顺序
+    """
+    groups: Dict[str, List[Admission]] = {}
+    for item in items:
+        groups.setdefault(item.downloader, []).append(item)
+    return groups
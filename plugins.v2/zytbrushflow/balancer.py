@@ -0,0 +1,42 @@
+from typing import Any, Dict, List, Optional
+
+# 评分权重：剩余上传带宽、活动种子数、剩余空间
+UPLOAD_WEIGHT = 0.5
+ACTIVE_WEIGHT = 0.3
+SPACE_WEIGHT = 0.2
+
+
+def _normalize(values: List[Optional[float]]) -> List[float]:
+    """
+    按候选下载器之间的相对大小归一化到 0~1，未知或全部相同时取中间值
+    """
+    known = [value for value in values if value is not None]
+    if not known:
+        return [0.5] * len(values)
+    low, high = min(known), max(known)
+    if high == low:
+        return [0.5] * len(values)
+    return [0.5 if value is None else (value - low) / (high - low) for value in values]
+
+
+def pick_downloader(loads: Dict[str, Any], required_space: int = 0) -> Optional[str]:
+    """
+    为新增刷流任务选择下载器，loads 为 下载器名称 -> 负载（DownloaderSnapshot），按配置顺序排列
+    获取种子列表失败（快照无效）及剩余空间已知且不足 required_space 的下载器不参与选择，其余按剩余上传带宽、活动种子数、剩余空间综合评分，
+    分数相同时选择配置靠前的下载器，没有可用下载器时返回 None
+    """
+    candidates = [(name, load) for name, load in loads.items()
+                  if load.valid
+                  and (load.free_space is None or load.free_space >= required_space)]
+    if not candidates:
+        return None
+    upload = _normalize([load.upload_headroom for _, load in candidates])
+    # 活动种子越少越好
+    active = _normalize([-load.active_count for _, load in candidates])
+    space = _normalize([load.free_space for _, load in candidates])
+    best_index, best_score = 0, None
+    for index in range(len(candidates)):
+        score = UPLOAD_WEIGHT * upload[index] + ACTIVE_WEIGHT * active[index] + SPACE_WEIGHT * space[index]
+        if best_score is None or score > best_score:
+            best_index, best_score = index, score
+    return candidates[best_index][0]
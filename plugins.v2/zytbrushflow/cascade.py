@@ -0,0 +1,60 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 辅种分组键：(种子名称, 种子总大小)
+SeedKey = Tuple[Any, Any]
+
+
+class CascadeIndex:
+    """
+    辅种关联索引
+    由下载器种子快照一次性建立「名称+总大小 → hash 列表」的多值映射，
+    删除种子时通过字典查找即可找出同一内容的全部辅种
+    """
+
+    def __init__(self, torrents: Dict[str, Any]):
+        # (名称, 总大小) -> 同组 hash 列表，保持下载器中的顺序
+        self._groups: Dict[SeedKey, List[str]] = {}
+        # hash -> (名称, 总大小)
+        self._keys: Dict[str, SeedKey] = {}
+        for torrent_hash, torrent in torrents.items():
+            key = (getattr(torrent, "name", None), getattr(torrent, "total_size", None))
+            self._keys[torrent_hash] = key
+            self._groups.setdefault(key, []).append(torrent_hash)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, torrent_hash: str):
+        return torrent_hash in self._keys
+
+    def key_of(self, torrent_hash: str) -> Optional[SeedKey]:
+        """
+        获取种子的分组键，种子不在快照中时返回 None
+        """
+        return self._keys.get(torrent_hash)
+
+    def group(self, torrent_hash: str) -> List[str]:
+        """
+        获取与种子同组的全部 hash（包含自身），种子不在快照中时只返回自身
+        """
+        key = self._keys.get(torrent_hash)
+        if key is None:
+            return [torrent_hash]
+        return list(self._groups[key])
+
+    def siblings(self, torrent_hash: str) -> List[str]:
+        """
+        获取种子的辅种 hash（不包含自身）
+        """
+        return [sibling for sibling in self.group(torrent_hash) if sibling != torrent_hash]
+
+    def expand(self, hashes: Iterable[str]) -> List[str]:
+        """
+        将待删除种子扩展为包含全部关联辅种的去重列表，原种子在前，辅种在后
+        """
+        hashes = list(dict.fromkeys(hashes))
+        result = dict.fromkeys(hashes)
+        for torrent_hash in hashes:
+            for sibling in self.group(torrent_hash):
+                result.setdefault(sibling)
+        return list(result)
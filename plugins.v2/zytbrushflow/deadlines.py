@@ -0,0 +1,92 @@
+import heapq
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from .rules import get_freedate_timestamp
+
+
+def next_deadline(torrent_task: dict, brush_config: Any, now: float) -> Optional[float]:
+    """
+    刷流任务下一个确定会到达的删种阈值时间戳，没有时返回 None
+    只计算随时间推移必然到达的阈值：促销到期、下载超时、H&R 做种时间，已经过去的阈值由定时检查处理
+    H&R 做种时间按本次检查时的做种时间推算
+    """
+    if torrent_task.get("deleted"):
+        return None
+    deadlines = []
+    incomplete = (torrent_task.get("downloaded") or 0) < (torrent_task.get("size") or 0)
+    if incomplete:
+        if brush_config.del_no_free:
+            deadlines.append(get_freedate_timestamp(torrent_task.get("freedate")))
+        if brush_config.download_time and torrent_task.get("time"):
+            deadlines.append(torrent_task["time"] + float(brush_config.download_time) * 3600)
+    elif torrent_task.get("hit_and_run") and brush_config.hr_seed_time:
+        remaining = float(brush_config.hr_seed_time) * 3600 - (torrent_task.get("seeding_time") or 0)
+        deadlines.append(now + remaining)
+    deadlines = [deadline for deadline in deadlines if deadline and deadline > now]
+    return min(deadlines) if deadlines else None
+
+
+class DeadlineQueue:
+    """
+    刷流任务删种阈值的最小堆，每个任务只保留最新的一个时间点，更新或移除时旧条目在出堆时跳过
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, str]] = []
+        self._deadlines: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._deadlines)
+
+    def push(self, torrent_hash: str, deadline: Optional[float]):
+        """
+        设置任务的阈值时间，为 None 时移除
+        """
+        with self._lock:
+            if deadline is None:
+                self._deadlines.pop(torrent_hash, None)
+                return
+            if self._deadlines.get(torrent_hash) == deadline:
+                return
+            self._deadlines[torrent_hash] = deadline
+            heapq.heappush(self._heap, (deadline, torrent_hash))
+
+    def rebuild(self, deadlines: Dict[str, float]):
+        """
+        以完整的 hash -> 阈值时间 重建堆，清除所有旧条目
+        """
+        with self._lock:
+            self._deadlines = dict(deadlines)
+            self._heap = [(deadline, torrent_hash) for torrent_hash, deadline in self._deadlines.items()]
+            heapq.heapify(self._heap)
+
+    def __discard_stale(self):
+        while self._heap and self._deadlines.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def next_due(self) -> Optional[float]:
+        with self._lock:
+            self.__discard_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float) -> List[str]:
+        """
+        取出所有已到达阈值的任务
+        """
+        due = []
+        with self._lock:
+            while True:
+                self.__discard_stale()
+                if not self._heap or self._heap[0][0] > now:
+                    break
+                _, torrent_hash = heapq.heappop(self._heap)
+                del self._deadlines[torrent_hash]
+                due.append(torrent_hash)
+        return due
+
+    def clear(self):
+        with self._lock:
+            self._heap.clear()
+            self._deadlines.clear()
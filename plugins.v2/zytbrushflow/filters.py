@@ -0,0 +1,115 @@
+import re
+from typing import Any, Optional, Pattern
+
+GB = 1024 ** 3
+
+
+class NumberRange:
+    """
+    预解析的数值范围，配置形如「5」或「5-10」
+    单个数值时按 single_bound 决定作为下限（lower）、上限（upper）或上下限（both）
+    """
+
+    __slots__ = ("lower", "upper", "single")
+
+    def __init__(self, lower: Optional[float], upper: Optional[float], single: bool):
+        self.lower = lower
+        self.upper = upper
+        self.single = single
+
+    @classmethod
+    def parse(cls, value: Any, scale: float = 1, single_bound: str = "lower") -> Optional["NumberRange"]:
+        """
+        解析范围字符串，空值返回 None，格式错误时抛出 ValueError
+        """
+        if value is None or value == "":
+            return None
+        values = [float(item) * scale for item in str(value).split("-")]
+        if len(values) == 1:
+            if single_bound == "upper":
+                return cls(lower=None, upper=values[0], single=True)
+            if single_bound == "both":
+                return cls(lower=values[0], upper=values[0], single=True)
+            return cls(lower=values[0], upper=None, single=True)
+        return cls(lower=values[0], upper=values[1], single=False)
+
+    def contains(self, number: float) -> bool:
+        """
+        判断数值是否在范围内（包含边界）
+        """
+        if self.lower is not None and number < self.lower:
+            return False
+        if self.upper is not None and number > self.upper:
+            return False
+        return True
+
+    def __repr__(self):
+        return f"NumberRange({self.lower}, {self.upper}, single={self.single})"
+
+
+class BrushFilter:
+    """
+    由 BrushConfig 在初始化时编译出的过滤程序
+    范围配置解析为数值上下限，包含/排除规则编译为正则，刷流与删种过程中只执行预编译的判断，
+    配置错误会在加载时抛出异常，而不是在每个种子上重复出错
+    """
+
+    def __init__(self, size: Any = None, seeder: Any = None, pubtime: Any = None,
+                 delete_size_range: Any = None, include: Optional[str] = None, exclude: Optional[str] = None):
+        # 种子大小（GB），单个值为下限
+        self.size = NumberRange.parse(size, scale=GB, single_bound="lower")
+        # 做种人数，单个值为上限
+        self.seeder = NumberRange.parse(seeder, single_bound="upper")
+        # 发布时间（分钟），单个值为上限
+        self.pubtime = NumberRange.parse(pubtime, single_bound="upper")
+        # 动态删种阈值（GB），单个值同时作为上下限
+        self.delete_size = NumberRange.parse(delete_size_range, scale=GB, single_bound="both")
+        # 包含/排除规则
+        self.include = self.compile_pattern(include)
+        self.exclude = self.compile_pattern(exclude)
+
+    @classmethod
+    def from_config(cls, config: Any) -> "BrushFilter":
+        """
+        根据 BrushConfig 编译过滤程序
+        """
+        return cls(size=config.size,
+                   seeder=config.seeder,
+                   pubtime=config.pubtime,
+                   delete_size_range=config.delete_size_range,
+                   include=config.include,
+                   exclude=config.exclude)
+
+    @staticmethod
+    def compile_pattern(pattern: Optional[str]) -> Optional[Pattern]:
+        """
+        编译正则，忽略大小写，空值返回 None，格式错误时抛出 re.error
+        """
+        if not pattern:
+            return None
+        return re.compile(pattern, re.I)
+
+    @staticmethod
+    def __search(pattern: Pattern, title: Optional[str], description: Optional[str]) -> bool:
+        return bool(pattern.search(title or "") or pattern.search(description or ""))
+
+    def match_include(self, title: Optional[str], description: Optional[str]) -> bool:
+        """
+        是否满足包含规则，未配置时视为满足
+        """
+        if not self.include:
+            return True
+        return self.__search(self.include, title, description)
+
+    def match_exclude(self, title: Optional[str], description: Optional[str]) -> bool:
+        """
+        是否命中排除规则，未配置时视为未命中
+        """
+        if not self.exclude:
+            return False
+        return self.__search(self.exclude, title, description)
+
+    def __repr__(self):
+        return (f"BrushFilter(size={self.size}, seeder={self.seeder}, pubtime={self.pubtime}, "
+                f"delete_size={self.delete_size}, include={self.include and self.include.pattern}, "
+                f"exclude={self.exclude and self.exclude.pattern})")
@@ -0,0 +1,140 @@
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple, Union
+
+
+class SiteVisitLimiter(ABC):
+    """
+    站点访问频控，acquire 返回 True 时表示本次允许访问站点并记录一次访问
+    """
+
+    @abstractmethod
+    def acquire(self, site_name: str, check_time: float, downloader: Optional[str] = None) -> bool:
+        pass
+
+
+class LocalSiteVisitLimiter(SiteVisitLimiter):
+    """
+    基于 SQLite 的站点令牌桶频控
+    每个站点一个令牌桶，每 check_time 秒补充一个令牌，最多累积 capacity 个，
+    状态保存在本地文件中，重启后保留，并可在多个下载器实例（插件分身）间共享
+    """
+
+    def __init__(self, path: Union[str, Path], capacity: int = 1):
+        self.path = str(path)
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        with self._lock:
+            conn = self.__connect()
+            try:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS site_visit (
+                        site_name TEXT PRIMARY KEY,
+                        tokens REAL NOT NULL,
+                        updated REAL NOT NULL,
+                        downloader TEXT
+                    )
+                """)
+            finally:
+                conn.close()
+
+    def __connect(self) -> sqlite3.Connection:
+        # 手动控制事务，使用 BEGIN IMMEDIATE 保证多进程间的检查与扣减是原子的
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def __refill(self, row: Optional[Tuple[float, float]], check_time: float, now: float) -> float:
+        """
+        计算当前令牌数，从未访问过的站点令牌桶为满
+        """
+        if not row:
+            return float(self.capacity)
+        tokens, updated = row
+        if check_time <= 0:
+            return float(self.capacity)
+        # 系统时间回拨时不补充令牌
+        return min(float(self.capacity), tokens + max(0.0, now - updated) / check_time)
+
+    def acquire(self, site_name: str, check_time: float, downloader: Optional[str] = None,
+                now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        with self._lock:
+            conn = self.__connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute("SELECT tokens, updated FROM site_visit WHERE site_name = ?",
+                                   (site_name,)).fetchone()
+                tokens = self.__refill(row, check_time, now)
+                if tokens < 1:
+                    conn.execute("ROLLBACK")
+                    return False
+                conn.execute("INSERT OR REPLACE INTO site_visit (site_name, tokens, updated, downloader) "
+                             "VALUES (?, ?, ?, ?)", (site_name, tokens - 1, now, downloader))
+                conn.execute("COMMIT")
+                return True
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            finally:
+                conn.close()
+
+    def wait_time(self, site_name: str, check_time: float, now: Optional[float] = None) -> float:
+        """
+        距离站点下一次允许访问还需等待的秒数
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            conn = self.__connect()
+            try:
+                row = conn.execute("SELECT tokens, updated FROM site_visit WHERE site_name = ?",
+                                   (site_name,)).fetchone()
+            finally:
+                conn.close()
+        tokens = self.__refill(row, check_time, now)
+        return 0.0 if tokens >= 1 else (1 - tokens) * check_time
+
+
+class RemoteSiteVisitLimiter(SiteVisitLimiter):
+    """
+    通过外部频控接口判断，接口返回 {"check_pass": true/false}
+    request_func 与 requests.get 签名一致，接口异常或超时时使用 fallback 的判断结果，未设置 fallback 时视为不允许访问
+    接口允许访问时同样在 fallback 中记录一次访问，保证接口故障后的本地判断与实际访问记录一致
+    log_func 用于记录接口请求失败，插件中传入 logger.info，未传入时不记录
+    """
+
+    def __init__(self, url: str, request_func: Callable[..., Any], fallback: Optional[SiteVisitLimiter] = None,
+                 timeout: Tuple[float, float] = (5, 10), log_func: Callable[[str], Any] = lambda message: None):
+        self.url = url
+        self.request_func = request_func
+        self.fallback = fallback
+        self.timeout = timeout
+        self.log_func = log_func
+
+    def acquire(self, site_name: str, check_time: float, downloader: Optional[str] = None) -> bool:
+        params = {
+            "site_name": site_name,
+            "last_time": datetime.now().replace(microsecond=0).isoformat(),
+            "check_time": check_time,
+            "downloader": downloader,
+            "request_id": str(time.time())
+        }
+        try:
+            response = self.request_func(self.url, params=params, timeout=self.timeout)
+            if response.status_code == 200:
+                check_pass = bool(response.json()["check_pass"])
+                if check_pass and self.fallback:
+                    # 只记录访问，本地令牌不足时仍以接口结果为准
+                    self.fallback.acquire(site_name, check_time, downloader)
+                return check_pass
+            self.log_func(f"频控接口请求失败: {response.status_code} - {response.text}")
+        except Exception as e:
+            self.log_func(f"频控接口请求异常: {str(e)}")
+        if self.fallback:
+            return self.fallback.acquire(site_name, check_time, downloader)
+        return False
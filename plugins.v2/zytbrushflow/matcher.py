@@ -0,0 +1,87 @@
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+
+class KeywordMatcher:
+    """
+    多关键词子串匹配器（Aho-Corasick 自动机）
+    关键词集合变化时重新构建一次，之后每段文本只需线性扫描一遍即可找出其中包含的全部关键词，
+    匹配区分大小写，与 `keyword in text` 的判断结果一致
+    """
+
+    def __init__(self, keywords: Iterable[str] = ()):
+        self.keywords: FrozenSet[str] = frozenset(keyword for keyword in keywords if keyword)
+        # 节点转移表，节点 0 为根节点
+        self._goto: List[Dict[str, int]] = [{}]
+        # 失败指针
+        self._fail: List[int] = [0]
+        # 以该节点结尾的关键词（含经失败指针可达的后缀关键词）
+        self._output: List[List[str]] = [[]]
+        self.__build()
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def __bool__(self):
+        return bool(self.keywords)
+
+    def __build(self):
+        for keyword in self.keywords:
+            node = 0
+            for char in keyword:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                node = next_node
+            self._output[node].append(keyword)
+
+        # 按层广度优先计算失败指针，并合并后缀关键词
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, next_node in self._goto[node].items():
+                queue.append(next_node)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail_next = self._goto[fail].get(char, 0)
+                self._fail[next_node] = fail_next if fail_next != next_node else 0
+                self._output[next_node] = self._output[next_node] + self._output[self._fail[next_node]]
+
+    def __scan(self, text: str):
+        node = 0
+        goto, fail, output = self._goto, self._fail, self._output
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                yield output[node]
+
+    def search(self, *texts: Optional[str]) -> Optional[str]:
+        """
+        返回文本中最先出现的关键词，均未命中时返回 None
+        """
+        if not self.keywords:
+            return None
+        for text in texts:
+            for keywords in self.__scan(text or ""):
+                return keywords[0]
+        return None
+
+    def find_all(self, *texts: Optional[str]) -> List[str]:
+        """
+        返回文本中包含的全部关键词，按首次出现的顺序去重
+        """
+        if not self.keywords:
+            return []
+        found: Dict[str, None] = {}
+        for text in texts:
+            for keywords in self.__scan(text or ""):
+                for keyword in keywords:
+                    found.setdefault(keyword)
+        return list(found)
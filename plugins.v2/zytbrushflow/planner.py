@@ -0,0 +1,148 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def torrent_score(torrent: Any) -> float:
+    """
+    刷流收益评分：下载人数相对做种人数越多、上传系数越高，预期上传越多
+    """
+    demand = ((torrent.peers or 0) + 1) / ((torrent.seeders or 0) + 1)
+    return demand * (torrent.uploadvolumefactor or 1)
+
+
+def rank_torrents(torrents: List[Any], score_func: Callable[[Any], float] = torrent_score) -> List[Any]:
+    """
+    按评分从高到低排列候选种子，分数相同时保持原有顺序（发布时间降序）
+    """
+    return sorted(torrents, key=score_func, reverse=True)
+
+
+class CapacityPlan:
+    """
+    刷流周期开始时根据下载器快照与保种体积一次性计算的剩余容量
+    slots 为各下载器剩余可新增任务数（同时下载任务数与活动种子数上限中较小的余量，未设置上限时为 None 表示不限），
+    byte_budget 为剩余保种体积 Byte（None 表示不限），新增或撤销种子时通过 reserve/release 同步更新快照与余量，
+    带宽为所有下载器合计的平均速度与上限 Byte/s，余量在本周期内不变
+    """
+
+    def __init__(self, snapshots: Dict[str, Any], max_downloading: Optional[int] = None,
+                 max_active: Optional[int] = None, byte_budget: Optional[float] = None,
+                 upload_limit: Optional[float] = None, upload_speed: Optional[float] = None,
+                 download_limit: Optional[float] = None, download_speed: Optional[float] = None):
+        self.snapshots = snapshots
+        self.max_downloading = max_downloading
+        self.max_active = max_active
+        self.byte_budget = byte_budget
+        self.upload_limit = upload_limit
+        self.upload_speed = upload_speed
+        self.download_limit = download_limit
+        self.download_speed = download_speed
+
+    @property
+    def upload_headroom(self) -> Optional[float]:
+        """
+        剩余上传带宽，未设置上限或速度未知时为 None
+        """
+        if self.upload_limit is None or self.upload_speed is None:
+            return None
+        return self.upload_limit - self.upload_speed
+
+    @property
+    def download_headroom(self) -> Optional[float]:
+        if self.download_limit is None or self.download_speed is None:
+            return None
+        return self.download_limit - self.download_speed
+
+    def limit_of(self, name: str) -> Optional[str]:
+        """
+        下载器已达到的上限：maxdlcount 或 maxactivetorrents，获取种子列表失败时为 connection，未达到时返回 None
+        """
+        snapshot = self.snapshots[name]
+        if not snapshot.valid:
+            return "connection"
+        if self.max_downloading and snapshot.downloading_count >= self.max_downloading:
+            return "maxdlcount"
+        if self.max_active and snapshot.active_count >= self.max_active:
+            return "maxactivetorrents"
+        return None
+
+    def slots(self, name: str) -> Optional[int]:
+        snapshot = self.snapshots[name]
+        if not snapshot.valid:
+            return 0
+        remains = []
+        if self.max_downloading:
+            remains.append(self.max_downloading - snapshot.downloading_count)
+        if self.max_active:
+            remains.append(self.max_active - snapshot.active_count)
+        return max(0, min(remains)) if remains else None
+
+    @property
+    def total_slots(self) -> Optional[int]:
+        total = 0
+        for name in self.snapshots:
+            slots = self.slots(name)
+            if slots is None:
+                return None
+            total += slots
+        return total
+
+    def available(self) -> List[str]:
+        """
+        仍有剩余任务数且快照有效的下载器，保持配置顺序
+        """
+        return [name for name in self.snapshots if self.limit_of(name) is None]
+
+    def fits(self, size: float) -> bool:
+        return self.byte_budget is None or size <= self.byte_budget
+
+    @property
+    def exhausted(self) -> bool:
+        """
+        带宽、保种体积或下载器任务数任一用尽时不能再新增任务
+        """
+        return (not self.available()
+                or (self.byte_budget is not None and self.byte_budget <= 0)
+                or (self.upload_headroom is not None and self.upload_headroom <= 0)
+                or (self.download_headroom is not None and self.download_headroom <= 0))
+
+    def reserve(self, name: str, size: float):
+        self.snapshots[name].record_added(size=size)
+        if self.byte_budget is not None:
+            self.byte_budget -= size
+
+    def release(self, name: str, size: float):
+        self.snapshots[name].record_cancelled(size=size)
+        if self.byte_budget is not None:
+            self.byte_budget += size
+
+    def select(self, torrents: List[Any], pick_func: Callable[[List[str], Any], Optional[str]],
+               limit: Optional[int] = None) -> Tuple[List[Tuple[Any, str]], List[Tuple[Any, str]]]:
+        """
+        贪心选择：候选种子按排名依次尝试，体积超出剩余保种体积的种子跳过，继续尝试后续较小的种子，
+        pick_func 从仍有余量的下载器中为种子选择下载器，选中后立即预占容量，没有余量或达到 limit 个时停止
+        返回 ([(种子, 下载器)], [(种子, 未选中原因)])
+        """
+        selected, skipped = [], []
+        for index, torrent in enumerate(torrents):
+            if limit is not None and len(selected) >= limit:
+                skipped.extend((rest, "超过站点本周期新增配额") for rest in torrents[index:])
+                break
+            available = self.available()
+            if not available:
+                skipped.extend((rest, "下载器已达到任务数上限") for rest in torrents[index:])
+                break
+            size = torrent.size or 0
+            if not self.fits(size):
+                skipped.append((torrent, "超过剩余保种体积"))
+                continue
+            name = pick_func(available, torrent)
+            if not name:
+                skipped.append((torrent, "没有剩余空间足够的下载器"))
+                continue
+            self.reserve(name, size)
+            selected.append((torrent, name))
+        return selected, skipped
+
+    def __repr__(self):
+        return (f"CapacityPlan(slots={self.total_slots}, byte_budget={self.byte_budget}, "
+                f"upload_headroom={self.upload_headroom}, download_headroom={self.download_headroom})")
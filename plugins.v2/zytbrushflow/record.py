@@ -0,0 +1,135 @@
+import json
+import sys
+from typing import Any, Dict, List, Optional, Union
+
+# 刷流任务字段，顺序即紧凑存储时的列顺序，只能在末尾追加
+FIELDS = (
+    "site", "site_name", "title", "size", "pubdate", "description", "imdbid", "page_url", "date_elapsed",
+    "freedate", "uploadvolumefactor", "downloadvolumefactor", "hit_and_run", "volume_factor", "freedate_diff",
+    "ratio", "downloaded", "uploaded", "seeding_time", "deleted", "deleted_time", "time",
+    "downloader"
+)
+# 在大量任务间重复出现的字符串字段，加载时驻留以共享同一对象
+INTERNED_FIELDS = frozenset({"site_name", "volume_factor", "freedate", "downloader"})
+
+_FIELD_SET = frozenset(FIELDS)
+
+
+class _Missing:
+    """
+    字段不存在的占位，与值为 None 区分，保证与原字典形式互相转换时不丢失信息
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+def column_path(field: str) -> str:
+    """
+    字段在紧凑存储数组中的 JSON 路径，供 SQL json_extract 使用
+    """
+    return f"$[{FIELDS.index(field) + 1}]"
+
+
+class TaskRecord:
+    """
+    刷流任务记录，使用 __slots__ 代替字典保存固定字段，重复的站点名等字符串驻留共享
+    未知字段保存在 extra 中，与原字典形式可无损互相转换
+    存储形式为数组：[字段存在位图, 各字段值..., extra]，不存在的字段以 null 占位
+    """
+    __slots__ = FIELDS + ("extra",)
+
+    def __init__(self):
+        for field in FIELDS:
+            setattr(self, field, MISSING)
+        self.extra: Optional[Dict[str, Any]] = None
+
+    @staticmethod
+    def __normalize(field: str, value: Any) -> Any:
+        if field in INTERNED_FIELDS and type(value) is str:
+            return sys.intern(value)
+        return value
+
+    @classmethod
+    def from_dict(cls, task: Dict[str, Any]) -> "TaskRecord":
+        record = cls()
+        extra = None
+        for key, value in task.items():
+            if key in _FIELD_SET:
+                setattr(record, key, cls.__normalize(key, value))
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        record.extra = extra
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        task = {}
+        for field in FIELDS:
+            value = getattr(self, field)
+            if value is not MISSING:
+                task[field] = value
+        if self.extra:
+            task.update(self.extra)
+        return task
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _FIELD_SET:
+            value = getattr(self, key)
+            return default if value is MISSING else value
+        return (self.extra or {}).get(key, default)
+
+    def pack(self) -> List[Any]:
+        mask = 0
+        values: List[Any] = [0]
+        for index, field in enumerate(FIELDS):
+            value = getattr(self, field)
+            if value is MISSING:
+                values.append(None)
+            else:
+                mask |= 1 << index
+                values.append(value)
+        values[0] = mask
+        if self.extra:
+            values.append(self.extra)
+        return values
+
+    @classmethod
+    def unpack(cls, packed: List[Any]) -> "TaskRecord":
+        record = cls()
+        mask = packed[0]
+        for index, field in enumerate(FIELDS):
+            if mask & (1 << index):
+                setattr(record, field, cls.__normalize(field, packed[index + 1]))
+        # 字段值均为标量，末尾的对象即为 extra，旧版本写入的数组列数可能更少
+        if len(packed) > 1 and isinstance(packed[-1], dict):
+            record.extra = packed[-1]
+        return record
+
+    def encode(self) -> str:
+        return json.dumps(self.pack(), ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def decode(cls, data: Union[str, bytes]) -> "TaskRecord":
+        """
+        解析存储内容，兼容旧版本的字典形式
+        """
+        value = json.loads(data)
+        if isinstance(value, dict):
+            return cls.from_dict(value)
+        return cls.unpack(value)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, TaskRecord):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"TaskRecord({self.to_dict()!r})"
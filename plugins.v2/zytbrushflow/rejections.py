@@ -0,0 +1,131 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+def torrent_key(torrent: Any) -> str:
+    """
+    种子在站点内的唯一标识，优先使用详情地址，其次为下载地址与标题
+    """
+    return torrent.page_url or torrent.enclosure or torrent.title or ""
+
+
+def torrent_fingerprint(torrent: Any) -> Tuple:
+    """
+    种子可变字段（做种人数、促销状态、H&R），任一变化时需要重新判断刷流条件
+    """
+    return (torrent.seeders, torrent.downloadvolumefactor, torrent.uploadvolumefactor,
+            torrent.hit_and_run, torrent.freedate)
+
+
+class RejectionCache:
+    """
+    各站点已判断过的种子缓存
+    每个站点记录一个高水位（已判断过的最新发布时间与种子），发布时间高于水位的种子一定是新种子，直接完整判断；
+    水位以下的种子按「站点+种子标识」查找不通过原因，可变字段未变化且未过期时沿用上次的结果，
+    缓存按最近使用淘汰，最多保留 capacity 条
+    """
+
+    def __init__(self, capacity: int = 5000, ttl: float = 24 * 3600, signature: Optional[str] = None):
+        self.capacity = capacity
+        self.ttl = ttl
+        # 配置签名，配置变化后缓存失效
+        self.signature = signature
+        # 站点名称 -> (最新发布时间, 种子标识)
+        self._watermarks: Dict[str, Tuple[str, str]] = {}
+        # (站点名称, 种子标识) -> (不通过原因, 可变字段, 过期时间)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, Tuple, float]]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def watermark(self, site_name: str) -> Optional[Tuple[str, str]]:
+        return self._watermarks.get(site_name)
+
+    def is_new(self, site_name: str, torrent: Any) -> bool:
+        """
+        种子发布时间是否高于站点水位，没有发布时间时视为新种子
+        """
+        mark = self._watermarks.get(site_name)
+        if not mark or not torrent.pubdate:
+            return True
+        pubdate, key = mark
+        if torrent.pubdate != pubdate:
+            return torrent.pubdate > pubdate
+        return torrent_key(torrent) != key
+
+    def advance(self, site_name: str, torrent: Any):
+        """
+        种子判断完成后推进站点水位
+        """
+        if not torrent.pubdate:
+            return
+        mark = self._watermarks.get(site_name)
+        if not mark or torrent.pubdate > mark[0]:
+            self._watermarks[site_name] = (torrent.pubdate, torrent_key(torrent))
+
+    def get(self, site_name: str, torrent: Any, now: Optional[float] = None) -> Optional[str]:
+        """
+        获取水位以下种子上次的不通过原因，未缓存、已过期或可变字段变化时返回 None
+        """
+        if self.is_new(site_name, torrent):
+            return None
+        key = (site_name, torrent_key(torrent))
+        entry = self._entries.get(key)
+        if not entry:
+            return None
+        reason, fingerprint, expires = entry
+        if expires <= (time.time() if now is None else now) or fingerprint != torrent_fingerprint(torrent):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return reason
+
+    def put(self, site_name: str, torrent: Any, reason: Optional[str], now: Optional[float] = None):
+        """
+        记录种子的不通过原因，原因是否会随时间变化由调用方判断
+        """
+        if not reason:
+            return
+        key = (site_name, torrent_key(torrent))
+        self._entries[key] = (reason, torrent_fingerprint(torrent), (time.time() if now is None else now) + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def discard(self, site_name: str, torrent: Any):
+        self._entries.pop((site_name, torrent_key(torrent)), None)
+
+    def to_dict(self, now: Optional[float] = None) -> dict:
+        """
+        转换为可持久化的字典，丢弃已过期的条目
+        """
+        now = time.time() if now is None else now
+        return {
+            "signature": self.signature,
+            "watermarks": {site_name: list(mark) for site_name, mark in self._watermarks.items()},
+            "entries": [[site_name, key, reason, list(fingerprint), expires]
+                        for (site_name, key), (reason, fingerprint, expires) in self._entries.items()
+                        if expires > now]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict], capacity: int = 5000, ttl: float = 24 * 3600,
+                  signature: Optional[str] = None) -> "RejectionCache":
+        """
+        从持久化数据恢复，配置签名不一致或数据损坏时返回空缓存
+        """
+        cache = cls(capacity=capacity, ttl=ttl, signature=signature)
+        if not data or data.get("signature") != signature:
+            return cache
+        try:
+            for site_name, mark in (data.get("watermarks") or {}).items():
+                cache._watermarks[site_name] = (mark[0], mark[1])
+            for site_name, key, reason, fingerprint, expires in data.get("entries") or []:
+                cache._entries[(site_name, key)] = (reason, tuple(fingerprint), expires)
+            while len(cache._entries) > capacity:
+                cache._entries.popitem(last=False)
+        except Exception as e:
+            print(str(e))
+            return cls(capacity=capacity, ttl=ttl, signature=signature)
+        return cache
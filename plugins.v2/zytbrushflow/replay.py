@@ -0,0 +1,588 @@
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .cascade import CascadeIndex
+from .filters import GB, BrushFilter
+from .matcher import KeywordMatcher
+from .planner import CapacityPlan, rank_torrents
+from .rules import evaluate_brush_conditions, evaluate_delete_conditions, get_pubminutes, get_qb_torrent_info
+from .snapshot import DownloaderSnapshot
+from .tasks import TaskIndex
+
+# 录制的站点种子字段（TorrentInfo）
+TORRENT_FIELDS = ("site_name", "title", "description", "size", "seeders", "peers", "pubdate", "page_url",
+                  "imdbid", "downloadvolumefactor", "uploadvolumefactor", "hit_and_run", "freedate",
+                  "date_elapsed", "volume_factor", "freedate_diff", "labels")
+# 录制的下载器种子字段，统一为 qBittorrent 格式
+DOWNLOADER_FIELDS = ("hash", "name", "total_size", "state", "upspeed", "dlspeed", "added_on", "completion_on",
+                     "last_activity", "ratio", "uploaded", "downloaded", "tags")
+# Transmission 种子状态 -> qBittorrent 种子状态
+TR_STATE_MAPPING = {
+    "downloading": "downloading",
+    "download pending": "queuedDL",
+    "download_pending": "queuedDL",
+    "seeding": "uploading",
+    "seed pending": "queuedUP",
+    "seed_pending": "queuedUP",
+    "checking": "checkingDL",
+    "check pending": "checkingDL",
+    "check_pending": "checkingDL",
+}
+# 回放所需的配置项及默认值，与 BrushConfig 保持一致
+CONFIG_DEFAULTS = {
+    "freeleech": "free",
+    "hr": "no",
+    "size": None,
+    "seeder": None,
+    "pubtime": None,
+    "include": None,
+    "exclude": None,
+    "delete_size_range": None,
+    "disksize": None,
+    "maxdlcount": None,
+    "maxupspeed": None,
+    "maxdlspeed": None,
+    "maxactivetorrents": None,
+    "seed_time": None,
+    "hr_seed_time": None,
+    "seed_ratio": None,
+    "seed_size": None,
+    "download_time": None,
+    "del_no_free": False,
+    "seed_avgspeed": None,
+    "seed_inactivetime": None,
+    "except_subscribe": True,
+    "site_hr_active": False,
+}
+
+
+def _timestamp(value: Any) -> int:
+    try:
+        return int(value.timestamp()) if value else 0
+    except Exception as e:
+        print(str(e))
+        return 0
+
+
+def normalize_torrent_info(torrent: Any) -> dict:
+    """
+    将站点种子（TorrentInfo）转换为可序列化的字典
+    """
+    return {field: getattr(torrent, field, None) for field in TORRENT_FIELDS}
+
+
+def normalize_downloader_torrent(torrent: Any, is_qbittorrent: bool) -> dict:
+    """
+    将下载器种子转换为 qBittorrent 格式的字典，回放时统一按 qBittorrent 处理
+    """
+    if is_qbittorrent:
+        return {field: torrent.get(field) for field in DOWNLOADER_FIELDS}
+    status = str(getattr(torrent.status, "value", torrent.status))
+    progress = torrent.progress or 0
+    downloaded = int((torrent.total_size or 0) * progress / 100)
+    state = TR_STATE_MAPPING.get(status) or ("stoppedUP" if progress >= 100 else "stoppedDL")
+    return {
+        "hash": torrent.hashString,
+        "name": torrent.name,
+        "total_size": torrent.total_size,
+        "state": state,
+        "upspeed": torrent.rate_upload or 0,
+        "dlspeed": torrent.rate_download or 0,
+        "added_on": _timestamp(torrent.date_added),
+        "completion_on": _timestamp(torrent.date_done),
+        "last_activity": _timestamp(torrent.date_active),
+        "ratio": torrent.ratio or 0,
+        "uploaded": int(downloaded * (torrent.ratio or 0)),
+        "downloaded": downloaded,
+        "tags": ",".join(torrent.labels or []),
+    }
+
+
+class ReplayRecorder:
+    """
+    刷流输入录制器
+    将刷流/检查周期的真实输入（配置、任务、站点种子、下载器种子、带宽）逐行写入 gzip 压缩的 JSON Lines 文件，
+    录制指定数量的周期后自动停止
+    """
+
+    def __init__(self, path: Union[str, Path], cycles: int = 1):
+        self.path = Path(path)
+        self.remaining = max(0, int(cycles))
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        return self.remaining > 0
+
+    def write(self, record_type: str, **data):
+        if not self.active:
+            return
+        line = json.dumps({"type": record_type, **data}, ensure_ascii=False, default=str)
+        with self._lock, gzip.open(self.path, "at", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+    def begin_cycle(self, kind: str, config: dict, site_configs: Dict[str, dict], torrent_tasks: Dict[str, dict],
+                    subscribe_titles: Iterable[str] = ()):
+        """
+        开始录制一个周期，写入周期标记及配置、任务等初始状态
+        """
+        self.write("cycle", kind=kind, time=time.time())
+        self.write("config", config=config, site_configs=site_configs)
+        self.write("subscribe", titles=sorted(subscribe_titles))
+        self.write("tasks", tasks=torrent_tasks)
+
+    def end_cycle(self):
+        """
+        结束当前周期，达到录制周期数后停止写入
+        """
+        self.remaining = max(0, self.remaining - 1)
+
+    def record_downloader(self, torrents: Iterable[Any], is_qbittorrent: bool, downloader: Optional[str] = None):
+        """
+        录制一个下载器的种子列表，多下载器时每个下载器各写入一条，以下载器名称区分
+        """
+        self.write("downloader", downloader=downloader,
+                   torrents=[normalize_downloader_torrent(torrent, is_qbittorrent) for torrent in torrents or []])
+
+    def record_bandwidth(self, upload_speed: Optional[float], download_speed: Optional[float]):
+        self.write("bandwidth", upload_speed=upload_speed, download_speed=download_speed)
+
+    def record_site(self, site_name: str, torrents: Iterable[Any]):
+        self.write("site", site_name=site_name, torrents=[normalize_torrent_info(torrent) for torrent in torrents or []])
+
+
+def load_records(path: Union[str, Path]) -> Iterator[dict]:
+    """
+    逐条读取录制文件
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class ReplayConfig:
+    """
+    回放使用的刷流配置，仅包含刷流与删种判断需要的配置项
+    """
+
+    def __init__(self, config: Optional[dict] = None):
+        config = config or {}
+        for key, default in CONFIG_DEFAULTS.items():
+            setattr(self, key, config.get(key, default))
+        self.filter = BrushFilter.from_config(self)
+
+
+class FakeDownloader:
+    """
+    回放使用的内存下载器，种子数据为 qBittorrent 格式的字典
+    录制的下载器快照作为真实状态，回放中新增的种子以刚开始下载的状态叠加在快照之上
+    """
+
+    def __init__(self, torrents: Optional[Iterable[dict]] = None):
+        self._torrents: Dict[str, dict] = {}
+        self._added: Dict[str, dict] = {}
+        self._deleted = set()
+        self.sync(torrents or [])
+
+    def sync(self, torrents: Iterable[dict]):
+        """
+        使用录制的下载器快照替换当前状态，已在回放中删除的种子不再出现
+        """
+        self._torrents = {torrent["hash"]: dict(torrent) for torrent in torrents
+                          if torrent.get("hash") not in self._deleted}
+        for torrent_hash, torrent in self._added.items():
+            self._torrents.setdefault(torrent_hash, torrent)
+
+    def add(self, torrent: Any, now: float) -> str:
+        torrent_hash = hashlib.sha1(f"{torrent.site_name}|{torrent.title}|{torrent.page_url}".encode()).hexdigest()
+        self._added[torrent_hash] = self._torrents[torrent_hash] = {
+            "hash": torrent_hash,
+            "name": torrent.title,
+            "total_size": torrent.size or 0,
+            "state": "downloading",
+            "upspeed": 0,
+            "dlspeed": 0,
+            "added_on": int(now),
+            "completion_on": 0,
+            "last_activity": int(now),
+            "ratio": 0,
+            "uploaded": 0,
+            "downloaded": 0,
+            "tags": "刷流",
+        }
+        return torrent_hash
+
+    def get_torrents(self) -> List[dict]:
+        return list(self._torrents.values())
+
+    def delete_torrents(self, ids: Iterable[str]):
+        for torrent_hash in ids:
+            self._deleted.add(torrent_hash)
+            self._torrents.pop(torrent_hash, None)
+            self._added.pop(torrent_hash, None)
+
+
+class ReplaySimulator:
+    """
+    刷流/检查决策离线回放
+    使用与插件相同的过滤程序、重复种子索引、订阅匹配、刷流/删种规则与辅种索引，对录制或合成的输入进行决策，
+    不访问站点与下载器，统计每秒决策数、各阶段耗时以及最终新增/删除的种子
+    以下插件行为不在回放范围内：第二轮忽略包含/排除规则的刷流、动态删种、站点访问频控与消息通知
+    多个下载器的种子合并为一个下载器回放，不模拟下载器间的任务分配
+    """
+
+    def __init__(self, config: Optional[dict] = None, site_configs: Optional[Dict[str, dict]] = None,
+                 torrent_tasks: Optional[Dict[str, dict]] = None, downloader: Optional[FakeDownloader] = None,
+                 subscribe_titles: Iterable[str] = ()):
+        self.set_config(config=config, site_configs=site_configs)
+        self.torrent_tasks: Dict[str, dict] = {key: dict(value) for key, value in (torrent_tasks or {}).items()}
+        self.downloader = downloader or FakeDownloader()
+        self.matcher = KeywordMatcher(subscribe_titles)
+        self.admitted: List[str] = []
+        self.deleted: List[str] = []
+        self.decisions = 0
+        self.cycles: Dict[str, int] = defaultdict(int)
+        self.phases: Dict[str, float] = defaultdict(float)
+
+    def set_config(self, config: Optional[dict], site_configs: Optional[Dict[str, dict]] = None):
+        self.config = ReplayConfig(config)
+        self.site_configs = {site_name: ReplayConfig({**(config or {}), **(site_config or {})})
+                             for site_name, site_config in (site_configs or {}).items()}
+
+    def get_config(self, site_name: Optional[str]) -> ReplayConfig:
+        return self.site_configs.get(site_name) or self.config
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] += time.perf_counter() - start
+
+    @staticmethod
+    def __pubminutes_func(now: float):
+        now_datetime = datetime.fromtimestamp(now)
+
+        def pubminutes(pubdate: str) -> float:
+            try:
+                return get_pubminutes(pubdate, now=now_datetime)
+            except ValueError:
+                return 0
+
+        return pubminutes
+
+    def __capacity_plan(self, snapshot: DownloaderSnapshot, torrents_size: float,
+                        bandwidth: Tuple[Optional[float], Optional[float]]) -> CapacityPlan:
+        config = self.config
+        upload_speed, download_speed = bandwidth
+        return CapacityPlan(
+            snapshots={"replay": snapshot},
+            max_downloading=int(config.maxdlcount) if config.maxdlcount else None,
+            max_active=int(config.maxactivetorrents) if config.maxactivetorrents else None,
+            byte_budget=float(config.disksize) * GB - torrents_size if config.disksize else None,
+            upload_limit=float(config.maxupspeed) * 1024 if config.maxupspeed else None,
+            upload_speed=upload_speed,
+            download_limit=float(config.maxdlspeed) * 1024 if config.maxdlspeed else None,
+            download_speed=download_speed)
+
+    def __seeding_size(self) -> float:
+        return sum(task.get("size") or 0 for task in self.torrent_tasks.values() if not task.get("deleted"))
+
+    def brush(self, site_torrents: Iterable[Tuple[str, Iterable[Any]]],
+              bandwidth: Tuple[Optional[float], Optional[float]] = (None, None),
+              now: Optional[float] = None) -> List[str]:
+        """
+        回放一个刷流周期，返回本周期新增的种子 hash
+        """
+        now = now if now is not None else time.time()
+        self.cycles["brush"] += 1
+        admitted = []
+        config = self.config
+        disksize = float(config.disksize) * GB if config.disksize else None
+
+        with self.phase("brush.precondition"):
+            torrents_size = self.__seeding_size()
+            preset_size = config.filter.size.lower if config.filter.size and config.filter.size.lower else 0
+            if disksize and torrents_size + preset_size > disksize:
+                return admitted
+            snapshot = DownloaderSnapshot(torrents=self.downloader.get_torrents(), is_qbittorrent=True)
+            plan = self.__capacity_plan(snapshot=snapshot, torrents_size=torrents_size, bandwidth=bandwidth)
+            if plan.exhausted:
+                return admitted
+
+        with self.phase("brush.index"):
+            task_index = TaskIndex(torrent_tasks=self.torrent_tasks)
+
+        pubminutes_func = self.__pubminutes_func(now)
+        for site_name, torrents in site_torrents:
+            if plan.exhausted:
+                break
+            site_config = self.get_config(site_name)
+            torrents = [torrent if not isinstance(torrent, dict) else SimpleNamespace(**torrent)
+                        for torrent in torrents]
+            if site_config.except_subscribe and self.matcher:
+                with self.phase("brush.subscribe"):
+                    torrents = [torrent for torrent in torrents
+                                if not self.matcher.search(torrent.title, torrent.description)]
+            candidates, candidate_keys = [], set()
+            for torrent in torrents:
+                self.decisions += 1
+                with self.phase("brush.evaluate"):
+                    passed, _ = evaluate_brush_conditions(brush_config=site_config, torrent=torrent,
+                                                          task_index=task_index, ignore_include_exclude=False,
+                                                          pubminutes_func=pubminutes_func)
+                keys = {("title", torrent.title), ("page_url", torrent.page_url or torrent.title)}
+                if passed and not keys & candidate_keys:
+                    candidate_keys.update(keys)
+                    candidates.append(torrent)
+            with self.phase("brush.select"):
+                selected, _ = plan.select(rank_torrents(candidates),
+                                          pick_func=lambda available, _torrent: available[0])
+            for torrent, _ in selected:
+                with self.phase("brush.admit"):
+                    torrent_hash = self.downloader.add(torrent=torrent, now=now)
+                    torrent_task = {
+                        "site_name": site_name,
+                        "title": torrent.title,
+                        "size": torrent.size,
+                        "pubdate": torrent.pubdate,
+                        "description": torrent.description,
+                        "page_url": torrent.page_url,
+                        "hit_and_run": torrent.hit_and_run or site_config.site_hr_active,
+                        "ratio": 0,
+                        "downloaded": 0,
+                        "uploaded": 0,
+                        "seeding_time": 0,
+                        "deleted": False,
+                        "time": now
+                    }
+                    self.torrent_tasks[torrent_hash] = torrent_task
+                    task_index.add(torrent_hash, torrent_task)
+                    admitted.append(torrent_hash)
+        self.admitted.extend(admitted)
+        return admitted
+
+    def check(self, now: Optional[float] = None) -> List[str]:
+        """
+        回放一个检查周期，返回本周期删除的种子 hash（不含关联辅种）
+        """
+        now = now if now is not None else time.time()
+        self.cycles["check"] += 1
+        with self.phase("check.snapshot"):
+            seeding_torrents = {torrent["hash"]: torrent for torrent in self.downloader.get_torrents()}
+
+        need_delete_hashes = []
+        with self.phase("check.evaluate"):
+            for torrent_hash, torrent_task in self.torrent_tasks.items():
+                if torrent_task.get("deleted"):
+                    continue
+                torrent = seeding_torrents.get(torrent_hash)
+                if not torrent:
+                    # 下载器中已不存在的种子标记为删除
+                    torrent_task["deleted"] = True
+                    torrent_task["deleted_time"] = now
+                    continue
+                self.decisions += 1
+                torrent_info = get_qb_torrent_info(torrent=torrent, date_now=int(now))
+                torrent_task.update({
+                    "downloaded": torrent_info.get("downloaded"),
+                    "uploaded": torrent_info.get("uploaded"),
+                    "ratio": torrent_info.get("ratio"),
+                    "seeding_time": torrent_info.get("seeding_time"),
+                })
+                should_delete, _ = evaluate_delete_conditions(
+                    brush_config=self.get_config(torrent_task.get("site_name")),
+                    torrent_info=torrent_info, torrent_task=torrent_task)
+                if should_delete:
+                    need_delete_hashes.append(torrent_hash)
+
+        if need_delete_hashes:
+            with self.phase("check.delete"):
+                cascade_index = CascadeIndex({torrent_hash: SimpleNamespace(name=torrent.get("name"),
+                                                                            total_size=torrent.get("total_size"))
+                                              for torrent_hash, torrent in seeding_torrents.items()})
+                self.downloader.delete_torrents(cascade_index.expand(need_delete_hashes))
+                for torrent_hash in need_delete_hashes:
+                    self.torrent_tasks[torrent_hash]["deleted"] = True
+                    self.torrent_tasks[torrent_hash]["deleted_time"] = now
+        self.deleted.extend(need_delete_hashes)
+        return need_delete_hashes
+
+    def replay(self, records: Iterable[dict]) -> dict:
+        """
+        按录制顺序回放全部周期，返回回放报告
+        """
+        cycle: Optional[dict] = None
+        tasks_loaded = False
+        for record in records:
+            record_type = record.get("type")
+            if record_type == "cycle":
+                self.__run_cycle(cycle)
+                cycle = {"kind": record.get("kind"), "time": record.get("time"), "sites": [],
+                         "bandwidth": (None, None), "downloaders": {}}
+            elif record_type == "config":
+                self.set_config(config=record.get("config"), site_configs=record.get("site_configs"))
+            elif record_type == "subscribe":
+                self.matcher = KeywordMatcher(record.get("titles") or [])
+            elif record_type == "tasks" and not tasks_loaded:
+                # 只使用第一个周期的任务作为初始状态，之后的任务由回放决策产生
+                self.torrent_tasks = {key: dict(value) for key, value in (record.get("tasks") or {}).items()}
+                tasks_loaded = True
+            elif cycle is not None and record_type == "downloader":
+                # 多下载器时按名称分别保存，同一下载器在周期内多次录制时以最后一次为准
+                cycle["downloaders"][record.get("downloader")] = record.get("torrents") or []
+            elif cycle is not None and record_type == "bandwidth":
+                cycle["bandwidth"] = (record.get("upload_speed"), record.get("download_speed"))
+            elif cycle is not None and record_type == "site":
+                cycle["sites"].append((record.get("site_name"), record.get("torrents") or []))
+        self.__run_cycle(cycle)
+        return self.report()
+
+    def __run_cycle(self, cycle: Optional[dict]):
+        if not cycle:
+            return
+        if cycle["downloaders"]:
+            # 回放只模拟一个下载器，多个下载器的种子合并为同一个快照
+            self.downloader.sync([torrent for torrents in cycle["downloaders"].values() for torrent in torrents])
+        if cycle["kind"] == "brush":
+            self.brush(site_torrents=cycle["sites"], bandwidth=cycle["bandwidth"], now=cycle["time"])
+        elif cycle["kind"] == "check":
+            self.check(now=cycle["time"])
+
+    def report(self) -> dict:
+        """
+        回放报告：决策数、每秒决策数、各阶段耗时（秒）、新增与删除的种子
+        """
+        elapsed = sum(self.phases.values())
+        return {
+            "cycles": dict(self.cycles),
+            "decisions": self.decisions,
+            "elapsed": elapsed,
+            "decisions_per_second": self.decisions / elapsed if elapsed else 0,
+            "phases": dict(self.phases),
+            "admitted": list(self.admitted),
+            "deleted": list(self.deleted),
+        }
+
+
+def synthetic_dataset(candidates: int = 10000, tasks: int = 50000, sites: int = 20, seed: int = 0,
+                      now: Optional[float] = None) -> dict:
+    """
+    生成合成数据集：已有刷流任务及对应的下载器种子、各站点的候选种子
+    相同 seed 生成的数据完全一致，可用于回归比较
+    """
+    rng = random.Random(seed)
+    now = int(now if now is not None else time.time())
+    site_names = [f"站点{index}" for index in range(sites)]
+    torrent_tasks, downloader_torrents = {}, []
+    for index in range(tasks):
+        torrent_hash = hashlib.sha1(f"task-{seed}-{index}".encode()).hexdigest()
+        size = rng.randint(1, 80) * GB
+        added_on = now - rng.randint(600, 14 * 86400)
+        completed = rng.random() < 0.9
+        ratio = round(rng.random() * 5, 2) if completed else 0
+        deleted = rng.random() < 0.1
+        torrent_tasks[torrent_hash] = {
+            "site_name": rng.choice(site_names),
+            "title": f"Synthetic.Task.{index}.1080p",
+            "size": size,
+            "description": f"合成任务 {index}",
+            "page_url": f"https://example.com/details/{index}",
+            "hit_and_run": rng.random() < 0.1,
+            "ratio": ratio,
+            "downloaded": size if completed else 0,
+            "uploaded": int(size * ratio),
+            "seeding_time": 0,
+            "deleted": deleted,
+            "time": float(added_on),
+        }
+        if deleted:
+            continue
+        downloader_torrents.append({
+            "hash": torrent_hash,
+            "name": f"Synthetic.Task.{index}.1080p",
+            "total_size": size,
+            "state": "uploading" if completed else "downloading",
+            "upspeed": rng.choice((0, 0, 20480, 204800)),
+            "dlspeed": 0 if completed else 1048576,
+            "added_on": added_on,
+            "completion_on": added_on + rng.randint(60, 3600) if completed else 0,
+            "last_activity": now - rng.randint(0, 3 * 86400),
+            "ratio": ratio,
+            "uploaded": int(size * ratio),
+            "downloaded": size if completed else rng.randint(0, size),
+            "tags": "刷流",
+        })
+
+    task_titles = [task["title"] for task in torrent_tasks.values()]
+    site_torrents = defaultdict(list)
+    for index in range(candidates):
+        site_name = rng.choice(site_names)
+        # 约一成候选种子与已有任务重复
+        title = rng.choice(task_titles) if task_titles and rng.random() < 0.1 else f"Synthetic.Candidate.{index}"
+        site_torrents[site_name].append(SimpleNamespace(
+            site_name=site_name,
+            title=title,
+            description=rng.choice(("中字", "DV HDR", "国语", "")),
+            size=rng.randint(1, 120) * GB,
+            seeders=rng.randint(0, 60),
+            peers=rng.randint(0, 200),
+            pubdate=datetime.fromtimestamp(now - rng.randint(0, 600) * 60).strftime("%Y-%m-%d %H:%M:%S"),
+            page_url=f"https://{site_name}.example.com/details/{index}",
+            imdbid=None,
+            downloadvolumefactor=rng.choice((0, 0, 0, 1)),
+            uploadvolumefactor=rng.choice((1, 1, 2)),
+            hit_and_run=rng.random() < 0.2,
+            freedate=None,
+            date_elapsed=None,
+            volume_factor=None,
+            freedate_diff=None,
+            labels=[],
+        ))
+    return {
+        "now": now,
+        "torrent_tasks": torrent_tasks,
+        "downloader_torrents": downloader_torrents,
+        "site_torrents": [(site_name, site_torrents[site_name]) for site_name in site_names],
+    }
+
+
+# 基准测试默认配置
+BENCHMARK_CONFIG = {
+    "freeleech": "free",
+    "hr": "yes",
+    "size": "1-80",
+    "seeder": "1-30",
+    "pubtime": "0-300",
+    "exclude": "DV",
+    "seed_time": 96,
+    "seed_ratio": 3,
+    "seed_inactivetime": 1440,
+}
+
+
+def run_benchmark(candidates: int = 10000, tasks: int = 50000, sites: int = 20, seed: int = 0,
+                  config: Optional[dict] = None, subscribe_titles: Iterable[str] = ()) -> dict:
+    """
+    在合成数据集上执行一个刷流周期和一个检查周期，返回回放报告
+    """
+    dataset = synthetic_dataset(candidates=candidates, tasks=tasks, sites=sites, seed=seed)
+    simulator = ReplaySimulator(config=config if config is not None else BENCHMARK_CONFIG,
+                                torrent_tasks=dataset["torrent_tasks"],
+                                downloader=FakeDownloader(dataset["downloader_torrents"]),
+                                subscribe_titles=subscribe_titles)
+    simulator.brush(site_torrents=dataset["site_torrents"], now=dataset["now"])
+    simulator.check(now=dataset["now"])
+    return simulator.report()
@@ -0,0 +1,327 @@
+import time
+from datetime import datetime
+from typing import Any, Callable, Optional, Tuple
+
+GB = 1024 ** 3
+
+# 随刷流任务状态变化的不通过原因
+# 包含/排除规则的不通过原因，该规则最后判断，得到这些原因时说明其他刷流条件均已通过
+INCLUDE_EXCLUDE_REASONS = frozenset({"不符合包含规则", "符合排除规则"})
+# 包含/排除规则不通过的种子会进入第二轮，第二轮不再判断发布时间等条件，缓存该原因会让已超过发布时间范围的种子被刷流
+VOLATILE_REASONS = frozenset({"其他站点存在尚未下载完成的相同种子"}) | INCLUDE_EXCLUDE_REASONS
+
+
+def bytes_to_gb(size_in_bytes: float) -> float:
+    """
+    将字节单位的大小转换为 GB
+    """
+    if not size_in_bytes:
+        return 0.0
+    return size_in_bytes / GB
+
+
+def get_pubminutes(pubdate: str, now: Optional[datetime] = None) -> float:
+    """
+    计算发布时间距 now 的分钟数，发布时间为空时返回 0，格式错误时抛出 ValueError
+    """
+    if not pubdate:
+        return 0
+    pubdate = pubdate.replace("T", " ").replace("Z", "")
+    pubdate = datetime.strptime(pubdate, "%Y-%m-%d %H:%M:%S")
+    return ((now or datetime.now()) - pubdate).total_seconds() // 60
+
+
+def get_freedate_timestamp(freedate: Optional[str]) -> Optional[float]:
+    """
+    解析促销到期时间为时间戳，为空或格式错误时返回 None
+    """
+    if not freedate:
+        return None
+    try:
+        return datetime.strptime(str(freedate).replace("T", " ").replace("Z", ""), "%Y-%m-%d %H:%M:%S").timestamp()
+    except ValueError:
+        return None
+
+
+def is_free_expired(torrent_task: dict, torrent_info: dict, now: Optional[float] = None) -> bool:
+    """
+    判断种子促销是否已到期且尚未下载完成
+    """
+    freedate = get_freedate_timestamp(torrent_task.get("freedate"))
+    return (freedate is not None and freedate <= (now or time.time())
+            and torrent_info.get("downloaded") < torrent_info.get("total_size"))
+
+
+def evaluate_duplicate_conditions(torrent: Any, task_index: Any) -> Tuple[bool, Optional[str]]:
+    """
+    判断候选种子是否与刷流任务重复，返回 (是否通过, 不通过原因)
+    """
+    # 排除重复种子
+    # 默认根据标题和站点名称进行排除
+    if task_index.contains_site_title(torrent.site_name, torrent.title):
+        return False, "重复种子"
+
+    # 部分站点标题会上新时携带后缀，这里进一步根据种子详情地址进行排除
+    if torrent.page_url and task_index.contains_site_page_url(torrent.site_name, torrent.page_url):
+        return False, "重复种子"
+
+    # 不同站点如果遇到相同种子，判断前一个种子是否已经在做种，否则排除处理
+    if torrent.title and task_index.contains_unseeded_title_on_other_site(torrent.site_name, torrent.title):
+        return False, "其他站点存在尚未下载完成的相同种子"
+    return True, None
+
+
+def evaluate_brush_conditions(brush_config: Any, torrent: Any, task_index: Any, ignore_include_exclude: bool,
+                              pubminutes_func: Callable[[str], float] = get_pubminutes) -> Tuple[bool, Optional[str]]:
+    """
+    判断候选种子是否满足刷流条件，返回 (是否通过, 不通过原因)
+    brush_config 为种子所属站点的配置，task_index 为当前刷流任务的重复种子索引
+    """
+    passed, reason = evaluate_duplicate_conditions(torrent=torrent, task_index=task_index)
+    if not passed:
+        return passed, reason
+
+    # 促销条件
+    if brush_config.freeleech and torrent.downloadvolumefactor != 0:
+        return False, "非免费种子"
+    if brush_config.freeleech == "2xfree" and torrent.uploadvolumefactor != 2:
+        return False, "非双倍上传种子"
+
+    # H&R
+    if brush_config.hr == "yes" and torrent.hit_and_run:
+        return False, "存在H&R"
+
+    brush_filter = brush_config.filter
+
+    # 种子大小（GB），单个值时为下限
+    if brush_filter.size and not brush_filter.size.contains(torrent.size):
+        if brush_filter.size.single:
+            return False, f"种子大小 {bytes_to_gb(torrent.size):.1f} GB，不符合条件"
+        return False, f"种子大小 {bytes_to_gb(torrent.size):.1f} GB，不在指定范围内"
+
+    # 做种人数，单个值时做种人数需要小于等于该数字，范围值时包括边界
+    if brush_filter.seeder and not brush_filter.seeder.contains(torrent.seeders):
+        if brush_filter.seeder.single:
+            return False, f"做种人数 {torrent.seeders}，超过单个指定值"
+        return False, f"做种人数 {torrent.seeders}，不在指定范围内"
+
+    # 发布时间
+    # 已支持独立站点配置，取消单独适配站点时区逻辑，可通过配置项「pubtime」自行适配
+    if brush_filter.pubtime:
+        pubdate_minutes = pubminutes_func(torrent.pubdate)
+        # 单个值：选择发布时间小于等于该值的种子；范围值：选择发布时间在范围内的种子
+        if not brush_filter.pubtime.contains(pubdate_minutes):
+            if brush_filter.pubtime.single:
+                return False, f"发布时间 {torrent.pubdate}，{pubdate_minutes:.0f} 分钟前，不符合条件"
+            return False, f"发布时间 {torrent.pubdate}，{pubdate_minutes:.0f} 分钟前，不在指定范围内"
+
+    # 这个条件要放在最后,结果用在第二轮循环上,第一轮获取官种后下载数量不够就第二轮再筛选一次
+    if not ignore_include_exclude:
+        # 包含规则
+        if not brush_filter.match_include(torrent.title, torrent.description):
+            return False, "不符合包含规则"
+
+        # 排除规则
+        if brush_filter.match_exclude(torrent.title, torrent.description):
+            return False, "符合排除规则"
+    return True, None
+
+
+def is_stable_rejection(brush_config: Any, torrent: Any, reason: Optional[str],
+                        pubminutes_func: Callable[[str], float] = get_pubminutes) -> bool:
+    """
+    判断刷流条件的不通过原因在种子可变字段（做种人数、促销状态）不变时是否保持不变，可用于缓存判断结果
+    发布时间只有已超过范围上限时才不会再变化，尚未达到下限的种子随时间推移仍可能通过
+    """
+    if not reason or reason in VOLATILE_REASONS:
+        return False
+    if reason.startswith("发布时间"):
+        pubtime = brush_config.filter.pubtime
+        return bool(pubtime) and pubtime.upper is not None and pubminutes_func(torrent.pubdate) > pubtime.upper
+    return True
+
+
+def evaluate_delete_conditions(brush_config: Any, torrent_info: dict, torrent_task: dict) -> Tuple[bool, str]:
+    """
+    评估删除条件并返回是否应删除种子及其原因
+    """
+    reason = "未能满足设置的删除条件"
+
+    # 当配置了H&R做种时间/分享率时，则H&R种子只有达到预期行为时，才会进行删除，如果没有配置H&R做种时间/分享率，则普通种子的删除规则也适用于H&R种子
+    # 判断是否为H&R种子并且是否配置了特定的H&R条件
+    hit_and_run = torrent_task.get("hit_and_run", False)
+    hr_specific_conditions_configured = hit_and_run and (brush_config.hr_seed_time or brush_config.seed_ratio)
+    if hr_specific_conditions_configured:
+        if (brush_config.hr_seed_time and torrent_info.get("seeding_time")
+                >= float(brush_config.hr_seed_time) * 3600):
+            return True, (f"H&R种子，做种时间 {torrent_info.get('seeding_time') / 3600:.1f} 小时，"
+                          f"大于 {brush_config.hr_seed_time} 小时")
+        if brush_config.seed_ratio and torrent_info.get("ratio") >= float(brush_config.seed_ratio):
+            return True, f"H&R种子，分享率 {torrent_info.get('ratio'):.2f}，大于 {brush_config.seed_ratio}"
+        return False, "H&R种子，未能满足设置的H&R删除条件"
+
+    # 处理其他场景，1. 不是H&R种子；2. 是H&R种子但没有特定条件配置
+    reason = reason if not hit_and_run else "H&R种子（未设置H&R条件），未能满足设置的删除条件"
+    if brush_config.seed_time and torrent_info.get("seeding_time") >= float(brush_config.seed_time) * 3600:
+        reason = f"做种时间 {torrent_info.get('seeding_time') / 3600:.1f} 小时，大于 {brush_config.seed_time} 小时"
+    elif brush_config.seed_ratio and torrent_info.get("ratio") >= float(brush_config.seed_ratio):
+        reason = f"分享率 {torrent_info.get('ratio'):.2f}，大于 {brush_config.seed_ratio}"
+    elif brush_config.seed_size and torrent_info.get("uploaded") >= float(brush_config.seed_size) * GB:
+        reason = f"上传量 {torrent_info.get('uploaded') / GB:.1f} GB，大于 {brush_config.seed_size} GB"
+    elif brush_config.del_no_free and is_free_expired(torrent_task, torrent_info):
+        reason = f"促销已于 {torrent_task.get('freedate')} 到期，种子尚未下载完成"
+    elif brush_config.download_time and torrent_info.get("downloaded") < torrent_info.get(
+            "total_size") and torrent_info.get("dltime") >= float(brush_config.download_time) * 3600:
+        reason = f"下载耗时 {torrent_info.get('dltime') / 3600:.1f} 小时，大于 {brush_config.download_time} 小时"
+    elif brush_config.seed_avgspeed and torrent_info.get("avg_upspeed") <= float(
+            brush_config.seed_avgspeed) * 1024 and torrent_info.get("seeding_time") >= 30 * 60:
+        reason = f"平均上传速度 {torrent_info.get('avg_upspeed') / 1024:.1f} KB/s，低于 {brush_config.seed_avgspeed} KB/s"
+    elif brush_config.seed_inactivetime and torrent_info.get("iatime") >= float(
+            brush_config.seed_inactivetime) * 60:
+        reason = f"未活动时间 {torrent_info.get('iatime') / 60:.0f} 分钟，大于 {brush_config.seed_inactivetime} 分钟"
+    else:
+        return False, reason
+
+    return True, reason if not hit_and_run else "H&R种子（未设置H&R条件），" + reason
+
+
+def evaluate_proxy_pre_delete_conditions(brush_config: Any, torrent_info: dict,
+                                         torrent_task: Optional[dict] = None) -> Tuple[bool, str]:
+    """
+    评估动态删除前置条件并返回是否应删除种子及其原因
+    """
+    reason = "未能满足动态删除设置的前置删除条件"
+
+    if brush_config.del_no_free and torrent_task and is_free_expired(torrent_task, torrent_info):
+        reason = f"促销已于 {torrent_task.get('freedate')} 到期，种子尚未下载完成"
+    elif brush_config.download_time and torrent_info.get("downloaded") < torrent_info.get(
+            "total_size") and torrent_info.get("dltime") >= float(brush_config.download_time) * 3600:
+        reason = f"下载耗时 {torrent_info.get('dltime') / 3600:.1f} 小时，大于 {brush_config.download_time} 小时"
+    else:
+        return False, reason
+
+    return True, reason
+
+
+def get_qb_torrent_info(torrent: Any, date_now: Optional[int] = None) -> dict:
+    """
+    根据 qBittorrent 种子数据计算删种判断所需的种子信息
+    """
+    date_now = int(date_now if date_now is not None else time.time())
+    # ID
+    torrent_id = torrent.get("hash")
+    # 标题
+    torrent_title = torrent.get("name")
+    # 下载时间
+    if (not torrent.get("added_on")
+            or torrent.get("added_on") < 0):
+        dltime = 0
+    else:
+        dltime = date_now - torrent.get("added_on")
+    # 做种时间
+    if (not torrent.get("completion_on")
+            or torrent.get("completion_on") < 0):
+        seeding_time = 0
+    else:
+        seeding_time = date_now - torrent.get("completion_on")
+    # 分享率
+    ratio = torrent.get("ratio") or 0
+    # 上传量
+    uploaded = torrent.get("uploaded") or 0
+    # 平均上传速度 Byte/s
+    if dltime:
+        avg_upspeed = int(uploaded / dltime)
+    else:
+        avg_upspeed = uploaded
+    # 已未活动 秒
+    if (not torrent.get("last_activity")
+            or torrent.get("last_activity") < 0):
+        iatime = 0
+    else:
+        iatime = date_now - torrent.get("last_activity")
+    # 下载量
+    downloaded = torrent.get("downloaded")
+    # 种子大小
+    total_size = torrent.get("total_size")
+    # 添加时间
+    add_on = (torrent.get("added_on") or 0)
+    add_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(add_on))
+    if torrent.get("state") in ['pausedUP', 'stoppedUP']:
+        dltime = 0
+    return {
+        "hash": torrent_id,
+        "title": torrent_title,
+        "seeding_time": seeding_time,
+        "ratio": ratio,
+        "uploaded": uploaded,
+        "downloaded": downloaded,
+        "avg_upspeed": avg_upspeed,
+        "iatime": iatime,
+        "dltime": dltime,
+        "total_size": total_size,
+        "add_time": add_time,
+        "add_on": add_on,
+        "tags": torrent.get("tags"),
+        "tracker": torrent.get("tracker")
+    }
+
+
+def get_tr_torrent_info(torrent: Any, date_now: Optional[int] = None) -> dict:
+    """
+    根据 Transmission 种子数据计算删种判断所需的种子信息
+    """
+    date_now = int(date_now if date_now is not None else time.time())
+    # ID
+    torrent_id = torrent.hashString
+    # 标题
+    torrent_title = torrent.name
+    # 做种时间
+    if (not torrent.date_done
+            or torrent.date_done.timestamp() < 1):
+        seeding_time = 0
+    else:
+        seeding_time = date_now - int(torrent.date_done.timestamp())
+    # 下载耗时
+    if (not torrent.date_added
+            or torrent.date_added.timestamp() < 1):
+        dltime = 0
+    else:
+        dltime = date_now - int(torrent.date_added.timestamp())
+    # 下载量
+    downloaded = int(torrent.total_size * torrent.progress / 100)
+    # 分享率
+    ratio = torrent.ratio or 0
+    # 上传量
+    uploaded = int(downloaded * torrent.ratio)
+    # 平均上传速度
+    if dltime:
+        avg_upspeed = int(uploaded / dltime)
+    else:
+        avg_upspeed = uploaded
+    # 未活动时间
+    if (not torrent.date_active
+            or torrent.date_active.timestamp() < 1):
+        iatime = 0
+    else:
+        iatime = date_now - int(torrent.date_active.timestamp())
+    # 种子大小
+    total_size = torrent.total_size
+    # 添加时间
+    add_on = (torrent.date_added.timestamp() if torrent.date_added else 0)
+    add_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(add_on))
+    return {
+        "hash": torrent_id,
+        "title": torrent_title,
+        "seeding_time": seeding_time,
+        "ratio": ratio,
+        "uploaded": uploaded,
+        "downloaded": downloaded,
+        "avg_upspeed": avg_upspeed,
+        "iatime": iatime,
+        "dltime": dltime,
+        "total_size": total_size,
+        "add_time": add_time,
+        "add_on": add_on,
+        "tags": torrent.get("tags"),
+        "tracker": torrent.get("tracker")
+    }
@@ -0,0 +1,123 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 采样函数返回 (上传速度, 下载速度)，单位 Byte/s，失败时返回 None
+SampleFunc = Callable[[], Optional[Tuple[float, float]]]
+
+
+class BandwidthSampler:
+    """
+    下载器带宽后台采样器
+    以固定间隔将上传/下载速度写入定长环形缓冲区，刷流判断时直接读取窗口均值或 EWMA，不再阻塞等待采样
+    """
+
+    def __init__(self, sample_func: SampleFunc, interval: float = 3.0, capacity: int = 200,
+                 alpha: float = 0.2, name: str = "BandwidthSampler"):
+        self._sample_func = sample_func
+        self.interval = interval
+        self.alpha = alpha
+        self._name = name
+        # (时间戳, 上传速度, 下载速度)
+        self._samples: deque = deque(maxlen=capacity)
+        self._ewma: Optional[Tuple[float, float]] = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def start(self):
+        """
+        启动采样线程，已在运行时忽略
+        """
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.__run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        停止采样线程
+        """
+        self._stop_event.set()
+        thread = self._thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=timeout if timeout is not None else self.interval + 1)
+        self._thread = None
+
+    def __run(self):
+        while not self._stop_event.is_set():
+            self.sample()
+            self._stop_event.wait(self.interval)
+
+    def sample(self) -> bool:
+        """
+        立即采样一次并写入缓冲区，返回是否采样成功
+        """
+        try:
+            speeds = self._sample_func()
+        except Exception as e:
+            print(str(e))
+            speeds = None
+        if not speeds:
+            return False
+        self.record(*speeds)
+        return True
+
+    def record(self, upload_speed: float, download_speed: float, timestamp: Optional[float] = None):
+        """
+        写入一次采样结果并更新 EWMA
+        """
+        upload_speed = float(upload_speed or 0)
+        download_speed = float(download_speed or 0)
+        with self._lock:
+            self._samples.append((timestamp if timestamp is not None else time.time(),
+                                  upload_speed, download_speed))
+            if self._ewma is None:
+                self._ewma = (upload_speed, download_speed)
+            else:
+                pre_upload, pre_download = self._ewma
+                self._ewma = (pre_upload + self.alpha * (upload_speed - pre_upload),
+                              pre_download + self.alpha * (download_speed - pre_download))
+
+    def __len__(self):
+        with self._lock:
+            return len(self._samples)
+
+    def ewma(self) -> Tuple[Optional[float], Optional[float]]:
+        """
+        指数加权平均速度，尚无采样时返回 (None, None)
+        """
+        with self._lock:
+            return self._ewma if self._ewma is not None else (None, None)
+
+    def mean(self, window: Optional[float] = None) -> Tuple[Optional[float], Optional[float]]:
+        """
+        最近 window 秒内的平均速度，window 为空时取全部缓冲区，尚无采样时返回 (None, None)
+        """
+        with self._lock:
+            samples = list(self._samples)
+        if window is not None and samples:
+            since = samples[-1][0] - window
+            samples = [sample for sample in samples if sample[0] >= since]
+        if not samples:
+            return None, None
+        count = len(samples)
+        return (sum(sample[1] for sample in samples) / count,
+                sum(sample[2] for sample in samples) / count)
+
+    def history(self, window: Optional[float] = None) -> List[Dict[str, float]]:
+        """
+        最近的采样记录，按时间正序
+        """
+        with self._lock:
+            samples = list(self._samples)
+        if window is not None and samples:
+            since = samples[-1][0] - window
+            samples = [sample for sample in samples if sample[0] >= since]
+        return [{"time": ts, "upload_speed": up, "download_speed": down} for ts, up, down in samples]
@@ -0,0 +1,197 @@
+import math
+import random
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from .rules import GB
+
+# 删种原因分类：(原因关键字, 分类名称)，按顺序匹配第一个包含关键字的分类
+REASON_CATEGORIES = (
+    ("系统自动删除", "动态删种"),
+    ("促销", "促销到期"),
+    ("下载耗时", "下载超时"),
+    ("平均上传速度", "上传速度过低"),
+    ("未活动时间", "未活动"),
+    ("做种时间", "做种时间"),
+    ("分享率", "分享率"),
+    ("上传量", "上传量"),
+    ("无法在下载器中找到", "下载器中已删除"),
+)
+
+# 计算站点权重时的先验下载量，下载量较少的站点权重向所有站点的平均值收敛
+PRIOR_DOWNLOADED = 10 * GB
+# 站点最小权重，收益为 0 的站点仍有机会被选中
+MIN_WEIGHT = 0.01
+
+
+def reason_category(reason: Optional[str]) -> str:
+    """
+    将删种原因归类，原因中的具体数值不同也归为同一类
+    """
+    for keyword, category in REASON_CATEGORIES:
+        if reason and keyword in reason:
+            return category
+    return "其他"
+
+
+def weighted_order(items: List[Any], weights: Dict[Any, float], rng: Any = random) -> List[Any]:
+    """
+    按权重随机排序（不放回加权抽样），权重越高越可能排在前面，权重相同时等同于随机打乱
+    """
+    keys = {id(item): rng.random() ** (1 / max(weights.get(item, 1.0), MIN_WEIGHT)) for item in items}
+    return sorted(items, key=lambda item: keys[id(item)], reverse=True)
+
+
+def site_quotas(site_names: List[str], weights: Dict[str, float], total: Optional[int]) -> Dict[str, int]:
+    """
+    按权重将本周期可新增的任务数分配给各站点，每个站点至少 1 个，total 为 None（不限）时不分配
+    """
+    if total is None or not site_names:
+        return {}
+    weight_sum = sum(weights.get(site_name, 1.0) for site_name in site_names)
+    return {site_name: max(1, math.ceil(total * weights.get(site_name, 1.0) / weight_sum))
+            for site_name in site_names}
+
+
+class SiteYieldStats:
+    """
+    各站点刷流收益统计
+    检查任务时按上传量、下载量的增量累计，任务首次达到分享率 1 时累计耗时，删除种子时按原因分类计数，
+    只保存累计值，不需要遍历历史任务
+    刷流/检查线程更新统计时，仪表盘请求线程可能同时读取，读写均需持有锁
+    """
+
+    def __init__(self):
+        # 站点名称 -> 累计值
+        self._sites: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        # 统计数据版本，每次更新时递增，仪表盘据此判断是否需要重新组装
+        self.version = 0
+
+    def __len__(self):
+        return len(self._sites)
+
+    def __contains__(self, site_name: str):
+        return site_name in self._sites
+
+    def __site(self, site_name: str) -> dict:
+        return self._sites.setdefault(site_name, {"tasks": 0, "uploaded": 0, "downloaded": 0,
+                                                  "ratio_one_count": 0, "ratio_one_seconds": 0.0, "reasons": {}})
+
+    def record_added(self, site_name: str):
+        with self._lock:
+            self.__site(site_name)["tasks"] += 1
+            self.version += 1
+
+    def record_progress(self, site_name: str, torrent_task: dict, torrent_info: dict, now: float):
+        """
+        按任务上次记录的上传量、下载量与分享率累计增量，需要在更新任务状态之前调用
+        """
+        with self._lock:
+            site = self.__site(site_name)
+            site["uploaded"] += max(0, (torrent_info.get("uploaded") or 0) - (torrent_task.get("uploaded") or 0))
+            site["downloaded"] += max(0, (torrent_info.get("downloaded") or 0) - (torrent_task.get("downloaded") or 0))
+            if (torrent_task.get("ratio") or 0) < 1 <= (torrent_info.get("ratio") or 0) and torrent_task.get("time"):
+                site["ratio_one_count"] += 1
+                site["ratio_one_seconds"] += max(0.0, now - torrent_task["time"])
+            self.version += 1
+
+    def record_deleted(self, site_name: str, reason: Optional[str]):
+        category = reason_category(reason)
+        with self._lock:
+            reasons = self.__site(site_name)["reasons"]
+            reasons[category] = reasons.get(category, 0) + 1
+            self.version += 1
+
+    def upload_per_gb(self, site_name: str) -> Optional[float]:
+        """
+        每 GB 下载带来的上传量 GB，尚无下载量时返回 None
+        """
+        with self._lock:
+            site = self._sites.get(site_name)
+            if not site or site["downloaded"] <= 0:
+                return None
+            return site["uploaded"] / site["downloaded"]
+
+    def ratio_one_hours(self, site_name: str) -> Optional[float]:
+        """
+        任务从添加到分享率达到 1 的平均耗时（小时）
+        """
+        with self._lock:
+            site = self._sites.get(site_name)
+            if not site or not site["ratio_one_count"]:
+                return None
+            return site["ratio_one_seconds"] / site["ratio_one_count"] / 3600
+
+    def weights(self, site_names: Iterable[str]) -> Dict[str, float]:
+        """
+        站点权重：每 GB 下载带来的上传量，按 PRIOR_DOWNLOADED 的先验下载量向所有站点的平均值平滑，
+        没有任何下载数据时所有站点权重均为 1
+        """
+        sites = self.__copy()
+        uploaded = sum(site["uploaded"] for site in sites.values())
+        downloaded = sum(site["downloaded"] for site in sites.values())
+        mean = uploaded / downloaded if downloaded > 0 else None
+        weights = {}
+        for site_name in site_names:
+            site = sites.get(site_name)
+            if mean is None:
+                weights[site_name] = 1.0
+            elif not site:
+                weights[site_name] = max(mean, MIN_WEIGHT)
+            else:
+                weights[site_name] = max((site["uploaded"] + mean * PRIOR_DOWNLOADED)
+                                         / (site["downloaded"] + PRIOR_DOWNLOADED), MIN_WEIGHT)
+        return weights
+
+    def summary(self) -> List[dict]:
+        """
+        各站点统计汇总，按每 GB 上传量从高到低排列
+        """
+        items = []
+        for site_name, site in self.__copy().items():
+            items.append({
+                "site_name": site_name,
+                "tasks": site["tasks"],
+                "uploaded": site["uploaded"],
+                "downloaded": site["downloaded"],
+                "upload_per_gb": site["uploaded"] / site["downloaded"] if site["downloaded"] > 0 else None,
+                "ratio_one_hours": (site["ratio_one_seconds"] / site["ratio_one_count"] / 3600
+                                    if site["ratio_one_count"] else None),
+                "reasons": dict(sorted(site["reasons"].items(), key=lambda item: item[1], reverse=True)),
+            })
+        return sorted(items, key=lambda item: item["upload_per_gb"] or 0, reverse=True)
+
+    def __copy(self) -> Dict[str, dict]:
+        with self._lock:
+            return {site_name: dict(site, reasons=dict(site["reasons"])) for site_name, site in self._sites.items()}
+
+    def to_dict(self) -> dict:
+        return self.__copy()
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict]) -> "SiteYieldStats":
+        """
+        从持久化数据恢复，数据损坏时返回空统计
+        """
+        stats = cls()
+        try:
+            for site_name, site in (data or {}).items():
+                stats.__site(site_name).update(site)
+        except Exception as e:
+            print(str(e))
+            return cls()
+        return stats
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[dict]) -> "SiteYieldStats":
+        """
+        首次启用时由已有的刷流任务与归档任务建立初始统计，历史任务没有达到分享率 1 的时间与删种原因
+        """
+        stats = cls()
+        for task in tasks:
+            site = stats.__site(task.get("site_name") or "")
+            site["tasks"] += 1
+            site["uploaded"] += task.get("uploaded") or 0
+            site["downloaded"] += task.get("downloaded") or 0
+        return stats
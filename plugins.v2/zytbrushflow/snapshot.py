@@ -0,0 +1,110 @@
+import time
+from typing import Any, Iterable, Optional
+
+# qBittorrent "downloading" 过滤器对应的种子状态，与 torrents_info(status_filter="downloading") 保持一致
+QB_DOWNLOADING_STATES = frozenset({
+    "downloading", "metaDL", "forcedMetaDL", "stalledDL", "checkingDL",
+    "pausedDL", "stoppedDL", "queuedDL", "forcedDL"
+})
+# Transmission 中视为下载中的状态，与 get_downloading_torrents 保持一致
+TR_DOWNLOADING_STATES = frozenset({"downloading", "download_pending"})
+# 活动种子判定的上传速度下限 Byte/s
+ACTIVE_UPSPEED_THRESHOLD = 10240
+
+
+class DownloaderSnapshot:
+    """
+    单个刷流周期内的下载器状态快照
+    周期开始时只拉取一次全量种子列表，后续新增种子时在本地累加计数，避免逐个种子重复请求下载器
+    """
+
+    def __init__(self, torrents: Optional[Iterable[Any]], is_qbittorrent: bool,
+                 upload_limit: Optional[float] = None, free_space: Optional[int] = None):
+        self.is_qbittorrent = is_qbittorrent
+        self.created_at = time.time()
+        # 下载中的种子数
+        self.downloading_count = 0
+        # 活动（下载中/上传中且有一定上传速度）的种子数
+        self.active_count = 0
+        # 本周期内新增的种子数
+        self.added_count = 0
+        # 所有种子的当前上传速度之和 Byte/s
+        self.upload_speed = 0
+        # 下载器上传限速 Byte/s，未限速或未知时为 None
+        self.upload_limit = upload_limit
+        # 保存路径剩余空间 Byte，未知时为 None，新增种子时扣减
+        self.free_space = free_space
+        # 快照是否有效，获取种子列表失败时为 False，计数均按 0 处理
+        self.valid = torrents is not None
+
+        for torrent in torrents or []:
+            if self.is_downloading(torrent):
+                self.downloading_count += 1
+            if self.is_active(torrent):
+                self.active_count += 1
+            self.upload_speed += self.get_upload_speed(torrent)
+
+    def is_downloading(self, torrent: Any) -> bool:
+        """
+        判断种子是否处于下载中
+        """
+        try:
+            if self.is_qbittorrent:
+                return torrent.get("state") in QB_DOWNLOADING_STATES
+            return str(getattr(torrent.status, "value", torrent.status)) in TR_DOWNLOADING_STATES
+        except Exception as e:
+            print(str(e))
+            return False
+
+    def is_active(self, torrent: Any) -> bool:
+        """
+        判断种子是否为活动种子，即下载中或上传中，且上传速度大于 10 KB/s
+        """
+        try:
+            if self.is_qbittorrent:
+                return (torrent.get("state") in ("downloading", "uploading")
+                        and (torrent.get("upspeed") or 0) > ACTIVE_UPSPEED_THRESHOLD)
+            return (str(getattr(torrent.status, "value", torrent.status)) in ("downloading", "seeding")
+                    and (torrent.rate_upload or 0) > ACTIVE_UPSPEED_THRESHOLD)
+        except Exception as e:
+            print(str(e))
+            return False
+
+    def get_upload_speed(self, torrent: Any) -> int:
+        try:
+            if self.is_qbittorrent:
+                return torrent.get("upspeed") or 0
+            return torrent.rate_upload or 0
+        except Exception as e:
+            print(str(e))
+            return 0
+
+    @property
+    def upload_headroom(self) -> float:
+        """
+        剩余上传带宽 Byte/s，未限速时以当前上传速度的相反数表示，上传越少余量越大
+        """
+        if self.upload_limit:
+            return self.upload_limit - self.upload_speed
+        return -self.upload_speed
+
+    def record_added(self, count: int = 1, size: int = 0):
+        """
+        记录本周期内新增的种子，新种子会立即开始下载，同时计入下载中与活动种子数，并预先扣减剩余空间
+        """
+        self.added_count += count
+        self.downloading_count += count
+        self.active_count += count
+        if self.free_space is not None:
+            self.free_space -= size
+
+    def record_cancelled(self, count: int = 1, size: int = 0):
+        """
+        撤销预先记录但最终未能添加到下载器的种子
+        """
+        self.record_added(count=-count, size=-size)
+
+    def __repr__(self):
+        return (f"DownloaderSnapshot(downloading={self.downloading_count}, active={self.active_count}, "
+                f"added={self.added_count}, upload_speed={self.upload_speed}, free_space={self.free_space}, "
+                f"valid={self.valid})")
@@ -0,0 +1,344 @@
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .record import TaskRecord, column_path
+
+# 任务分组：刷流任务、已归档任务、移出管理的任务，与原插件数据 key 一一对应
+TASK_BUCKETS = ("torrents", "archived", "unmanaged")
+
+# 分页查询支持的排序字段
+SORT_COLUMNS = {
+    "time": "COALESCE(time, 0)",
+    "site": "site_name",
+    "title": f"json_extract(data, '{column_path('title')}')",
+    "size": f"COALESCE(json_extract(data, '{column_path('size')}'), 0)",
+    "uploaded": f"COALESCE(json_extract(data, '{column_path('uploaded')}'), 0)",
+    "downloaded": f"COALESCE(json_extract(data, '{column_path('downloaded')}'), 0)",
+    "ratio": f"COALESCE(json_extract(data, '{column_path('ratio')}'), 0)",
+}
+# 任务数据的存储格式，旧版本为字典 JSON
+DATA_FORMAT = "packed"
+
+
+class TaskStore:
+    """
+    基于 SQLite 的刷流任务存储
+    每个任务一行（分组+hash 为主键，按站点、删除状态、时间建立索引），保存时只写入发生变化的行，
+    在 transaction() 中的多次保存合并为周期结束时的一次事务提交
+    内存缓存与存储均使用紧凑的 TaskRecord，读写接口仍为原字典形式
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = str(path)
+        self._lock = threading.RLock()
+        # 分组 -> {hash: 最近一次加载或保存的任务记录}，用于判断哪些行发生了变化
+        self._cache: Dict[str, Dict[str, TaskRecord]] = {}
+        # 当前线程正在进行的事务：分组 -> (待写入行, 待删除 hash)，以及提交成功后的回调
+        self._local = threading.local()
+        self.__init_schema()
+
+    @contextmanager
+    def _connect(self):
+        """
+        打开连接，正常退出时提交并关闭，异常时回滚
+        """
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def __init_schema(self):
+        with self._lock, self._connect() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    bucket TEXT NOT NULL,
+                    hash TEXT NOT NULL,
+                    site_name TEXT,
+                    deleted INTEGER NOT NULL DEFAULT 0,
+                    time REAL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (bucket, hash)
+                );
+                CREATE INDEX IF NOT EXISTS idx_tasks_site ON tasks (bucket, site_name);
+                CREATE INDEX IF NOT EXISTS idx_tasks_deleted ON tasks (bucket, deleted);
+                CREATE INDEX IF NOT EXISTS idx_tasks_time ON tasks (bucket, time);
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+            row = conn.execute("SELECT value FROM meta WHERE key = 'format'").fetchone()
+            if not row or row[0] != DATA_FORMAT:
+                # 旧版本的字典 JSON 一次性转换为紧凑数组
+                rows = conn.execute("SELECT bucket, hash, data FROM tasks").fetchall()
+                conn.executemany("UPDATE tasks SET data = ? WHERE bucket = ? AND hash = ?",
+                                 [(TaskRecord.decode(data).encode(), bucket, torrent_hash)
+                                  for bucket, torrent_hash, data in rows])
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('format', ?)", (DATA_FORMAT,))
+
+    @staticmethod
+    def __row(bucket: str, torrent_hash: str, record: TaskRecord) -> Tuple[Any, ...]:
+        return (bucket, torrent_hash, record.get("site_name"), 1 if record.get("deleted") else 0,
+                record.get("time"), record.encode())
+
+    @staticmethod
+    def __records(tasks: Iterable[Tuple[str, dict]]) -> Dict[str, TaskRecord]:
+        return {torrent_hash: TaskRecord.from_dict(task) for torrent_hash, task in tasks}
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        with self._lock, self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def load(self, bucket: str) -> Dict[str, dict]:
+        """
+        加载分组内全部任务，返回调用方可自由修改的副本
+        """
+        batch = self.__current_batch()
+        with self._lock:
+            if bucket not in self._cache:
+                with self._connect() as conn:
+                    rows = conn.execute("SELECT hash, data FROM tasks WHERE bucket = ?", (bucket,)).fetchall()
+                self._cache[bucket] = {torrent_hash: TaskRecord.decode(data) for torrent_hash, data in rows}
+            if batch is not None:
+                batch.setdefault(bucket, None)
+            return {torrent_hash: record.to_dict() for torrent_hash, record in self._cache[bucket].items()}
+
+    def get(self, bucket: str, hashes: Iterable[str]) -> Dict[str, dict]:
+        """
+        按 hash 读取部分任务，不会将整个分组加载到内存
+        """
+        hashes = list(dict.fromkeys(hashes))
+        result: Dict[str, dict] = {}
+        with self._lock:
+            pending = (self.__current_batch() or {}).get(bucket)
+            cached = self._cache.get(bucket)
+            missing = []
+            for torrent_hash in hashes:
+                if pending and torrent_hash in pending[1]:
+                    continue
+                if pending and torrent_hash in pending[0]:
+                    result[torrent_hash] = pending[0][torrent_hash].to_dict()
+                elif cached is not None:
+                    if torrent_hash in cached:
+                        result[torrent_hash] = cached[torrent_hash].to_dict()
+                else:
+                    missing.append(torrent_hash)
+            if missing:
+                with self._connect() as conn:
+                    for start in range(0, len(missing), 500):
+                        chunk = missing[start:start + 500]
+                        rows = conn.execute(f"SELECT hash, data FROM tasks WHERE bucket = ? AND hash IN "
+                                            f"({', '.join('?' * len(chunk))})", (bucket, *chunk)).fetchall()
+                        result.update({torrent_hash: TaskRecord.decode(data).to_dict() for torrent_hash, data in rows})
+        return result
+
+    def update(self, bucket: str, tasks: Dict[str, dict]) -> int:
+        """
+        新增或覆盖部分任务，分组内的其他任务保持不变，返回写入的行数
+        """
+        if not tasks:
+            return 0
+        records = self.__records(tasks.items())
+        with self._lock:
+            cached = self._cache.get(bucket)
+            if cached is not None:
+                cached.update(records)
+            batch = self.__current_batch()
+            if batch is not None:
+                pending = batch.get(bucket) or ({}, set())
+                pending[0].update(records)
+                pending[1].difference_update(records)
+                batch[bucket] = pending
+            else:
+                self.__write(bucket, records.items(), [])
+            return len(records)
+
+    def query(self, bucket: str, site_name: Optional[str] = None, deleted: Optional[bool] = None,
+              keyword: Optional[str] = None, sort: str = "time", desc: bool = True,
+              offset: int = 0, limit: int = 50) -> Tuple[int, List[Tuple[str, dict]]]:
+        """
+        按站点、删除状态、标题关键字筛选并分页读取任务，返回 (总数, [(hash, 任务)])
+        只读取已提交的数据，不会将整个分组加载到内存
+        """
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"不支持的排序字段：{sort}")
+        conditions, params = ["bucket = ?"], [bucket]
+        if site_name:
+            conditions.append("site_name = ?")
+            params.append(site_name)
+        if deleted is not None:
+            conditions.append("deleted = ?")
+            params.append(1 if deleted else 0)
+        if keyword:
+            escaped = keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            conditions.append(f"json_extract(data, '{column_path('title')}') LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+        where = " AND ".join(conditions)
+        order = f"{SORT_COLUMNS[sort]} {'DESC' if desc else 'ASC'}, hash"
+        with self._lock, self._connect() as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM tasks WHERE {where}", params).fetchone()[0]
+            rows = conn.execute(f"SELECT hash, data FROM tasks WHERE {where} ORDER BY {order} LIMIT ? OFFSET ?",
+                                (*params, max(0, int(limit)), max(0, int(offset)))).fetchall()
+        return total, [(torrent_hash, TaskRecord.decode(data).to_dict()) for torrent_hash, data in rows]
+
+    def site_names(self, bucket: str) -> List[str]:
+        """
+        分组内出现过的站点名称
+        """
+        with self._lock, self._connect() as conn:
+            rows = conn.execute("SELECT DISTINCT site_name FROM tasks WHERE bucket = ? AND site_name IS NOT NULL "
+                                "ORDER BY site_name", (bucket,)).fetchall()
+        return [row[0] for row in rows]
+
+    def count(self, bucket: str) -> int:
+        with self._lock, self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM tasks WHERE bucket = ?", (bucket,)).fetchone()[0]
+
+    def save(self, bucket: str, tasks: Dict[str, dict]) -> int:
+        """
+        保存分组内的全部任务，只写入新增或变化的行并删除已不存在的行，返回变化的行数
+        在事务中调用时只记录变化，事务结束时统一提交
+        """
+        with self._lock:
+            cached = self._cache.get(bucket)
+            if cached is None:
+                self.load(bucket)
+                cached = self._cache[bucket]
+            upserts = [(torrent_hash, record) for torrent_hash, record in self.__records(tasks.items()).items()
+                       if cached.get(torrent_hash) != record]
+            deletes = [torrent_hash for torrent_hash in cached if torrent_hash not in tasks]
+            if not upserts and not deletes:
+                return 0
+            for torrent_hash, record in upserts:
+                cached[torrent_hash] = record
+            for torrent_hash in deletes:
+                del cached[torrent_hash]
+
+            batch = self.__current_batch()
+            if batch is not None:
+                pending = batch.get(bucket) or ({}, set())
+                for torrent_hash, record in upserts:
+                    pending[0][torrent_hash] = record
+                    pending[1].discard(torrent_hash)
+                for torrent_hash in deletes:
+                    pending[0].pop(torrent_hash, None)
+                    pending[1].add(torrent_hash)
+                batch[bucket] = pending
+            else:
+                self.__write(bucket, upserts, deletes)
+            return len(upserts) + len(deletes)
+
+    def __write(self, bucket: str, upserts: Iterable[Tuple[str, TaskRecord]], deletes: Iterable[str],
+                conn: Optional[sqlite3.Connection] = None):
+        rows = [self.__row(bucket, torrent_hash, record) for torrent_hash, record in upserts]
+        delete_rows = [(bucket, torrent_hash) for torrent_hash in deletes]
+        if conn is None:
+            with self._connect() as conn:
+                self.__execute_write(conn, rows, delete_rows)
+        else:
+            self.__execute_write(conn, rows, delete_rows)
+
+    @staticmethod
+    def __execute_write(conn: sqlite3.Connection, rows: List[Tuple[Any, ...]], delete_rows: List[Tuple[str, str]]):
+        if rows:
+            conn.executemany("INSERT OR REPLACE INTO tasks (bucket, hash, site_name, deleted, time, data) "
+                             "VALUES (?, ?, ?, ?, ?, ?)", rows)
+        if delete_rows:
+            conn.executemany("DELETE FROM tasks WHERE bucket = ? AND hash = ?", delete_rows)
+
+    def __current_batch(self) -> Optional[Dict[str, Any]]:
+        return getattr(self._local, "batch", None)
+
+    def after_commit(self, func: Callable[[], Any]):
+        """
+        在当前事务提交成功后调用 func，事务放弃写入或提交失败时不调用，不在事务中时立即调用
+        用于保存依赖任务写入结果的插件数据，避免任务回滚后这些数据仍已更新
+        """
+        callbacks = getattr(self._local, "callbacks", None)
+        if callbacks is None:
+            func()
+        else:
+            callbacks.append(func)
+
+    @contextmanager
+    def transaction(self, on_commit: Optional[Callable[[float], None]] = None):
+        """
+        周期事务：期间的所有保存在退出时一次性提交，发生异常时放弃写入并丢弃相关缓存
+        支持嵌套，只有最外层负责提交，提交完成后依次调用 after_commit 注册的回调，并以提交耗时（秒）调用 on_commit
+        """
+        if self.__current_batch() is not None:
+            yield self
+            return
+        batch: Dict[str, Any] = {}
+        callbacks: List[Callable[[], Any]] = []
+        self._local.batch = batch
+        self._local.callbacks = callbacks
+        try:
+            yield self
+        except Exception:
+            with self._lock:
+                for bucket in batch:
+                    self._cache.pop(bucket, None)
+            raise
+        finally:
+            self._local.batch = None
+            self._local.callbacks = None
+        with self._lock:
+            pending = {bucket: changes for bucket, changes in batch.items() if changes}
+            start = time.perf_counter()
+            try:
+                if pending:
+                    with self._connect() as conn:
+                        for bucket, (upserts, deletes) in pending.items():
+                            self.__write(bucket, upserts.items(), deletes, conn=conn)
+            except Exception:
+                for bucket in pending:
+                    self._cache.pop(bucket, None)
+                raise
+            elapsed = time.perf_counter() - start
+        for func in callbacks:
+            func()
+        if on_commit and pending:
+            on_commit(elapsed)
+
+    def clear(self, buckets: Iterable[str] = TASK_BUCKETS):
+        """
+        清空指定分组的全部任务
+        """
+        buckets = list(buckets)
+        with self._lock, self._connect() as conn:
+            conn.executemany("DELETE FROM tasks WHERE bucket = ?", [(bucket,) for bucket in buckets])
+            for bucket in buckets:
+                self._cache[bucket] = {}
+
+    def migrate(self, sources: Dict[str, Optional[Dict[str, dict]]], marker: str = "migrated") -> bool:
+        """
+        一次性导入旧版插件数据，已导入过时直接返回 False
+        """
+        with self._lock:
+            if self.get_meta(marker):
+                return False
+            with self._connect() as conn:
+                for bucket, tasks in sources.items():
+                    if tasks:
+                        self.__write(bucket, self.__records(tasks.items()).items(), [], conn=conn)
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (marker, "1"))
+            for bucket in sources:
+                self._cache.pop(bucket, None)
+            return True
@@ -0,0 +1,99 @@
+from collections import Counter
+from typing import Any, Dict, Optional, Tuple
+
+
+class TaskIndex:
+    """
+    刷流任务重复种子索引
+    与任务字典并存，按「站点+标题」「站点+详情地址」「标题→尚未做种的站点计数」建立哈希索引，
+    使每个候选种子的重复判断均为 O(1)，任务新增或移出任务字典时需同步调用 add/remove
+    """
+
+    def __init__(self, torrent_tasks: Optional[Dict[str, dict]] = None):
+        # (站点名称, 标题) -> 任务数
+        self._site_titles: Counter = Counter()
+        # (站点名称, 详情地址) -> 任务数
+        self._site_page_urls: Counter = Counter()
+        # 标题 -> {站点名称: 尚未做种的任务数}
+        self._unseeded_titles: Dict[Any, Counter] = {}
+        # hash -> 该任务写入索引时使用的键，用于移除
+        self._entries: Dict[str, Tuple[Any, Any, Any, Any]] = {}
+
+        for torrent_hash, task in (torrent_tasks or {}).items():
+            self.add(torrent_hash, task)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, torrent_hash: str):
+        return torrent_hash in self._entries
+
+    @staticmethod
+    def __is_unseeded(task: dict) -> bool:
+        """
+        任务是否尚未开始做种，与原有重复判断中的条件保持一致
+        """
+        return not task.get("seed_time")
+
+    def add(self, torrent_hash: str, task: dict):
+        """
+        新增或覆盖一个任务的索引
+        """
+        if torrent_hash in self._entries:
+            self.remove(torrent_hash)
+
+        site_name = task.get("site_name")
+        title = task.get("title")
+        site_title = (site_name, title)
+        site_page_url = (site_name, task.get("page_url"))
+        unseeded_title = title if self.__is_unseeded(task) else None
+
+        self._site_titles[site_title] += 1
+        self._site_page_urls[site_page_url] += 1
+        if unseeded_title is not None:
+            self._unseeded_titles.setdefault(unseeded_title, Counter())[site_name] += 1
+        self._entries[torrent_hash] = (site_title, site_page_url, unseeded_title, site_name)
+
+    def remove(self, torrent_hash: str):
+        """
+        移除一个任务的索引，任务被删除出任务字典（归档、移出管理）时调用
+        """
+        entry = self._entries.pop(torrent_hash, None)
+        if not entry:
+            return
+        site_title, site_page_url, unseeded_title, site_name = entry
+        self.__decrease(self._site_titles, site_title)
+        self.__decrease(self._site_page_urls, site_page_url)
+        if unseeded_title is not None:
+            sites = self._unseeded_titles.get(unseeded_title)
+            if sites is not None:
+                self.__decrease(sites, site_name)
+                if not sites:
+                    del self._unseeded_titles[unseeded_title]
+
+    @staticmethod
+    def __decrease(counter: Counter, key: Any):
+        counter[key] -= 1
+        if counter[key] <= 0:
+            del counter[key]
+
+    def contains_site_title(self, site_name: str, title: str) -> bool:
+        """
+        同一站点下是否已存在相同标题的任务
+        """
+        return (site_name, title) in self._site_titles
+
+    def contains_site_page_url(self, site_name: str, page_url: str) -> bool:
+        """
+        同一站点下是否已存在相同详情地址的任务
+        """
+        return (site_name, page_url) in self._site_page_urls
+
+    def contains_unseeded_title_on_other_site(self, site_name: str, title: str) -> bool:
+        """
+        其他站点是否存在相同标题且尚未做种的任务
+        """
+        sites = self._unseeded_titles.get(title)
+        if not sites:
+            return False
+        return sum(sites.values()) > sites.get(site_name, 0)
@@ -0,0 +1,134 @@
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+# 直方图分桶上界（秒），最后一个桶收纳超出范围的耗时
+HISTOGRAM_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60)
+
+# 超出预算时的回调：(阶段, 耗时秒数, 预算秒数)
+ExceedCallback = Callable[[str, float, float], None]
+
+
+def parse_budgets(value: Optional[str]) -> Dict[str, float]:
+    """
+    解析阶段耗时预算，格式如「30」或「30,site_browse=120,downloader_add=10」
+    不带阶段名的数值为所有阶段的默认预算（key 为 *），格式错误时抛出 ValueError
+    """
+    budgets: Dict[str, float] = {}
+    for item in str(value or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        phase, _, seconds = item.rpartition("=")
+        phase = phase.strip() or "*"
+        budget = float(seconds)
+        if budget <= 0:
+            raise ValueError(f"阶段 {phase} 的耗时预算必须大于 0")
+        budgets[phase] = budget
+    return budgets
+
+
+class PhaseTimer:
+    """
+    刷流各阶段耗时统计
+    每个阶段保留最近 capacity 次耗时用于计算分位数与滚动直方图，单次耗时超过预算时触发回调
+    """
+
+    def __init__(self, capacity: int = 200, budgets: Optional[Dict[str, float]] = None,
+                 on_exceed: Optional[ExceedCallback] = None):
+        self.capacity = capacity
+        self.budgets = dict(budgets or {})
+        self.on_exceed = on_exceed
+        self._samples: Dict[str, deque] = {}
+        self._totals: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        # 统计数据版本，每次记录或清空时递增，用于判断汇总结果是否需要重新计算
+        self.version = 0
+
+    def budget_of(self, phase: str) -> Optional[float]:
+        return self.budgets.get(phase, self.budgets.get("*"))
+
+    @contextmanager
+    def measure(self, phase: str):
+        """
+        统计代码块耗时
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+
+    def record(self, phase: str, seconds: float):
+        """
+        记录一次耗时，超过预算时触发回调
+        """
+        with self._lock:
+            samples = self._samples.get(phase)
+            if samples is None:
+                samples = self._samples[phase] = deque(maxlen=self.capacity)
+                self._totals[phase] = [0, 0.0]
+            samples.append(seconds)
+            self._totals[phase][0] += 1
+            self._totals[phase][1] += seconds
+            self.version += 1
+        budget = self.budget_of(phase)
+        if budget and seconds > budget and self.on_exceed:
+            try:
+                self.on_exceed(phase, seconds, budget)
+            except Exception as e:
+                print(str(e))
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+            self.version += 1
+            self._totals.clear()
+
+    @staticmethod
+    def __percentile(ordered: List[float], percent: float) -> float:
+        # 最近秩法
+        index = max(0, math.ceil(percent / 100 * len(ordered)) - 1)
+        return ordered[index]
+
+    @staticmethod
+    def histogram(samples: List[float]) -> Dict[str, int]:
+        """
+        按固定分桶统计耗时分布
+        """
+        buckets = {f"<={bound}s": 0 for bound in HISTOGRAM_BUCKETS}
+        overflow = f">{HISTOGRAM_BUCKETS[-1]}s"
+        buckets[overflow] = 0
+        for seconds in samples:
+            for bound in HISTOGRAM_BUCKETS:
+                if seconds <= bound:
+                    buckets[f"<={bound}s"] += 1
+                    break
+            else:
+                buckets[overflow] += 1
+        return buckets
+
+    def summary(self) -> Dict[str, dict]:
+        """
+        各阶段耗时汇总：累计次数与总耗时，以及最近窗口内的均值、P50、P95、最大值、直方图
+        """
+        with self._lock:
+            snapshot = {phase: (list(samples), tuple(self._totals[phase])) for phase, samples in self._samples.items()}
+        result = {}
+        for phase, (samples, (count, total)) in snapshot.items():
+            ordered = sorted(samples)
+            result[phase] = {
+                "count": count,
+                "total": total,
+                "last": samples[-1],
+                "mean": sum(samples) / len(samples),
+                "p50": self.__percentile(ordered, 50),
+                "p95": self.__percentile(ordered, 95),
+                "max": ordered[-1],
+                "budget": self.budget_of(phase),
+                "histogram": self.histogram(samples)
+            }
+        return result
@@ -19,6 +19,7 @@ from app.helper.sites import SitesHelper
 from app.helper.torrent import TorrentHelper
 from app.log import logger
 from app.plugins import _PluginBase
+from app.plugins.zytiyuuflush.bencode import get_torrent_id
 from app.plugins.zytiyuuflush.iyuu_helper import IyuuHelper
 from app.schemas import NotificationType, ServiceInfo
 from app.schemas.types import EventType
@@ -34,7 +35,7 @@ class ZYTIYUUflush(_PluginBase):
     # 插件图标
     plugin_icon = "Iyuu_A.png"
     # 插件版本
-    plugin_version = "2.17"
+    plugin_version = "2.18"
     # 插件作者
     plugin_author = "zyt"
     # 作者主页
@@ -985,10 +986,13 @@ class ZYTIYUUflush(_PluginBase):
         添加下载任务
         """
         if service.type == "qbittorrent":
-            # 生成随机Tag
-            tag = StringUtils.generate_random_str(10)
-
-            torrent_tags.append(tag)
+            # 种子文件已在内存中，直接本地计算Hash，解析失败时才通过随机Tag反查
+            torrent_hash = get_torrent_id(content)
+            tag = None
+            if not torrent_hash:
+                # 生成随机Tag
+                tag = StringUtils.generate_random_str(10)
+                torrent_tags.append(tag)
 
             state = service.instance.add_torrent(content=content,
                                                  download_dir=save_path,
@@ -998,7 +1002,7 @@ class ZYTIYUUflush(_PluginBase):
                                                  is_skip_checking=self._skipverify)
             if not state:
                 return None
-            else:
+            if not torrent_hash:
                 # 获取种子Hash
                 torrent_hash = service.instance.get_torrent_id_by_tag(tags=tag)
                 if not torrent_hash:
@@ -0,0 +1,104 @@
+import hashlib
+from typing import Any, Optional, Tuple
+
+
+class BencodeError(ValueError):
+    """
+    种子文件不是合法的 bencode 数据
+    """
+    pass
+
+
+def _decode(data: bytes, index: int) -> Tuple[Any, int]:
+    """
+    从 index 处解码一个 bencode 值，返回值与结束位置
+    """
+    try:
+        token = data[index:index + 1]
+        if token == b"i":
+            end = data.index(b"e", index)
+            return int(data[index + 1:end]), end + 1
+        if token == b"l":
+            index += 1
+            items = []
+            while data[index:index + 1] != b"e":
+                item, index = _decode(data, index)
+                items.append(item)
+            return items, index + 1
+        if token == b"d":
+            index += 1
+            items = {}
+            while data[index:index + 1] != b"e":
+                key, index = _decode(data, index)
+                items[key], index = _decode(data, index)
+            return items, index + 1
+        if token.isdigit():
+            colon = data.index(b":", index)
+            length = int(data[index:colon])
+            start = colon + 1
+            if start + length > len(data):
+                raise BencodeError("字符串长度超出数据范围")
+            return data[start:start + length], start + length
+    except BencodeError:
+        raise
+    except (ValueError, IndexError, RecursionError) as e:
+        raise BencodeError(f"bencode 解析失败：{e}") from e
+    raise BencodeError(f"无法识别的 bencode 标记：{token!r}，位置 {index}")
+
+
+def bdecode(data: bytes) -> Any:
+    """
+    解码完整的 bencode 数据
+    """
+    value, end = _decode(data, 0)
+    if end != len(data):
+        raise BencodeError("bencode 数据末尾存在多余内容")
+    return value
+
+
+def _info_span(data: bytes) -> Tuple[int, int, dict]:
+    """
+    查找顶层字典中 info 字段的原始字节区间，info-hash 必须基于原始字节计算
+    """
+    if data[:1] != b"d":
+        raise BencodeError("种子文件顶层不是字典")
+    index = 1
+    while data[index:index + 1] != b"e":
+        key, index = _decode(data, index)
+        start = index
+        value, index = _decode(data, index)
+        if key == b"info":
+            if not isinstance(value, dict):
+                raise BencodeError("info 字段不是字典")
+            return start, index, value
+    raise BencodeError("种子文件缺少 info 字段")
+
+
+def get_info_hashes(content: bytes) -> Tuple[Optional[str], Optional[str]]:
+    """
+    计算种子文件的 v1（SHA-1）与 v2（SHA-256）info-hash
+    纯 v1 种子 v2 为 None，纯 v2 种子 v1 为 None，混合种子两者均有
+    """
+    start, end, info = _info_span(content)
+    raw_info = content[start:end]
+    meta_version = info.get(b"meta version")
+    # 含 pieces 字段即为 v1 或混合种子
+    v1 = hashlib.sha1(raw_info).hexdigest() if b"pieces" in info else None
+    v2 = hashlib.sha256(raw_info).hexdigest() if meta_version == 2 else None
+    return v1, v2
+
+
+def get_torrent_id(content: bytes) -> Optional[str]:
+    """
+    获取下载器中使用的种子 ID：v1 与混合种子为 v1 info-hash，纯 v2 种子为截断至 40 位的 v2 info-hash
+    解析失败时返回 None，由调用方回退到其他方式获取
+    """
+    if not isinstance(content, (bytes, bytearray)):
+        return None
+    try:
+        v1, v2 = get_info_hashes(bytes(content))
+    except BencodeError:
+        return None
+    if v1:
+        return v1
+    return v2[:40] if v2 else None
@@ -0,0 +1,90 @@
+"""ZYTBrushFlow 下载器种子数据适配器测试。"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+import unittest
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+
+ROOT = Path(__file__).resolve().parents[3]
+PLUGIN_DIR = ROOT / "plugins.v2" / "zytbrushflow"
+# 以独立包名加载辅助模块，不执行依赖 MoviePilot 的插件入口
+PACKAGE = types.ModuleType("zytbrushflow_test_adapters_pkg")
+PACKAGE.__path__ = [str(PLUGIN_DIR)]
+sys.modules[PACKAGE.__name__] = PACKAGE
+adapters = importlib.import_module(f"{PACKAGE.__name__}.adapters")
+
+NOW = 1_700_000_000
+
+
+class TrTorrent(SimpleNamespace):
+    """模拟 transmission_rpc.Torrent，支持 get 读取扩展字段。"""
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+class AdapterTest(unittest.TestCase):
+    """验证 qBittorrent 与 Transmission 种子字段读取。"""
+
+    def test_get_adapter(self):
+        self.assertTrue(adapters.get_adapter(True).is_qbittorrent)
+        self.assertFalse(adapters.get_adapter(False).is_qbittorrent)
+
+    def test_qbittorrent_fields(self):
+        adapter = adapters.get_adapter(True)
+        torrent = {"hash": "abc", "tags": "刷流, 已整理", "total_size": 100, "state": "uploading",
+                   "added_on": NOW - 3600, "completion_on": NOW - 1800, "last_activity": NOW - 60,
+                   "ratio": 1.5, "uploaded": 150, "downloaded": 100, "name": "t"}
+        self.assertEqual(adapter.hash(torrent), "abc")
+        self.assertEqual(adapter.tags(torrent), ["刷流", "已整理"])
+        self.assertEqual(adapter.tags({}), [])
+        self.assertEqual(adapter.size(torrent), 100)
+        self.assertEqual(adapter.state(torrent), "uploading")
+        info = adapter.torrent_info(torrent, date_now=NOW)
+        self.assertEqual((info["hash"], info["dltime"], info["seeding_time"], info["iatime"]), ("abc", 3600, 1800, 60))
+
+    def test_transmission_fields(self):
+        adapter = adapters.get_adapter(False)
+        torrent = TrTorrent(hashString="def", name="t", labels=["刷流"], total_size=200, progress=50, ratio=2,
+                            status=SimpleNamespace(value="seeding"),
+                            date_added=datetime.fromtimestamp(NOW - 7200),
+                            date_done=datetime.fromtimestamp(NOW - 3600),
+                            date_active=datetime.fromtimestamp(NOW - 120))
+        self.assertEqual(adapter.hash(torrent), "def")
+        self.assertEqual(adapter.tags(torrent), ["刷流"])
+        self.assertEqual(adapter.size(torrent), 200)
+        self.assertEqual(adapter.state(torrent), "seeding")
+        info = adapter.torrent_info(torrent, date_now=NOW)
+        self.assertEqual((info["hash"], info["downloaded"], info["uploaded"]), ("def", 100, 200))
+        self.assertEqual((info["dltime"], info["seeding_time"], info["iatime"]), (7200, 3600, 120))
+        self.assertEqual(info["avg_upspeed"], 0)
+
+    def test_check_fetch(self):
+        calls = []
+        qb_client = SimpleNamespace(torrents_info=lambda **kwargs: calls.append(kwargs) or [{"hash": "abc"}])
+        qb_adapter = adapters.get_adapter(True)
+        self.assertEqual(qb_adapter.get_check_torrents(qb_client, tag="刷流"), [{"hash": "abc"}])
+        qb_adapter.get_check_torrents(qb_client, tag="刷流", ids=["abc"])
+        qb_adapter.get_cascade_torrents(qb_client)
+        self.assertEqual(calls, [{"tag": "刷流"}, {"torrent_hashes": ["abc"]}, {}])
+
+        calls.clear()
+        tr_client = SimpleNamespace(get_torrents=lambda **kwargs: calls.append(kwargs) or [])
+        tr_adapter = adapters.get_adapter(False)
+        tr_adapter.get_check_torrents(tr_client, tag="刷流")
+        tr_adapter.get_cascade_torrents(tr_client)
+        self.assertIsNone(calls[0]["ids"])
+        self.assertIn("percentDone", calls[0]["arguments"])
+        self.assertEqual(calls[1], {"arguments": ["id", "hashString", "name", "totalSize"]})
+        self.assertTrue(qb_adapter.check_filtered)
+        self.assertFalse(tr_adapter.check_filtered)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""ZYTBrushFlow 批量添加种子测试。"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+
+ROOT = Path(__file__).resolve().parents[3]
+ADMISSION_PATH = ROOT / "plugins.v2" / "zytbrushflow" / "admission.py"
+SPEC = importlib.util.spec_from_file_location("zytbrushflow_test_admission", ADMISSION_PATH)
+admission = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = admission
+SPEC.loader.exec_module(admission)
+
+
+def item(site_name, title, downloader="qb"):
+    return admission.Admission(torrent=SimpleNamespace(site_name=site_name, title=title), task={},
+                               downloader=downloader)
+
+
+class AdmissionTest(unittest.TestCase):
+    """验证种子文件并发获取与分组。"""
+
+    def test_fetch_respects_site_limit(self):
+        lock = threading.Lock()
+        running, peak = {}, {}
+
+        def fetch(entry):
+            site = entry.torrent.site_name
+            with lock:
+                running[site] = running.get(site, 0) + 1
+                peak[site] = max(peak.get(site, 0), running[site])
+            time.sleep(0.02)
+            with lock:
+                running[site] -= 1
+            if entry.torrent.title == "bad":
+                raise ValueError("boom")
+            entry.content = b"d4:infod4:name1:aee"
+
+        items = [item("a", str(i)) for i in range(6)] + [item("b", "bad")]
+        admission.fetch_concurrently(items, fetch, site_limit=2, max_workers=8)
+        self.assertLessEqual(peak["a"], 2)
+        self.assertTrue(all(entry.has_file for entry in items[:6]))
+        self.assertEqual(items[-1].error, "boom")
+        self.assertFalse(items[-1].has_file)
+        admission.fetch_concurrently([], fetch)
+
+    def test_group_by_downloader(self):
+        items = [item("a", "1", "qb"), item("a", "2", "tr"), item("a", "3", "qb")]
+        groups = admission.group_by_downloader(items)
+        self.assertEqual(list(groups), ["qb", "tr"])
+        self.assertEqual([entry.torrent.title for entry in groups["qb"]], ["1", "3"])
+        self.assertNotEqual(items[0].key, items[2].key)
+
+
+if __name__ == "__main__":
+    unittest.main()
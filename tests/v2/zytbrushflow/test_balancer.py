@@ -0,0 +1,55 @@
+"""ZYTBrushFlow 多下载器负载均衡测试。"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+
+ROOT = Path(__file__).resolve().parents[3]
+BALANCER_PATH = ROOT / "plugins.v2" / "zytbrushflow" / "balancer.py"
+SPEC = importlib.util.spec_from_file_location("zytbrushflow_test_balancer", BALANCER_PATH)
+balancer = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = balancer
+SPEC.loader.exec_module(balancer)
+
+
+def load(upload_headroom=0, active_count=0, free_space=None, valid=True):
+    return SimpleNamespace(upload_headroom=upload_headroom, active_count=active_count, free_space=free_space,
+                           valid=valid)
+
+
+class PickDownloaderTest(unittest.TestCase):
+    """验证按上传余量、活动种子数与剩余空间选择下载器。"""
+
+    def test_single_and_empty(self):
+        self.assertEqual(balancer.pick_downloader({"qb": load()}), "qb")
+        self.assertIsNone(balancer.pick_downloader({}))
+
+    def test_prefers_upload_headroom(self):
+        loads = {"qb1": load(upload_headroom=100, active_count=5), "qb2": load(upload_headroom=900, active_count=6)}
+        self.assertEqual(balancer.pick_downloader(loads), "qb2")
+
+    def test_fewer_active_breaks_equal_headroom(self):
+        loads = {"qb1": load(active_count=8), "qb2": load(active_count=2)}
+        self.assertEqual(balancer.pick_downloader(loads), "qb2")
+
+    def test_ties_keep_config_order(self):
+        self.assertEqual(balancer.pick_downloader({"qb1": load(), "qb2": load()}), "qb1")
+
+    def test_insufficient_space_excluded(self):
+        loads = {"qb1": load(upload_headroom=900, free_space=10), "tr": load(free_space=None)}
+        self.assertEqual(balancer.pick_downloader(loads, required_space=50), "tr")
+        self.assertIsNone(balancer.pick_downloader({"qb1": load(free_space=10)}, required_space=50))
+
+    def test_invalid_snapshot_excluded(self):
+        loads = {"live": load(active_count=8, free_space=10), "dead": load(valid=False)}
+        self.assertEqual(balancer.pick_downloader(loads), "live")
+        self.assertIsNone(balancer.pick_downloader({"dead": load(valid=False)}))
+
+
+if __name__ == "__main__":
+    unittest.main()
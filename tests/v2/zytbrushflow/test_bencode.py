@@ -0,0 +1,82 @@
+"""种子 info-hash 本地计算测试。"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[3]
+PLUGIN_DIRS = ("zytbrushflow", "iyuuautoseedzyt", "zytiyuuflush")
+BENCODE_PATH = ROOT / "plugins.v2" / "zytbrushflow" / "bencode.py"
+SPEC = importlib.util.spec_from_file_location("zytbrushflow_test_bencode", BENCODE_PATH)
+bencode = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = bencode
+SPEC.loader.exec_module(bencode)
+
+
+def encode(value) -> bytes:
+    """测试用最小 bencode 编码器。"""
+    if isinstance(value, int):
+        return b"i%de" % value
+    if isinstance(value, str):
+        value = value.encode()
+    if isinstance(value, bytes):
+        return b"%d:%s" % (len(value), value)
+    if isinstance(value, list):
+        return b"l" + b"".join(encode(item) for item in value) + b"e"
+    if isinstance(value, dict):
+        items = sorted((key.encode() if isinstance(key, str) else key, item) for key, item in value.items())
+        return b"d" + b"".join(encode(key) + encode(item) for key, item in items) + b"e"
+    raise TypeError(value)
+
+
+class InfoHashTest(unittest.TestCase):
+    """验证 v1、v2、混合种子的 Hash 与下载器 ID。"""
+
+    v1_info = {"name": "movie.mkv", "length": 1024, "piece length": 16384, "pieces": b"\x01" * 20}
+    v2_info = {"name": "movie.mkv", "meta version": 2, "piece length": 16384,
+               "file tree": {"movie.mkv": {"": {"length": 1024, "pieces root": b"\x02" * 32}}}}
+
+    def test_v1_torrent(self):
+        content = encode({"announce": "https://tracker/announce", "info": self.v1_info})
+        expected = hashlib.sha1(encode(self.v1_info)).hexdigest()
+        self.assertEqual(bencode.get_info_hashes(content), (expected, None))
+        self.assertEqual(bencode.get_torrent_id(content), expected)
+
+    def test_hybrid_torrent_uses_v1_id(self):
+        info = {**self.v1_info, **self.v2_info}
+        content = encode({"info": info, "piece layers": {}})
+        v1, v2 = bencode.get_info_hashes(content)
+        self.assertEqual(v1, hashlib.sha1(encode(info)).hexdigest())
+        self.assertEqual(v2, hashlib.sha256(encode(info)).hexdigest())
+        self.assertEqual(bencode.get_torrent_id(content), v1)
+
+    def test_pure_v2_torrent_uses_truncated_v2_id(self):
+        content = encode({"info": self.v2_info})
+        v2 = hashlib.sha256(encode(self.v2_info)).hexdigest()
+        self.assertEqual(bencode.get_torrent_id(content), v2[:40])
+
+    def test_invalid_content_falls_back(self):
+        self.assertIsNone(bencode.get_torrent_id(b"<html>login</html>"))
+        self.assertIsNone(bencode.get_torrent_id("magnet:?xt=urn:btih:abc"))
+        self.assertIsNone(bencode.get_torrent_id(encode({"announce": "x"})))
+        self.assertIsNone(bencode.get_torrent_id(b"d4:infod4:name3:abc"))
+        with self.assertRaises(bencode.BencodeError):
+            bencode.bdecode(b"i1ei2e")
+
+    def test_bdecode_round_trip(self):
+        value = {b"a": [1, -2, b"x"], b"b": {b"c": b""}}
+        self.assertEqual(bencode.bdecode(encode(value)), value)
+
+    def test_plugin_copies_are_identical(self):
+        sources = {name: (ROOT / "plugins.v2" / name / "bencode.py").read_text(encoding="utf-8")
+                   for name in PLUGIN_DIRS}
+        self.assertEqual(len(set(sources.values())), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+"""ZYTBrushFlow 刷流与删种规则测试。"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import unittest
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+
+ROOT = Path(__file__).resolve().parents[3]
+RULES_PATH = ROOT / "plugins.v2" / "zytbrushflow" / "rules.py"
+SPEC = importlib.util.spec_from_file_location("zytbrushflow_test_rules", RULES_PATH)
+rules = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = rules
+SPEC.loader.exec_module(rules)
+
+
+def delete_config(**values):
+    keys = ("hr_seed_time", "seed_ratio", "seed_time", "seed_size", "download_time", "del_no_free", "seed_avgspeed",
+            "seed_inactivetime")
+    return SimpleNamespace(**{key: values.get(key) for key in keys})
+
+
+class RulesTest(unittest.TestCase):
+    """验证从插件中提取的判断规则。"""
+
+    def test_pubminutes(self):
+        now = datetime(2024, 1, 1, 12, 0, 0)
+        self.assertEqual(rules.get_pubminutes("2024-01-01T11:30:00Z", now=now), 30)
+        self.assertEqual(rules.get_pubminutes("", now=now), 0)
+        with self.assertRaises(ValueError):
+            rules.get_pubminutes("yesterday", now=now)
+
+    def test_delete_conditions(self):
+        info = {"seeding_time": 50 * 3600, "ratio": 0.5, "uploaded": 0, "downloaded": 1, "total_size": 1,
+                "dltime": 0, "avg_upspeed": 0, "iatime": 0}
+        self.assertEqual(rules.evaluate_delete_conditions(delete_config(seed_time=48), info, {}),
+                         (True, "做种时间 50.0 小时，大于 48 小时"))
+        passed, reason = rules.evaluate_delete_conditions(delete_config(seed_time=48, hr_seed_time=72), info,
+                                                          {"hit_and_run": True})
+        self.assertEqual((passed, reason), (False, "H&R种子，未能满足设置的H&R删除条件"))
+        passed, reason = rules.evaluate_delete_conditions(delete_config(seed_time=48), info, {"hit_and_run": True})
+        self.assertTrue(passed)
+        self.assertTrue(reason.startswith("H&R种子（未设置H&R条件），做种时间"))
+        self.assertFalse(rules.evaluate_delete_conditions(delete_config(seed_ratio=1), info, {})[0])
+
+    def test_free_expired(self):
+        info = {"seeding_time": 0, "ratio": 0, "uploaded": 0, "downloaded": 1, "total_size": 2,
+                "dltime": 0, "avg_upspeed": 0, "iatime": 0}
+        task = {"freedate": "2024-01-01 12:00:00"}
+        expired = datetime(2024, 1, 1, 12, 0, 1).timestamp()
+        self.assertTrue(rules.is_free_expired(task, info, now=expired))
+        self.assertFalse(rules.is_free_expired(task, info, now=expired - 2))
+        self.assertFalse(rules.is_free_expired(task, dict(info, downloaded=2), now=expired))
+        self.assertFalse(rules.is_free_expired({}, info, now=expired))
+        self.assertIsNone(rules.get_freedate_timestamp("soon"))
+        passed, reason = rules.evaluate_delete_conditions(delete_config(del_no_free=True), info,
+                                                          {"freedate": "2000-01-01 00:00:00"})
+        self.assertTrue(passed)
+        self.assertTrue(reason.startswith("促销已于"))
+        self.assertFalse(rules.evaluate_delete_conditions(delete_config(), info, {"freedate": "2000-01-01 00:00:00"})[0])
+
+    def test_duplicate_conditions(self):
+        task_index = SimpleNamespace(contains_site_title=lambda site, title: title == "Dup",
+                                     contains_site_page_url=lambda site, url: False,
+                                     contains_unseeded_title_on_other_site=lambda site, title: title == "Cross")
+        torrent = SimpleNamespace(site_name="A", title="Dup", page_url=None)
+        self.assertEqual(rules.evaluate_duplicate_conditions(torrent, task_index), (False, "重复种子"))
+        torrent.title = "Cross"
+        self.assertEqual(rules.evaluate_duplicate_conditions(torrent, task_index),
+                         (False, "其他站点存在尚未下载完成的相同种子"))
+        torrent.title = "New"
+        self.assertEqual(rules.evaluate_duplicate_conditions(torrent, task_index), (True, None))
+
+    def test_stable_rejection(self):
+        config = SimpleNamespace(filter=SimpleNamespace(pubtime=SimpleNamespace(lower=5, upper=120)))
+        torrent = SimpleNamespace(pubdate="2024-01-01 11:00:00")
+        self.assertTrue(rules.is_stable_rejection(config, torrent, "存在H&R"))
+        self.assertFalse(rules.is_stable_rejection(config, torrent, None))
+        self.assertFalse(rules.is_stable_rejection(config, torrent, "其他站点存在尚未下载完成的相同种子"))
+        # 超过上限的种子不会再通过，尚未达到下限的种子随时间推移可能通过
+        self.assertTrue(rules.is_stable_rejection(config, torrent, "发布时间 ...", pubminutes_func=lambda _: 180))
+        self.assertFalse(rules.is_stable_rejection(config, torrent, "发布时间 ...", pubminutes_func=lambda _: 1))
+
+    def test_include_exclude_rejection_rechecks_pubtime(self):
+        pubtime = SimpleNamespace(upper=120, single=False, contains=lambda minutes: minutes <= 120)
+        config = SimpleNamespace(freeleech=None, hr=None, filter=SimpleNamespace(
+            size=None, seeder=None, pubtime=pubtime, match_include=lambda title, desc: False,
+            match_exclude=lambda title, desc: False))
+        task_index = SimpleNamespace(contains_site_title=lambda site, title: False,
+                                     contains_site_page_url=lambda site, url: False,
+                                     contains_unseeded_title_on_other_site=lambda site, title: False)
+        torrent = SimpleNamespace(site_name="A", title="T", description="", page_url=None, pubdate="p",
+                                  downloadvolumefactor=0, uploadvolumefactor=1, hit_and_run=False,
+                                  size=1, seeders=1)
+        # 第一轮因包含规则不通过，该原因不缓存
+        passed, reason = rules.evaluate_brush_conditions(config, torrent, task_index, False,
+                                                         pubminutes_func=lambda _: 60)
+        self.assertEqual((passed, reason), (False, "不符合包含规则"))
+        self.assertFalse(rules.is_stable_rejection(config, torrent, reason, pubminutes_func=lambda _: 60))
+        # 之后的周期重新完整判断，已超过发布时间上限的种子不再进入第二轮
+        passed, reason = rules.evaluate_brush_conditions(config, torrent, task_index, False,
+                                                         pubminutes_func=lambda _: 180)
+        self.assertFalse(passed)
+        self.assertNotIn(reason, rules.INCLUDE_EXCLUDE_REASONS)
+        self.assertTrue(rules.is_stable_rejection(config, torrent, reason, pubminutes_func=lambda _: 180))
+
+    def test_qb_torrent_info(self):
+        info = rules.get_qb_torrent_info({"hash": "h", "name": "n", "added_on": 1000, "completion_on": 1500,
+                                          "last_activity": 1900, "uploaded": 500, "ratio": 0.5,
+                                          "state": "stoppedUP", "total_size": 1000, "downloaded": 1000},
+                                         date_now=2000)
+        self.assertEqual((info["seeding_time"], info["iatime"], info["avg_upspeed"], info["dltime"]),
+                         (500, 100, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
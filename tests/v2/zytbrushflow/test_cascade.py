@@ -0,0 +1,51 @@
+"""ZYTBrushFlow 辅种关联索引测试。"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+
+ROOT = Path(__file__).resolve().parents[3]
+CASCADE_PATH = ROOT / "plugins.v2" / "zytbrushflow" / "cascade.py"
+SPEC = importlib.util.spec_from_file_location("zytbrushflow_test_cascade", CASCADE_PATH)
+cascade = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = cascade
+SPEC.loader.exec_module(cascade)
+
+
+def torrent(name, total_size):
+    return SimpleNamespace(name=name, total_size=total_size)
+
+
+class CascadeIndexTest(unittest.TestCase):
+    """验证按名称与大小分组的辅种查找。"""
+
+    def setUp(self):
+        self.index = cascade.CascadeIndex({
+            "a": torrent("Movie", 100),
+            "b": torrent("Movie", 100),
+            "c": torrent("Movie", 200),
+            "d": torrent("Show", 100),
+            "e": torrent("Show", 100),
+        })
+
+    def test_group_and_siblings(self):
+        self.assertEqual(self.index.group("a"), ["a", "b"])
+        self.assertEqual(self.index.siblings("b"), ["a"])
+        self.assertEqual(self.index.siblings("c"), [])
+        self.assertEqual(self.index.group("missing"), ["missing"])
+        self.assertEqual(self.index.key_of("d"), ("Show", 100))
+        self.assertIsNone(self.index.key_of("missing"))
+
+    def test_expand_is_deduplicated_and_keeps_unknown_hashes(self):
+        self.assertEqual(self.index.expand(["b", "a", "missing", "e"]), ["b", "a", "missing", "e", "d"])
+        self.assertEqual(self.index.expand(["c"]), ["c"])
+        self.assertEqual(self.index.expand([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""ZYTBrushFlow 删种阈值队列测试。"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+import unittest
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+
+ROOT = Path(__file__).resolve().parents[3]
+PLUGIN_DIR = ROOT / "plugins.v2" / "zytbrushflow"
+PACKAGE = types.ModuleType("zytbrushflow_test_deadlines_pkg")
+PACKAGE.__path__ = [str(PLUGIN_DIR)]
+sys.modules[PACKAGE.__name__] = PACKAGE
+deadlines = importlib.import_module(f"{PACKAGE.__name__}.deadlines")
+
+
+def config(del_no_free=False, download_time=None, hr_seed_time=None):
+    return SimpleNamespace(del_no_free=del_no_free, download_time=download_time, hr_seed_time=hr_seed_time)
+
+
+class DeadlinesTest(unittest.TestCase):
+    """验证删种阈值计算与最小堆队列。"""
+
+    def test_next_deadline(self):
+        now = datetime(2024, 1, 1, 10, 0, 0).timestamp()
+        task = {"time": now - 3600, "size": 100, "downloaded": 10, "freedate": "2024-01-01 12:00:00"}
+        self.assertEqual(deadlines.next_deadline(task, config(del_no_free=True, download_time=24), now), now + 7200)
+        self.assertEqual(deadlines.next_deadline(task, config(download_time=2), now), now + 3600)
+        self.assertIsNone(deadlines.next_deadline(task, config(download_time=1), now))
+        self.assertIsNone(deadlines.next_deadline(dict(task, deleted=True), config(del_no_free=True), now))
+
+        seeding = {"size": 100, "downloaded": 100, "hit_and_run": True, "seeding_time": 3600}
+        self.assertEqual(deadlines.next_deadline(seeding, config(del_no_free=True, hr_seed_time=3), now),
+                         now + 7200)
+        self.assertIsNone(deadlines.next_deadline(dict(seeding, hit_and_run=False), config(hr_seed_time=3), now))
+
+    def test_queue(self):
+        queue = deadlines.DeadlineQueue()
+        queue.push("a", 30)
+        queue.push("b", 10)
+        queue.push("c", 20)
+        queue.push("b", 40)
+        queue.push("c", None)
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(queue.next_due(), 30)
+        self.assertEqual(queue.pop_due(35), ["a"])
+        self.assertEqual(queue.pop_due(35), [])
+        self.assertEqual(queue.next_due(), 40)
+
+        queue.rebuild({"d": 5, "e": 5})
+        self.assertEqual(sorted(queue.pop_due(5)), ["d", "e"])
+        self.assertIsNone(queue.next_due())
+        self.assertEqual(len(queue), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
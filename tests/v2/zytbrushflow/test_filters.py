@@ -0,0 +1,78 @@
+"""ZYTBrushFlow 预编译过滤程序测试。"""
+
+from __future__ import annotations
+
+import importlib.util
+import re
+import sys
+import types
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[3]
+FILTERS_PATH = ROOT / "plugins.v2" / "zytbrushflow" / "filters.py"
+SPEC = importlib.util.spec_from_file_location("zytbrushflow_test_filters", FILTERS_PATH)
+filters = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = filters
+SPEC.loader.exec_module(filters)
+
+GB = 1024 ** 3
+
+
+class NumberRangeTest(unittest.TestCase):
+    """验证单值与范围的边界语义。"""
+
+    def test_single_value_bounds(self):
+        lower = filters.NumberRange.parse("10", scale=GB, single_bound="lower")
+        self.assertTrue(lower.single)
+        self.assertTrue(lower.contains(10 * GB))
+        self.assertFalse(lower.contains(9 * GB))
+        upper = filters.NumberRange.parse("5", single_bound="upper")
+        self.assertTrue(upper.contains(5))
+        self.assertFalse(upper.contains(6))
+        both = filters.NumberRange.parse(100, scale=GB, single_bound="both")
+        self.assertEqual((both.lower, both.upper), (100 * GB, 100 * GB))
+
+    def test_range_is_inclusive(self):
+        value = filters.NumberRange.parse("5.5-10")
+        self.assertFalse(value.single)
+        self.assertTrue(value.contains(5.5))
+        self.assertTrue(value.contains(10))
+        self.assertFalse(value.contains(10.1))
+
+    def test_empty_and_invalid(self):
+        self.assertIsNone(filters.NumberRange.parse(""))
+        self.assertIsNone(filters.NumberRange.parse(None))
+        with self.assertRaises(ValueError):
+            filters.NumberRange.parse("1-abc")
+
+
+class BrushFilterTest(unittest.TestCase):
+    """验证配置编译与包含/排除规则。"""
+
+    def test_from_config(self):
+        config = types.SimpleNamespace(size="1-20", seeder="3", pubtime="", delete_size_range="50-100",
+                                       include="官方|Official", exclude=r"\bDIY\b")
+        brush_filter = filters.BrushFilter.from_config(config)
+        self.assertEqual(brush_filter.size.lower, GB)
+        self.assertIsNone(brush_filter.pubtime)
+        self.assertEqual(brush_filter.delete_size.upper, 100 * GB)
+        self.assertTrue(brush_filter.match_include("movie.official.1080p", None))
+        self.assertTrue(brush_filter.match_include("x", "官方出品"))
+        self.assertFalse(brush_filter.match_include("x", "y"))
+        self.assertTrue(brush_filter.match_exclude("Disc diy", ""))
+        self.assertFalse(brush_filter.match_exclude("Disc", None))
+
+    def test_empty_rules_pass(self):
+        brush_filter = filters.BrushFilter()
+        self.assertTrue(brush_filter.match_include("a", "b"))
+        self.assertFalse(brush_filter.match_exclude("a", "b"))
+
+    def test_bad_pattern_fails_at_compile(self):
+        with self.assertRaises(re.error):
+            filters.BrushFilter(include="(unclosed")
+
+
+if __name__ == "__main__":
+    unittest.main()
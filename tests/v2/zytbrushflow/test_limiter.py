@@ -0,0 +1,95 @@
+"""ZYTBrushFlow 站点访问频控测试。"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+ROOT = Path(__file__).resolve().parents[3]
+LIMITER_PATH = ROOT / "plugins.v2" / "zytbrushflow" / "limiter.py"
+SPEC = importlib.util.spec_from_file_location("zytbrushflow_test_limiter", LIMITER_PATH)
+limiter = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = limiter
+SPEC.loader.exec_module(limiter)
+
+
+class LocalSiteVisitLimiterTest(unittest.TestCase):
+    """验证令牌桶补充、持久化与多实例共享。"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "site_visit.db"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_one_visit_per_check_time(self):
+        instance = limiter.LocalSiteVisitLimiter(self.path)
+        self.assertTrue(instance.acquire("site1", 600, now=1000))
+        self.assertFalse(instance.acquire("site1", 600, now=1300))
+        self.assertEqual(instance.wait_time("site1", 600, now=1300), 300)
+        # 站点之间互不影响
+        self.assertTrue(instance.acquire("site2", 600, now=1300))
+        self.assertTrue(instance.acquire("site1", 600, now=1600))
+
+    def test_capacity_allows_burst(self):
+        instance = limiter.LocalSiteVisitLimiter(self.path, capacity=2)
+        self.assertTrue(instance.acquire("site1", 100, now=0))
+        self.assertTrue(instance.acquire("site1", 100, now=0))
+        self.assertFalse(instance.acquire("site1", 100, now=50))
+        # 长时间未访问也最多累积 capacity 个令牌
+        self.assertTrue(instance.acquire("site1", 100, now=10000))
+        self.assertTrue(instance.acquire("site1", 100, now=10000))
+        self.assertFalse(instance.acquire("site1", 100, now=10000))
+
+    def test_state_shared_between_instances(self):
+        self.assertTrue(limiter.LocalSiteVisitLimiter(self.path).acquire("site1", 600, "qb1", now=1000))
+        self.assertFalse(limiter.LocalSiteVisitLimiter(self.path).acquire("site1", 600, "qb2", now=1100))
+
+
+class RemoteSiteVisitLimiterTest(unittest.TestCase):
+    """验证外部接口结果与异常时回退。"""
+
+    def test_remote_result(self):
+        response = mock.Mock(status_code=200)
+        response.json.return_value = {"check_pass": False}
+        get = mock.Mock(return_value=response)
+        instance = limiter.RemoteSiteVisitLimiter("http://localhost/check", request_func=get)
+        self.assertFalse(instance.acquire("site1", 600, "qb1"))
+        params = get.call_args.kwargs["params"]
+        self.assertEqual((params["site_name"], params["check_time"], params["downloader"]), ("site1", 600, "qb1"))
+
+    def test_remote_pass_consumes_fallback_token(self):
+        response = mock.Mock(status_code=200)
+        response.json.return_value = {"check_pass": True}
+        fallback = mock.Mock()
+        fallback.acquire.return_value = False
+        get = mock.Mock(return_value=response)
+        instance = limiter.RemoteSiteVisitLimiter("http://localhost/check", request_func=get, fallback=fallback)
+        self.assertTrue(instance.acquire("site1", 600, "qb1"))
+        fallback.acquire.assert_called_once_with("site1", 600, "qb1")
+        response.json.return_value = {"check_pass": False}
+        self.assertFalse(instance.acquire("site1", 600, "qb1"))
+        fallback.acquire.assert_called_once()
+
+    def test_fallback_on_error(self):
+        fallback = mock.Mock()
+        fallback.acquire.return_value = True
+        get = mock.Mock(side_effect=TimeoutError())
+        self.assertTrue(limiter.RemoteSiteVisitLimiter("http://localhost/check", request_func=get, fallback=fallback)
+                        .acquire("site1", 600, "qb1"))
+        logs = []
+        self.assertFalse(limiter.RemoteSiteVisitLimiter("http://localhost/check", request_func=get, log_func=logs.append)
+                         .acquire("site1", 600))
+        self.assertEqual(len(logs), 1)
+        self.assertTrue(logs[0].startswith("频控接口请求异常"))
+        fallback.acquire.assert_called_once_with("site1", 600, "qb1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""ZYTBrushFlow 多关键词匹配器测试。"""
+
+from __future__ import annotations
+
+import importlib.util
+import random
+import sys
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[3]
+MATCHER_PATH = ROOT / "plugins.v2" / "zytbrushflow" / "matcher.py"
+SPEC = importlib.util.spec_from_file_location("zytbrushflow_test_matcher", MATCHER_PATH)
+matcher = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = matcher
+SPEC.loader.exec_module(matcher)
+
+
+class KeywordMatcherTest(unittest.TestCase):
+    """验证自动机与逐个子串判断的结果一致。"""
+
+    def test_overlapping_keywords(self):
+        keyword_matcher = matcher.KeywordMatcher(["he", "she", "his", "hers", "", "流浪地球"])
+        self.assertEqual(keyword_matcher.find_all("ushers"), ["she", "he", "hers"])
+        self.assertEqual(keyword_matcher.search("Wandering Earth", "流浪地球2 4K"), "流浪地球")
+        self.assertIsNone(keyword_matcher.search("HERS", None))
+        self.assertEqual(len(keyword_matcher), 5)
+
+    def test_empty_matcher(self):
+        keyword_matcher = matcher.KeywordMatcher()
+        self.assertFalse(keyword_matcher)
+        self.assertIsNone(keyword_matcher.search("anything"))
+        self.assertEqual(keyword_matcher.find_all("anything"), [])
+
+    def test_matches_naive_substring_scan(self):
+        rng = random.Random(7)
+        alphabet = "abc"
+        keywords = {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(30)}
+        keyword_matcher = matcher.KeywordMatcher(keywords)
+        for _ in range(200):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            self.assertEqual(set(keyword_matcher.find_all(text)), {keyword for keyword in keywords if keyword in text})
+            self.assertEqual(keyword_matcher.search(text) is not None, any(keyword in text for keyword in keywords))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""ZYTBrushFlow 刷流容量规划测试。"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+
+ROOT = Path(__file__).resolve().parents[3]
+PLUGIN_DIR = ROOT / "plugins.v2" / "zytbrushflow"
+PACKAGE = types.ModuleType("zytbrushflow_test_planner_pkg")
+PACKAGE.__path__ = [str(PLUGIN_DIR)]
+sys.modules[PACKAGE.__name__] = PACKAGE
+planner = importlib.import_module(f"{PACKAGE.__name__}.planner")
+snapshot = importlib.import_module(f"{PACKAGE.__name__}.snapshot")
+
+
+def candidate(title, size=10, seeders=5, peers=1, uploadvolumefactor=1):
+    return SimpleNamespace(title=title, size=size, seeders=seeders, peers=peers,
+                           uploadvolumefactor=uploadvolumefactor)
+
+
+def downloading(count):
+    return snapshot.DownloaderSnapshot(torrents=[{"state": "downloading"}] * count, is_qbittorrent=True)
+
+
+class CapacityPlanTest(unittest.TestCase):
+    """验证容量余量计算、排名与贪心选择。"""
+
+    def test_rank_prefers_demand_and_promotion(self):
+        torrents = [candidate("crowded", seeders=50, peers=2), candidate("hot", seeders=1, peers=20),
+                    candidate("double", seeders=5, peers=1, uploadvolumefactor=2), candidate("plain")]
+        self.assertEqual([torrent.title for torrent in planner.rank_torrents(torrents)],
+                         ["hot", "double", "plain", "crowded"])
+
+    def test_slots_and_limits(self):
+        plan = planner.CapacityPlan({"qb": downloading(1), "tr": downloading(3)}, max_downloading=3)
+        self.assertEqual(plan.slots("qb"), 2)
+        self.assertEqual(plan.total_slots, 2)
+        self.assertEqual(plan.available(), ["qb"])
+        self.assertEqual(plan.limit_of("tr"), "maxdlcount")
+        self.assertIsNone(planner.CapacityPlan({"qb": downloading(1)}).total_slots)
+
+    def test_invalid_snapshot_unavailable(self):
+        dead = snapshot.DownloaderSnapshot(torrents=None, is_qbittorrent=True)
+        plan = planner.CapacityPlan({"live": downloading(1), "dead": dead}, max_downloading=3)
+        self.assertEqual(plan.available(), ["live"])
+        self.assertEqual(plan.limit_of("dead"), "connection")
+        self.assertEqual(plan.total_slots, 2)
+        self.assertTrue(planner.CapacityPlan({"dead": dead}).exhausted)
+
+    def test_select_is_greedy_within_budgets(self):
+        plan = planner.CapacityPlan({"qb": downloading(0)}, max_downloading=2, byte_budget=25)
+        torrents = [candidate("big", size=20), candidate("huge", size=30), candidate("small", size=5),
+                    candidate("late", size=1)]
+        selected, skipped = plan.select(torrents, pick_func=lambda available, _: available[0])
+        self.assertEqual([torrent.title for torrent, _ in selected], ["big", "small"])
+        self.assertEqual([(torrent.title, reason) for torrent, reason in skipped],
+                         [("huge", "超过剩余保种体积"), ("late", "下载器已达到任务数上限")])
+        self.assertEqual(plan.byte_budget, 0)
+        self.assertTrue(plan.exhausted)
+
+        plan.release("qb", 5)
+        self.assertEqual(plan.byte_budget, 5)
+        self.assertEqual(plan.available(), ["qb"])
+
+    def test_select_respects_limit(self):
+        plan = planner.CapacityPlan({"qb": downloading(0)}, max_downloading=5)
+        selected, skipped = plan.select([candidate("a"), candidate("b"), candidate("c")],
+                                        pick_func=lambda available, _: available[0], limit=1)
+        self.assertEqual([torrent.title for torrent, _ in selected], ["a"])
+        self.assertEqual([reason for _, reason in skipped], ["超过站点本周期新增配额"] * 2)
+        self.assertEqual(plan.slots("qb"), 4)
+
+    def test_bandwidth_headroom(self):
+        plan = planner.CapacityPlan({"qb": downloading(0)}, upload_limit=100, upload_speed=120)
+        self.assertEqual(plan.upload_headroom, -20)
+        self.assertIsNone(plan.download_headroom)
+        self.assertTrue(plan.exhausted)
+        self.assertFalse(planner.CapacityPlan({"qb": downloading(0)}, upload_limit=100).exhausted)
+
+
+if __name__ == "__main__":
+    unittest.main()
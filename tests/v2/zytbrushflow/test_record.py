@@ -0,0 +1,56 @@
+"""ZYTBrushFlow 紧凑任务记录测试。"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import sys
+import types
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[3]
+PLUGIN_DIR = ROOT / "plugins.v2" / "zytbrushflow"
+# 以独立包名加载辅助模块，不执行依赖 MoviePilot 的插件入口
+PACKAGE = types.ModuleType("zytbrushflow_test_record_pkg")
+PACKAGE.__path__ = [str(PLUGIN_DIR)]
+sys.modules[PACKAGE.__name__] = PACKAGE
+record = importlib.import_module(f"{PACKAGE.__name__}.record")
+
+
+class TaskRecordTest(unittest.TestCase):
+    """验证与字典形式的无损转换、紧凑存储与字符串驻留。"""
+
+    def test_dict_round_trip_keeps_missing_none_and_unknown_keys(self):
+        task = {"site": 1, "site_name": "站点A", "title": "T", "description": None, "hit_and_run": None,
+                "deleted": True, "deleted_time": 2.5, "time": 1.0, "custom": {"a": 1}}
+        result = record.TaskRecord.from_dict(task)
+        self.assertEqual(result.to_dict(), task)
+        self.assertNotIn("pubdate", result.to_dict())
+        self.assertIsNone(result.get("pubdate"))
+        self.assertEqual(result.get("custom"), {"a": 1})
+
+    def test_encode_decode(self):
+        task = {"site_name": "站点A", "title": "T", "size": 10, "ratio": 1.5, "deleted": False}
+        encoded = record.TaskRecord.from_dict(task).encode()
+        packed = json.loads(encoded)
+        self.assertEqual(len(packed), len(record.FIELDS) + 1)
+        self.assertEqual(packed[record.FIELDS.index("title") + 1], "T")
+        self.assertEqual(record.TaskRecord.decode(encoded).to_dict(), task)
+        # 兼容旧版本的字典 JSON
+        self.assertEqual(record.TaskRecord.decode(json.dumps(task)).to_dict(), task)
+        self.assertEqual(record.TaskRecord.decode(encoded), record.TaskRecord.from_dict(task))
+        self.assertNotEqual(record.TaskRecord.decode(encoded), record.TaskRecord.from_dict({**task, "size": 11}))
+
+    def test_site_name_interned(self):
+        first = record.TaskRecord.decode(record.TaskRecord.from_dict({"site_name": "".join(["站", "点"])}).encode())
+        second = record.TaskRecord.from_dict({"site_name": "".join(["站", "点"])})
+        self.assertIs(first.site_name, second.site_name)
+
+    def test_column_path(self):
+        self.assertEqual(record.column_path("site"), "$[1]")
+
+
+if __name__ == "__main__":
+    unittest.main()
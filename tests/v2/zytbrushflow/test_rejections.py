@@ -0,0 +1,72 @@
+"""ZYTBrushFlow 已判断种子缓存测试。"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+
+ROOT = Path(__file__).resolve().parents[3]
+REJECTIONS_PATH = ROOT / "plugins.v2" / "zytbrushflow" / "rejections.py"
+SPEC = importlib.util.spec_from_file_location("zytbrushflow_test_rejections", REJECTIONS_PATH)
+rejections = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = rejections
+SPEC.loader.exec_module(rejections)
+
+
+def torrent(page_url, pubdate="2024-01-01 10:00:00", seeders=3, downloadvolumefactor=0):
+    return SimpleNamespace(page_url=page_url, enclosure=None, title=page_url, pubdate=pubdate, seeders=seeders,
+                           downloadvolumefactor=downloadvolumefactor, uploadvolumefactor=1, hit_and_run=False,
+                           freedate=None)
+
+
+class RejectionCacheTest(unittest.TestCase):
+    """验证高水位与不通过原因缓存。"""
+
+    def test_watermark(self):
+        cache = rejections.RejectionCache()
+        old = torrent("a", pubdate="2024-01-01 10:00:00")
+        self.assertTrue(cache.is_new("site", old))
+        cache.advance("site", old)
+        self.assertFalse(cache.is_new("site", old))
+        self.assertTrue(cache.is_new("site", torrent("b", pubdate="2024-01-01 10:00:00")))
+        self.assertTrue(cache.is_new("site", torrent("c", pubdate="2024-01-01 11:00:00")))
+        self.assertTrue(cache.is_new("other", old))
+        cache.advance("site", torrent("d", pubdate="2024-01-01 09:00:00"))
+        self.assertEqual(cache.watermark("site"), ("2024-01-01 10:00:00", "a"))
+
+    def test_get_requires_same_mutable_fields(self):
+        cache = rejections.RejectionCache(ttl=100)
+        cache.put("site", torrent("a"), "存在H&R", now=0)
+        # 高于水位的种子一定是新种子，不查缓存
+        self.assertIsNone(cache.get("site", torrent("a"), now=1))
+        cache.advance("site", torrent("z", pubdate="2024-01-02 00:00:00"))
+        self.assertEqual(cache.get("site", torrent("a"), now=1), "存在H&R")
+        self.assertIsNone(cache.get("site", torrent("a", seeders=9), now=1))
+        self.assertEqual(len(cache), 0)
+        cache.put("site", torrent("a"), "存在H&R", now=0)
+        self.assertIsNone(cache.get("site", torrent("a"), now=100))
+        cache.put("site", torrent("a"), None, now=0)
+        self.assertEqual(len(cache), 0)
+
+    def test_capacity_and_persistence(self):
+        cache = rejections.RejectionCache(capacity=2, signature="v1")
+        cache.advance("site", torrent("z", pubdate="2024-01-02 00:00:00"))
+        for name in ("a", "b", "c"):
+            cache.put("site", torrent(name), "非免费种子", now=0)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("site", torrent("a"), now=1))
+
+        data = cache.to_dict(now=1)
+        restored = rejections.RejectionCache.from_dict(data, capacity=2, signature="v1")
+        self.assertEqual(restored.get("site", torrent("c"), now=1), "非免费种子")
+        self.assertEqual(len(rejections.RejectionCache.from_dict(data, signature="v2")), 0)
+        self.assertEqual(len(rejections.RejectionCache.from_dict({"signature": "v1", "entries": [[1]]},
+                                                                 signature="v1")), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
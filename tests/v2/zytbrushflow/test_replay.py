@@ -0,0 +1,120 @@
+"""ZYTBrushFlow 刷流决策离线回放测试。"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+
+ROOT = Path(__file__).resolve().parents[3]
+PLUGIN_DIR = ROOT / "plugins.v2" / "zytbrushflow"
+# 以独立包名加载辅助模块，不执行依赖 MoviePilot 的插件入口
+PACKAGE = types.ModuleType("zytbrushflow_test_replay_pkg")
+PACKAGE.__path__ = [str(PLUGIN_DIR)]
+sys.modules[PACKAGE.__name__] = PACKAGE
+replay = importlib.import_module(f"{PACKAGE.__name__}.replay")
+
+GB = 1024 ** 3
+NOW = 1_700_000_000
+
+
+def candidate(site_name, title, **extra):
+    values = dict(site_name=site_name, title=title, description="", size=10 * GB, seeders=5, peers=1,
+                  pubdate=None, page_url=f"https://{site_name}/{title}", imdbid=None, downloadvolumefactor=0,
+                  uploadvolumefactor=1, hit_and_run=False, freedate=None, date_elapsed=None, volume_factor=None,
+                  freedate_diff=None, labels=[])
+    values.update(extra)
+    return SimpleNamespace(**values)
+
+
+def seeding(torrent_hash, name, total_size=10 * GB, **extra):
+    values = dict(hash=torrent_hash, name=name, total_size=total_size, state="uploading", upspeed=0, dlspeed=0,
+                  added_on=NOW - 200 * 3600, completion_on=NOW - 100 * 3600, last_activity=NOW, ratio=1,
+                  uploaded=total_size, downloaded=total_size, tags="刷流")
+    values.update(extra)
+    return values
+
+
+class ReplaySimulatorTest(unittest.TestCase):
+    """验证回放的刷流/删种决策与报告。"""
+
+    def test_brush_applies_rules_and_limits(self):
+        simulator = replay.ReplaySimulator(
+            config={"freeleech": "free", "exclude": "DV", "maxdlcount": 2},
+            torrent_tasks={"old": {"site_name": "A", "title": "Dup", "size": GB, "deleted": False}},
+            subscribe_titles=["订阅剧"])
+        admitted = simulator.brush(site_torrents=[
+            ("A", [candidate("A", "Dup"), candidate("A", "Paid", downloadvolumefactor=1),
+                   candidate("A", "Movie DV"), candidate("A", "订阅剧 S01"), candidate("A", "Ok1")]),
+            ("B", [candidate("B", "Ok2"), candidate("B", "Ok3")]),
+        ], now=NOW)
+        self.assertEqual(len(admitted), 2)
+        self.assertEqual([simulator.torrent_tasks[h]["title"] for h in admitted], ["Ok1", "Ok2"])
+        report = simulator.report()
+        self.assertEqual(report["cycles"], {"brush": 1})
+        self.assertEqual(report["decisions"], 6)
+        self.assertIn("brush.evaluate", report["phases"])
+
+    def test_check_deletes_with_cross_seeds(self):
+        downloader = replay.FakeDownloader([seeding("a", "Movie"), seeding("a2", "Movie"),
+                                            seeding("b", "Show", completion_on=NOW - 3600)])
+        simulator = replay.ReplaySimulator(
+            config={"seed_time": 48},
+            torrent_tasks={"a": {"site_name": "A", "title": "Movie", "deleted": False},
+                           "b": {"site_name": "A", "title": "Show", "deleted": False},
+                           "gone": {"site_name": "A", "title": "Gone", "deleted": False}},
+            downloader=downloader)
+        self.assertEqual(simulator.check(now=NOW), ["a"])
+        self.assertEqual([torrent["hash"] for torrent in downloader.get_torrents()], ["b"])
+        self.assertTrue(simulator.torrent_tasks["gone"]["deleted"])
+        self.assertFalse(simulator.torrent_tasks["b"]["deleted"])
+
+    def test_record_and_replay_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "replay.jsonl.gz"
+            recorder = replay.ReplayRecorder(path, cycles=2)
+            recorder.begin_cycle("brush", config={"freeleech": "free"}, site_configs={"B": {"freeleech": ""}},
+                                 torrent_tasks={})
+            recorder.record_downloader([], is_qbittorrent=True)
+            recorder.record_bandwidth(0, 0)
+            recorder.record_site("A", [candidate("A", "One"), candidate("A", "Paid", downloadvolumefactor=1)])
+            recorder.record_site("B", [candidate("B", "Paid", downloadvolumefactor=1)])
+            recorder.end_cycle()
+            recorder.begin_cycle("check", config={"freeleech": "free", "seed_time": 1}, site_configs={},
+                                 torrent_tasks={"ignored": {}})
+            recorder.end_cycle()
+            self.assertFalse(recorder.active)
+            recorder.record_site("A", [candidate("A", "Late")])
+
+            records = list(replay.load_records(path))
+            self.assertEqual([record["type"] for record in records].count("cycle"), 2)
+            report = replay.ReplaySimulator().replay(records)
+        self.assertEqual(report["cycles"], {"brush": 1, "check": 1})
+        self.assertEqual(len(report["admitted"]), 2)
+        self.assertEqual(report["deleted"], [])
+
+    def test_replay_merges_downloaders(self):
+        records = [{"type": "cycle", "kind": "check", "time": NOW},
+                   {"type": "downloader", "downloader": "qb", "torrents": [seeding("a", "Movie")]},
+                   {"type": "downloader", "downloader": "tr", "torrents": [seeding("b", "Show")]}]
+        simulator = replay.ReplaySimulator()
+        simulator.replay(records)
+        self.assertEqual(sorted(torrent["hash"] for torrent in simulator.downloader.get_torrents()), ["a", "b"])
+
+    def test_benchmark_is_deterministic(self):
+        first = replay.run_benchmark(candidates=300, tasks=1000, sites=5, seed=3)
+        second = replay.run_benchmark(candidates=300, tasks=1000, sites=5, seed=3)
+        self.assertEqual(first["admitted"], second["admitted"])
+        self.assertEqual(first["deleted"], second["deleted"])
+        self.assertTrue(first["admitted"])
+        self.assertTrue(first["deleted"])
+        self.assertGreater(first["decisions_per_second"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
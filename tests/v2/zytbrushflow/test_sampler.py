@@ -0,0 +1,64 @@
+"""ZYTBrushFlow 带宽采样器测试。"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[3]
+SAMPLER_PATH = ROOT / "plugins.v2" / "zytbrushflow" / "sampler.py"
+SPEC = importlib.util.spec_from_file_location("zytbrushflow_test_sampler", SAMPLER_PATH)
+sampler = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = sampler
+SPEC.loader.exec_module(sampler)
+
+
+class BandwidthSamplerTest(unittest.TestCase):
+    """验证环形缓冲区、窗口均值与 EWMA。"""
+
+    def test_empty_sampler(self):
+        instance = sampler.BandwidthSampler(sample_func=lambda: None)
+        self.assertEqual(instance.mean(), (None, None))
+        self.assertEqual(instance.ewma(), (None, None))
+        self.assertFalse(instance.sample())
+        self.assertEqual(instance.history(), [])
+
+    def test_ring_buffer_window_and_ewma(self):
+        instance = sampler.BandwidthSampler(sample_func=lambda: None, capacity=3, alpha=0.5)
+        for ts, up in ((1, 100), (2, 200), (3, 300), (10, 400)):
+            instance.record(up, up * 2, timestamp=ts)
+        self.assertEqual(len(instance), 3)
+        self.assertEqual(instance.mean(), (300.0, 600.0))
+        # 只取最近 5 秒，停顿的早期采样不参与计算
+        self.assertEqual(instance.mean(window=5), (400.0, 800.0))
+        self.assertEqual(instance.ewma(), (312.5, 625.0))
+        self.assertEqual([item["time"] for item in instance.history(window=7)], [3, 10])
+
+    def test_sample_swallows_errors(self):
+        def broken():
+            raise RuntimeError("downloader down")
+
+        instance = sampler.BandwidthSampler(sample_func=broken)
+        self.assertFalse(instance.sample())
+
+    def test_background_thread_start_stop(self):
+        sampled = threading.Event()
+
+        def sample_func():
+            sampled.set()
+            return 1024, 2048
+
+        instance = sampler.BandwidthSampler(sample_func=sample_func, interval=0.01)
+        instance.start()
+        self.assertTrue(sampled.wait(1))
+        instance.stop(timeout=1)
+        self.assertFalse(instance.running)
+        self.assertGreaterEqual(len(instance), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
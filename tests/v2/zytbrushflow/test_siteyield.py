@@ -0,0 +1,91 @@
+"""ZYTBrushFlow 站点收益统计测试。"""
+
+from __future__ import annotations
+
+import importlib
+import random
+import sys
+import threading
+import types
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[3]
+PLUGIN_DIR = ROOT / "plugins.v2" / "zytbrushflow"
+PACKAGE = types.ModuleType("zytbrushflow_test_siteyield_pkg")
+PACKAGE.__path__ = [str(PLUGIN_DIR)]
+sys.modules[PACKAGE.__name__] = PACKAGE
+siteyield = importlib.import_module(f"{PACKAGE.__name__}.siteyield")
+
+GB = 1024 ** 3
+
+
+class SiteYieldTest(unittest.TestCase):
+    """验证站点收益增量累计、权重与配额分配。"""
+
+    def test_reason_category(self):
+        self.assertEqual(siteyield.reason_category("做种时间 50.0 小时，大于 48 小时"), "做种时间")
+        self.assertEqual(siteyield.reason_category("H&R种子，分享率 2.00，大于 1"), "分享率")
+        self.assertEqual(siteyield.reason_category("触发动态删除阈值，下载耗时 3.0 小时，大于 2 小时"), "下载超时")
+        self.assertEqual(siteyield.reason_category("触发动态删除阈值，系统自动删除"), "动态删种")
+        self.assertEqual(siteyield.reason_category(None), "其他")
+
+    def test_incremental_progress(self):
+        stats = siteyield.SiteYieldStats()
+        stats.record_added("A")
+        task = {"time": 1000, "uploaded": 0, "downloaded": 0, "ratio": 0}
+        stats.record_progress("A", task, {"uploaded": GB, "downloaded": 2 * GB, "ratio": 0.5}, now=2000)
+        task.update(uploaded=GB, downloaded=2 * GB, ratio=0.5)
+        stats.record_progress("A", task, {"uploaded": 4 * GB, "downloaded": 2 * GB, "ratio": 2}, now=1000 + 7200)
+        task.update(uploaded=4 * GB, ratio=2)
+        stats.record_progress("A", task, {"uploaded": 5 * GB, "downloaded": 2 * GB, "ratio": 2.5}, now=9000)
+        stats.record_deleted("A", "分享率 2.50，大于 2")
+        self.assertEqual(stats.upload_per_gb("A"), 2.5)
+        self.assertEqual(stats.ratio_one_hours("A"), 2)
+        summary = stats.summary()[0]
+        self.assertEqual((summary["tasks"], summary["reasons"]), (1, {"分享率": 1}))
+
+        restored = siteyield.SiteYieldStats.from_dict(stats.to_dict())
+        self.assertEqual(restored.summary(), stats.summary())
+        self.assertIsNone(restored.upload_per_gb("B"))
+
+    def test_summary_while_recording(self):
+        stats = siteyield.SiteYieldStats()
+
+        def record():
+            for index in range(5000):
+                stats.record_added(f"site{index}")
+
+        thread = threading.Thread(target=record)
+        thread.start()
+        try:
+            while thread.is_alive():
+                stats.summary()
+        finally:
+            thread.join()
+        self.assertEqual(len(stats.summary()), 5000)
+
+    def test_weights_and_quotas(self):
+        self.assertEqual(siteyield.SiteYieldStats().weights(["A", "B"]), {"A": 1.0, "B": 1.0})
+        stats = siteyield.SiteYieldStats.from_tasks([
+            {"site_name": "A", "uploaded": 300 * GB, "downloaded": 100 * GB},
+            {"site_name": "B", "uploaded": 0, "downloaded": 100 * GB},
+        ])
+        weights = stats.weights(["A", "B", "C"])
+        self.assertGreater(weights["A"], weights["C"])
+        self.assertGreater(weights["C"], weights["B"])
+        self.assertEqual(weights["C"], 1.5)
+
+        quotas = siteyield.site_quotas(["A", "B"], {"A": 3.0, "B": 1.0}, total=8)
+        self.assertEqual(quotas, {"A": 6, "B": 2})
+        self.assertEqual(siteyield.site_quotas(["A"], {"A": 0.01}, total=0), {"A": 1})
+        self.assertEqual(siteyield.site_quotas(["A"], {}, total=None), {})
+
+        rng = random.Random(0)
+        firsts = [siteyield.weighted_order(["A", "B"], {"A": 100.0, "B": 0.01}, rng=rng)[0] for _ in range(20)]
+        self.assertEqual(firsts, ["A"] * 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
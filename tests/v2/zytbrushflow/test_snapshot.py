@@ -0,0 +1,76 @@
+"""ZYTBrushFlow 下载器状态快照测试。"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import types
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[3]
+SNAPSHOT_PATH = ROOT / "plugins.v2" / "zytbrushflow" / "snapshot.py"
+SPEC = importlib.util.spec_from_file_location("zytbrushflow_test_snapshot", SNAPSHOT_PATH)
+snapshot = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = snapshot
+SPEC.loader.exec_module(snapshot)
+
+
+class DownloaderSnapshotTest(unittest.TestCase):
+    """验证快照计数与本地累加。"""
+
+    def test_qbittorrent_counts_follow_downloading_filter(self):
+        torrents = [
+            {"state": "downloading", "upspeed": 20480},
+            {"state": "stalledDL", "upspeed": 0},
+            {"state": "pausedDL", "upspeed": 0},
+            {"state": "uploading", "upspeed": 20480},
+            {"state": "uploading", "upspeed": 100},
+            {"state": "stalledUP", "upspeed": 0},
+        ]
+        result = snapshot.DownloaderSnapshot(torrents=torrents, is_qbittorrent=True)
+        self.assertTrue(result.valid)
+        self.assertEqual(result.downloading_count, 3)
+        self.assertEqual(result.active_count, 2)
+
+    def test_transmission_counts(self):
+        torrents = [
+            types.SimpleNamespace(status="downloading", rate_upload=0),
+            types.SimpleNamespace(status="download_pending", rate_upload=0),
+            types.SimpleNamespace(status="seeding", rate_upload=40960),
+        ]
+        result = snapshot.DownloaderSnapshot(torrents=torrents, is_qbittorrent=False)
+        self.assertEqual(result.downloading_count, 2)
+        self.assertEqual(result.active_count, 1)
+        self.assertEqual(result.upload_speed, 40960)
+        self.assertEqual(result.upload_headroom, -40960)
+
+    def test_upload_headroom_and_free_space(self):
+        torrents = [{"state": "uploading", "upspeed": 1000}, {"state": "stalledUP", "upspeed": 24}]
+        result = snapshot.DownloaderSnapshot(torrents=torrents, is_qbittorrent=True, upload_limit=4096,
+                                             free_space=100)
+        self.assertEqual(result.upload_headroom, 3072)
+        result.record_added(size=30)
+        self.assertEqual(result.free_space, 70)
+        result.record_cancelled(size=30)
+        self.assertEqual(result.free_space, 100)
+        self.assertEqual(result.added_count, 0)
+
+    def test_record_added_updates_counts_locally(self):
+        result = snapshot.DownloaderSnapshot(torrents=[], is_qbittorrent=True)
+        result.record_added()
+        result.record_added(2)
+        self.assertEqual(result.added_count, 3)
+        self.assertEqual(result.downloading_count, 3)
+        self.assertEqual(result.active_count, 3)
+
+    def test_failed_fetch_is_invalid_and_empty(self):
+        result = snapshot.DownloaderSnapshot(torrents=None, is_qbittorrent=True)
+        self.assertFalse(result.valid)
+        self.assertEqual(result.downloading_count, 0)
+        self.assertEqual(result.active_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""ZYTBrushFlow SQLite 任务存储测试。"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import sqlite3
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[3]
+PLUGIN_DIR = ROOT / "plugins.v2" / "zytbrushflow"
+# 以独立包名加载辅助模块，不执行依赖 MoviePilot 的插件入口
+PACKAGE = types.ModuleType("zytbrushflow_test_store_pkg")
+PACKAGE.__path__ = [str(PLUGIN_DIR)]
+sys.modules[PACKAGE.__name__] = PACKAGE
+store = importlib.import_module(f"{PACKAGE.__name__}.store")
+record = importlib.import_module(f"{PACKAGE.__name__}.record")
+
+
+def task(site_name="站点A", title="T", **extra):
+    return {"site_name": site_name, "title": title, "deleted": False, "time": 1.0, "uploaded": 0, **extra}
+
+
+class TaskStoreTest(unittest.TestCase):
+    """验证按行增量写入、事务与迁移。"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "tasks.db"
+        self.store = store.TaskStore(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def rows(self, bucket):
+        with sqlite3.connect(self.path) as conn:
+            return dict(conn.execute("SELECT hash, deleted FROM tasks WHERE bucket = ?", (bucket,)).fetchall())
+
+    def test_save_only_changed_rows(self):
+        self.assertEqual(self.store.save("torrents", {"a": task(), "b": task(title="B")}), 2)
+        tasks = self.store.load("torrents")
+        self.assertEqual(self.store.save("torrents", tasks), 0)
+        tasks["a"]["uploaded"] = 1024
+        tasks["b"]["deleted"] = True
+        del tasks["b"]
+        tasks["c"] = task(title="C", deleted=True)
+        self.assertEqual(self.store.save("torrents", tasks), 3)
+        self.assertEqual(self.rows("torrents"), {"a": 0, "c": 1})
+        # 新实例从数据库读取，结果与缓存一致
+        self.assertEqual(store.TaskStore(self.path).load("torrents"), tasks)
+
+    def test_loaded_copies_do_not_leak_into_cache(self):
+        self.store.save("torrents", {"a": task()})
+        tasks = self.store.load("torrents")
+        tasks["a"]["uploaded"] = 99
+        self.assertEqual(self.store.load("torrents")["a"]["uploaded"], 0)
+
+    def test_transaction_commits_once_and_rolls_back_on_error(self):
+        with self.store.transaction():
+            self.store.save("torrents", {"a": task()})
+            self.store.save("unmanaged", {"b": task()})
+            self.assertEqual(self.rows("torrents"), {})
+            with self.store.transaction():
+                self.store.save("torrents", {"a": task(), "c": task(title="C")})
+        self.assertEqual(self.rows("torrents"), {"a": 0, "c": 0})
+        self.assertEqual(self.rows("unmanaged"), {"b": 0})
+
+        with self.assertRaises(RuntimeError):
+            with self.store.transaction():
+                self.store.save("torrents", {})
+                raise RuntimeError("check failed")
+        self.assertEqual(set(self.store.load("torrents")), {"a", "c"})
+
+    def test_after_commit_runs_only_when_committed(self):
+        calls = []
+        self.store.after_commit(lambda: calls.append("direct"))
+        with self.store.transaction():
+            self.store.update("archived", {"a": task()})
+            with self.store.transaction():
+                self.store.after_commit(lambda: calls.append("archived"))
+            self.assertEqual(calls, ["direct"])
+        self.assertEqual(calls, ["direct", "archived"])
+
+        with self.assertRaises(RuntimeError):
+            with self.store.transaction():
+                self.store.after_commit(lambda: calls.append("rolled back"))
+                raise RuntimeError("check failed")
+        with self.store.transaction():
+            self.store.after_commit(lambda: calls.append("unchanged"))
+        self.assertEqual(calls, ["direct", "archived", "unchanged"])
+
+    def test_get_and_update_partial_rows(self):
+        self.store.save("archived", {"a": task(), "b": task(title="B")})
+        fresh = store.TaskStore(self.path)
+        self.assertEqual(set(fresh.get("archived", ["a", "x"])), {"a"})
+        with fresh.transaction():
+            fresh.update("archived", {"c": task(title="C")})
+            self.assertEqual(set(fresh.get("archived", ["a", "c"])), {"a", "c"})
+            self.assertEqual(self.rows("archived"), {"a": 0, "b": 0})
+        self.assertEqual(self.rows("archived"), {"a": 0, "b": 0, "c": 0})
+        self.assertEqual(set(fresh.load("archived")), {"a", "b", "c"})
+
+    def test_query_filters_sorts_and_paginates(self):
+        self.store.save("torrents", {
+            "a": task(site_name="站点A", title="Movie 100%", time=3.0, size=10),
+            "b": task(site_name="站点A", title="Movie_B", time=2.0, size=30, deleted=True),
+            "c": task(site_name="站点B", title="Show", time=1.0, size=20),
+        })
+        total, rows = self.store.query("torrents", limit=2)
+        self.assertEqual((total, [torrent_hash for torrent_hash, _ in rows]), (3, ["a", "b"]))
+        total, rows = self.store.query("torrents", sort="size", desc=False, offset=1, limit=5)
+        self.assertEqual((total, [torrent_hash for torrent_hash, _ in rows]), (3, ["c", "b"]))
+        self.assertEqual(self.store.query("torrents", site_name="站点A", deleted=False)[0], 1)
+        self.assertEqual([h for h, _ in self.store.query("torrents", keyword="movie")[1]], ["a", "b"])
+        self.assertEqual([h for h, _ in self.store.query("torrents", keyword="%")[1]], ["a"])
+        self.assertEqual([h for h, _ in self.store.query("torrents", keyword="_")[1]], ["b"])
+        self.assertEqual(self.store.site_names("torrents"), ["站点A", "站点B"])
+        with self.assertRaises(ValueError):
+            self.store.query("torrents", sort="data")
+
+    def test_migrate_once_and_clear(self):
+        self.assertTrue(self.store.migrate({"torrents": {"a": task()}, "archived": {"z": task(deleted=True)},
+                                            "unmanaged": None}))
+        self.assertFalse(self.store.migrate({"torrents": {"x": task()}}))
+        self.assertEqual(set(self.store.load("torrents")), {"a"})
+        self.assertEqual(self.store.count("archived"), 1)
+        self.store.clear()
+        self.assertEqual(self.store.load("archived"), {})
+        self.assertEqual(self.store.count("torrents"), 0)
+
+    def test_legacy_dict_rows_converted_to_packed_records(self):
+        legacy = task(title="旧任务", size=3, extra_key=[1, 2])
+        with sqlite3.connect(self.path) as conn:
+            conn.execute("INSERT INTO tasks (bucket, hash, site_name, deleted, time, data) VALUES (?, ?, ?, ?, ?, ?)",
+                         ("torrents", "h1", "站点A", 0, 1.0, json.dumps(legacy, ensure_ascii=False)))
+            conn.execute("DELETE FROM meta WHERE key = 'format'")
+        reopened = store.TaskStore(self.path)
+        with sqlite3.connect(self.path) as conn:
+            data = conn.execute("SELECT data FROM tasks WHERE hash = 'h1'").fetchone()[0]
+        self.assertIsInstance(json.loads(data), list)
+        self.assertEqual(reopened.load("torrents"), {"h1": legacy})
+        self.assertEqual(reopened.query("torrents", keyword="旧")[0], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
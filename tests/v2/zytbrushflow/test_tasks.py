@@ -0,0 +1,55 @@
+"""ZYTBrushFlow 刷流任务索引测试。"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[3]
+TASKS_PATH = ROOT / "plugins.v2" / "zytbrushflow" / "tasks.py"
+SPEC = importlib.util.spec_from_file_location("zytbrushflow_test_tasks", TASKS_PATH)
+tasks = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = tasks
+SPEC.loader.exec_module(tasks)
+
+
+class TaskIndexTest(unittest.TestCase):
+    """验证重复种子索引与逐个扫描的判断结果一致。"""
+
+    def setUp(self):
+        self.index = tasks.TaskIndex({
+            "h1": {"site_name": "站点A", "title": "Movie.2024", "page_url": "https://a/details.php?id=1"},
+            "h2": {"site_name": "站点B", "title": "Show.S01", "page_url": None, "seed_time": 10},
+        })
+
+    def test_site_title_and_page_url(self):
+        self.assertTrue(self.index.contains_site_title("站点A", "Movie.2024"))
+        self.assertFalse(self.index.contains_site_title("站点B", "Movie.2024"))
+        self.assertTrue(self.index.contains_site_page_url("站点A", "https://a/details.php?id=1"))
+        self.assertFalse(self.index.contains_site_page_url("站点B", "https://a/details.php?id=1"))
+
+    def test_unseeded_title_only_counts_other_sites(self):
+        self.assertTrue(self.index.contains_unseeded_title_on_other_site("站点C", "Movie.2024"))
+        self.assertFalse(self.index.contains_unseeded_title_on_other_site("站点A", "Movie.2024"))
+        # 已做种的任务不参与跨站判断
+        self.assertFalse(self.index.contains_unseeded_title_on_other_site("站点C", "Show.S01"))
+
+    def test_add_remove_and_overwrite(self):
+        self.index.add("h3", {"site_name": "站点C", "title": "Movie.2024"})
+        self.assertTrue(self.index.contains_unseeded_title_on_other_site("站点A", "Movie.2024"))
+        self.index.remove("h1")
+        self.assertFalse(self.index.contains_site_title("站点A", "Movie.2024"))
+        self.assertFalse(self.index.contains_unseeded_title_on_other_site("站点C", "Movie.2024"))
+        # 覆盖同一 hash 时，旧索引需要被替换
+        self.index.add("h3", {"site_name": "站点D", "title": "Other"})
+        self.assertFalse(self.index.contains_site_title("站点C", "Movie.2024"))
+        self.assertTrue(self.index.contains_site_title("站点D", "Other"))
+        self.index.remove("missing")
+        self.assertEqual(len(self.index), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""ZYTBrushFlow 阶段耗时统计测试。"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[3]
+TIMING_PATH = ROOT / "plugins.v2" / "zytbrushflow" / "timing.py"
+SPEC = importlib.util.spec_from_file_location("zytbrushflow_test_timing", TIMING_PATH)
+timing = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = timing
+SPEC.loader.exec_module(timing)
+
+
+class PhaseTimerTest(unittest.TestCase):
+    """验证滚动窗口统计、直方图与超时回调。"""
+
+    def test_parse_budgets(self):
+        self.assertEqual(timing.parse_budgets("30, site_browse=120"), {"*": 30.0, "site_browse": 120.0})
+        self.assertEqual(timing.parse_budgets(None), {})
+        for value in ("abc", "site_browse=0"):
+            with self.assertRaises(ValueError):
+                timing.parse_budgets(value)
+
+    def test_summary_uses_rolling_window(self):
+        timer = timing.PhaseTimer(capacity=4)
+        for seconds in (100, 0.2, 0.02, 0.3, 0.4):
+            timer.record("snapshot", seconds)
+        summary = timer.summary()["snapshot"]
+        self.assertEqual(summary["count"], 5)
+        self.assertAlmostEqual(summary["total"], 100.92)
+        self.assertEqual((summary["last"], summary["max"], summary["p50"], summary["p95"]), (0.4, 0.4, 0.2, 0.4))
+        self.assertEqual(summary["histogram"]["<=0.05s"], 1)
+        self.assertEqual(summary["histogram"]["<=0.5s"], 3)
+        self.assertEqual(summary["histogram"][">60s"], 0)
+
+    def test_exceed_callback(self):
+        exceeded = []
+        timer = timing.PhaseTimer(budgets={"*": 1, "site_browse": 10},
+                                  on_exceed=lambda *args: exceeded.append(args))
+        timer.record("site_browse", 5)
+        timer.record("downloader_add", 5)
+        with timer.measure("save_data"):
+            pass
+        self.assertEqual(exceeded, [("downloader_add", 5, 1)])
+        self.assertIn("save_data", timer.summary())
+        version = timer.version
+        self.assertEqual(timer.summary(), timer.summary())
+        self.assertEqual(timer.version, version)
+        timer.clear()
+        self.assertEqual(timer.summary(), {})
+        self.assertGreater(timer.version, version)
+
+
+if __name__ == "__main__":
+    unittest.main()